@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+netbox.py
+
+Action plugin used by every netbox_* module to run the module within the controller process
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import importlib
+import json
+import sys
+import threading
+import traceback
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six import StringIO
+from ansible.plugins.action import ActionBase
+from ansible.utils.display import Display
+
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils import (
+    netbox_utils,
+)
+
+display = Display()
+
+MODULES_PACKAGE = "ansible_collections.netbox_community.ansible_modules.plugins.modules"
+
+# Guards the module arguments and stdout, which are global to the controller process
+IN_PROCESS_LOCK = threading.Lock()
+
+
+def _requires_pynetbox(module):
+    """
+    :returns requires (bool): Whether the module builds its client with pynetbox
+    :params module (module): Imported netbox_* module
+    """
+    return any(
+        isinstance(value, type)
+        and issubclass(value, netbox_utils.NetboxModule)
+        and value.api_class is None
+        for value in vars(module).values()
+    )
+
+
+class ActionModule(ActionBase):
+    """
+    The netbox_* modules only talk to the Netbox API, so instead of packaging each task with
+    AnsiballZ and starting a new interpreter for it, the module is imported and its main() run
+    within the controller process. The pynetbox client, Netbox version, resolved IDs and choices
+    are reused by every item of a loop, see NetboxModule.enable_shared_state.
+
+    The module is executed the regular way when it does not run against the local connection,
+    the task sets an environment, runs asynchronously or the module uses pynetbox and it is not
+    installed on the controller.
+    """
+
+    TRANSFERS_FILES = False
+
+    def _in_process_module(self, module_name):
+        """
+        :returns module (module): The imported module, None when it must be executed the regular way
+        :params module_name (str): Short or fully qualified name of the module. ex. netbox_site
+        """
+        if (
+            self._connection.transport != "local"
+            or any(self._task.environment or [])
+            or self._task.async_val
+        ):
+            return None
+        try:
+            module = importlib.import_module(
+                "%s.%s" % (MODULES_PACKAGE, module_name.split(".")[-1])
+            )
+        except ImportError:
+            return None
+        if _requires_pynetbox(module) and not netbox_utils.HAS_PYNETBOX:
+            return None
+        return module
+
+    def run(self, tmp=None, task_vars=None):
+        if task_vars is None:
+            task_vars = dict()
+
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        module_name = self._task.action
+        module = self._in_process_module(module_name)
+        if module is None:
+            display.vvvv("%s: executing module remotely" % (module_name))
+            result.update(
+                self._execute_module(
+                    module_name=module_name,
+                    module_args=self._task.args,
+                    task_vars=task_vars,
+                )
+            )
+            return result
+
+        display.vvvv("%s: executing module in-process" % (module_name))
+        module_args = copy.deepcopy(self._task.args)
+        self._update_module_args(module_name, module_args, task_vars)
+        result.update(self._execute_in_process(module, module_name, module_args))
+        return result
+
+    def _execute_in_process(self, module, module_name, module_args):
+        """Runs the main() of the module with module_args as if it was started by AnsiballZ
+        :returns result (dict): Parsed JSON output of the module
+        :params module (module): Imported module
+        :params module_name (str): Short or fully qualified name of the module. ex. netbox_site
+        :params module_args (dict): Arguments of the module, including the internal _ansible_* ones
+        """
+        netbox_utils.NetboxModule.enable_shared_state()
+        stdout = StringIO()
+        with IN_PROCESS_LOCK:
+            # Modules add their own options to NETBOX_ARG_SPEC, so each run gets its own copy
+            module.NETBOX_ARG_SPEC = copy.deepcopy(netbox_utils.NETBOX_ARG_SPEC)
+            real_stdout = sys.stdout
+            basic._ANSIBLE_ARGS = to_bytes(
+                json.dumps({"ANSIBLE_MODULE_ARGS": module_args})
+            )
+            try:
+                sys.stdout = stdout
+                module.main()
+            except SystemExit:
+                pass
+            except Exception as e:
+                return {
+                    "failed": True,
+                    "msg": "Module %s failed: %s" % (module_name, to_text(e)),
+                    "exception": traceback.format_exc(),
+                }
+            finally:
+                sys.stdout = real_stdout
+                basic._ANSIBLE_ARGS = None
+
+        try:
+            return json.loads(stdout.getvalue())
+        except ValueError:
+            return {
+                "failed": True,
+                "msg": "Module %s did not return a valid result" % (module_name),
+                "module_stdout": stdout.getvalue(),
+            }
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.netbox_community.ansible_modules.plugins.action.netbox import (
+    ActionModule as NetboxActionModule,
+)
+
+
+class ActionModule(NetboxActionModule):
+    pass
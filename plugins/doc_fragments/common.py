@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Options shared by every netbox module
+    DOCUMENTATION = r"""
+options:
+  cache:
+    description:
+      - If C(yes), IDs resolved from user defined data are cached on disk and shared between tasks.
+      - Cached entries of an endpoint are dropped when the module creates, updates or deletes an object of that endpoint.
+      - With the netbox httpapi connection, the entries are always cached by the connection for the lifetime of the play instead.
+      - The endpoints and filters of Netbox are also read from its OpenAPI schema once per Netbox version and cached, so query params Netbox does not accept fail the module before any request is sent.
+      - Can also be set with the C(NETBOX_CACHE) environment variable.
+    default: 'no'
+    type: bool
+  cache_timeout:
+    description:
+      - Number of seconds a cached entry is considered valid.
+      - Can also be set with the C(NETBOX_CACHE_TIMEOUT) environment variable.
+    default: 3600
+    type: int
+  cache_connection:
+    description:
+      - Directory used to store the cache, defaults to C(~/.ansible/netbox_cache).
+      - Can also be set with the C(NETBOX_CACHE_CONNECTION) environment variable.
+    type: path
+  max_workers:
+    description:
+      - Maximum number of lookups sent to Netbox concurrently when resolving the IDs of user defined data.
+      - Set to C(1) to resolve them one at a time.
+    default: 4
+    type: int
+  netbox_version:
+    description:
+      - Version of Netbox (major.minor, ex. C(2.7)) the module runs against.
+      - When provided the version is not detected from the API, which saves a request per task.
+      - Otherwise the detected version is cached for 5 minutes when I(cache=yes).
+    type: str
+  timeout:
+    description:
+      - Timeout for Netbox requests in seconds
+    default: 60
+    type: int
+  retries:
+    description:
+      - Number of times a request is retried when Netbox is unreachable or responds with HTTP 429, 500, 502, 503 or 504.
+      - The C(Retry-After) header sent by Netbox is honored.
+      - Requests creating objects are only retried when rate limited (HTTP 429).
+    default: 3
+    type: int
+  backoff_factor:
+    description:
+      - Exponential backoff between retries, waits I(backoff_factor) * 2 ** (retry - 1) seconds.
+    default: 0.5
+    type: float
+  pool_size:
+    description:
+      - Number of connections to Netbox kept alive and reused between requests.
+      - Should be at least I(max_workers).
+    default: 10
+    type: int
+  snapshot:
+    description:
+      - Path of a snapshot written by M(netbox_export).
+      - In check mode every lookup is answered from the snapshot instead of Netbox, so no request
+        is sent to Netbox. Ignored outside of check mode.
+      - Can also be set with the C(NETBOX_SNAPSHOT) environment variable.
+    type: path
+  return_mode:
+    description:
+      - Representation of the object returned by the module.
+      - C(id) only returns the ID of the object, C(brief) the fields of its nested representation such as its ID, URL, name and slug, and C(full) every field.
+      - Can also be set with the C(NETBOX_RETURN_MODE) environment variable.
+    choices:
+      - id
+      - brief
+      - full
+    default: full
+    type: str
+  return_fields:
+    description:
+      - Fields of the object returned by the module, the ID is always returned.
+      - Takes precedence over I(return_mode).
+    type: list
+    elements: str
+  assume_absent:
+    description:
+      - If C(yes), objects are created without looking them up first, which saves a request per object when loading objects known to be new.
+      - When Netbox rejects the create because the object already exists, the object is looked up and updated as usual.
+      - Only applies when I(state) is C(present) outside of check mode, to endpoints Netbox never holds duplicate objects of.
+        Devices, device types, circuits, IP addresses, prefixes, VLANs and racks for instance are always looked up first.
+      - Can also be set with the C(NETBOX_ASSUME_ABSENT) environment variable.
+    default: 'no'
+    type: bool
+  fingerprint:
+    description:
+      - If C(yes), a hash of the user defined data is stored on disk along with the ID and C(last_updated) of the object once applied.
+      - When a later run finds the same data and the object has not been modified within Netbox since, the module returns unchanged
+        after a single request instead of resolving the IDs of the data and looking the object up.
+      - Changes to the objects the data refers to, such as renaming its site, are not detected.
+      - Only applies to modules managing a single object. The fingerprints are stored within I(cache_connection).
+      - Can also be set with the C(NETBOX_FINGERPRINT) environment variable.
+    default: 'no'
+    type: bool
+  proxy:
+    description:
+      - If C(yes), requests are sent through a caching proxy running on localhost, started on demand by the first module using it.
+      - The proxy is shared by all the forks and tasks using the same Netbox instance and I(cache_connection), it answers identical
+        reads from its cache for I(proxy_ttl) seconds and sends identical reads received at the same time to Netbox once.
+      - Writes are always sent to Netbox and drop the cached reads of their endpoint.
+      - The proxy stops after 15 minutes without requests. Not used when the module runs with the netbox httpapi connection.
+      - Can also be set with the C(NETBOX_PROXY) environment variable.
+    default: 'no'
+    type: bool
+  proxy_ttl:
+    description:
+      - Seconds the proxy answers a read from its cache, set by the module starting the proxy.
+      - Can also be set with the C(NETBOX_PROXY_TTL) environment variable.
+    default: 60
+    type: int
+"""
+
+    # Queueing the writes of the modules managing objects
+    JOURNAL = r"""
+options:
+  journal:
+    description:
+      - Path of a journal the creates, updates and deletes of the module are queued in instead of being sent to Netbox.
+      - The module then returns right away without sending any request to Netbox, M(netbox_flush) applies the queued writes in bulk.
+      - Writes that depend on the state of Netbox when the task runs, such as addresses or prefixes assigned with I(first_available), are always sent right away.
+      - Ignored in check mode.
+      - Can also be set with the C(NETBOX_JOURNAL) environment variable.
+    type: path
+"""
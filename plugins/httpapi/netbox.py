@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+author: Netbox Ansible Collection contributors (@netbox-community)
+httpapi: netbox
+short_description: HttpApi Plugin for Netbox
+description:
+  - Keeps an authenticated keep-alive session to Netbox open for the lifetime of the play
+    within the persistent connection, along with the Netbox version, choices and resolved IDs
+    detected by the netbox modules.
+  - The netbox modules send their requests through the connection when run with
+    C(ansible_connection=httpapi) and C(ansible_network_os=netbox_community.ansible_modules.netbox).
+    The host of the connection is used instead of the host of I(netbox_url).
+version_added: "2.9"
+options:
+  token:
+    type: str
+    description:
+      - The token created within Netbox to authorize API access.
+      - Defaults to the password of the connection, C(ansible_httpapi_password).
+    env:
+      - name: NETBOX_TOKEN
+    vars:
+      - name: ansible_httpapi_netbox_token
+"""
+
+import time
+
+from ansible.module_utils._text import to_text
+from ansible.plugins.httpapi import HttpApiBase
+
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_transport import (
+    build_http_session,
+)
+
+# Response headers that no longer apply once the body has been decoded
+DROPPED_HEADERS = frozenset(["content-encoding", "content-length", "transfer-encoding"])
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._session = None
+        self._base_url = None
+        self._cache = dict()
+
+    def _get_session(self):
+        """The session is built on the first request and reused by every module of the play"""
+        if self._session is None:
+            protocol = "https" if self.connection.get_option("use_ssl") else "http"
+            host = self.connection.get_option("host")
+            port = self.connection.get_option("port") or (
+                443 if protocol == "https" else 80
+            )
+            self._base_url = "%s://%s:%s" % (protocol, host, port)
+
+            session = build_http_session(timeout=self.connection.get_option("timeout"))
+            session.verify = self.connection.get_option("validate_certs")
+            session.trust_env = self.connection.get_option("use_proxy")
+            token = self.get_option("token") or self.connection.get_option("password")
+            if token:
+                session.headers["Authorization"] = "Token %s" % (token)
+            self._session = session
+        return self._session
+
+    def logout(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def update_auth(self, response, response_text):
+        # Netbox tokens do not expire, nothing to refresh from the responses
+        return None
+
+    def handle_httperror(self, exc):
+        # Errors are returned to the modules, which report them the way pynetbox does
+        return exc
+
+    def send_request(self, data, **message_kwargs):
+        """
+        :returns response (dict): Status code, reason, headers and text of the response
+        :params data (str): Body of the request
+        :params message_kwargs: path (with the query string), method and headers of the request
+        """
+        session = self._get_session()
+        headers = dict(message_kwargs.get("headers") or {})
+        headers.pop("Authorization", None)
+        response = session.request(
+            message_kwargs.get("method") or "GET",
+            self._base_url + message_kwargs.get("path", "/"),
+            data=data,
+            headers=headers,
+        )
+        return {
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(
+                (k, v)
+                for k, v in response.headers.items()
+                if k.lower() not in DROPPED_HEADERS
+            ),
+            "text": to_text(response.content),
+        }
+
+    def cache_get(self, namespace, key):
+        """
+        :returns value: Cached value or None if missing or expired
+        :params namespace (str): Namespace the key lives under. ex. sites
+        :params key (str): Key serialized by NetboxConnectionCache
+        """
+        entry = self._cache.get(namespace, {}).get(key)
+        if entry and entry[1] > time.time():
+            return entry[0]
+        return None
+
+    def cache_set(self, namespace, key, value, timeout):
+        self._cache.setdefault(namespace, dict())[key] = (value, time.time() + timeout)
+
+    def cache_invalidate(self, namespace):
+        self._cache.pop(namespace, None)
@@ -75,6 +75,20 @@ DOCUMENTATION = """
             description: Timeout for Netbox requests in seconds
             type: int
             default: 60
+        proxy:
+            description:
+                - If True, requests are sent through the caching proxy shared with the modules and the lookup,
+                  started on demand. See the proxy option of the modules.
+            type: boolean
+            default: False
+            env:
+                - name: NETBOX_PROXY
+        proxy_ttl:
+            description: Seconds the proxy answers a request from its cache, set by the first user starting the proxy.
+            type: int
+            default: 60
+            env:
+                - name: NETBOX_PROXY_TTL
         compose:
             description: List of custom ansible host vars to create from the device object fetched from NetBox
             default: {}
@@ -135,6 +149,11 @@ from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.compat.ipaddress import ip_interface
 
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy import (
+    NetboxProxyError,
+    start_proxy,
+)
+
 ALLOWED_DEVICE_QUERY_PARAMETERS = (
     "asset_tag",
     "cluster_id",
@@ -225,6 +244,9 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         if need_to_fetch:
             self.display.v("Fetching: " + url)
+            # The cache key keeps the URL of Netbox, the port of the proxy changes between runs
+            if self.proxy_url and url.startswith(self.api_endpoint):
+                url = self.proxy_url + url[len(self.api_endpoint) :]
             response = open_url(
                 url,
                 headers=self.headers,
@@ -664,6 +686,17 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         self.api_endpoint = self.get_option("api_endpoint").strip("/")
         self.timeout = self.get_option("timeout")
         self.validate_certs = self.get_option("validate_certs")
+        self.proxy_url = None
+        if self.get_option("proxy"):
+            try:
+                self.proxy_url = start_proxy(
+                    self.api_endpoint,
+                    validate_certs=self.validate_certs,
+                    ttl=self.get_option("proxy_ttl"),
+                    timeout=self.timeout,
+                )
+            except (NetboxProxyError, IOError, OSError) as e:
+                raise AnsibleError("Failed to start the Netbox proxy: %s" % e)
         self.config_context = self.get_option("config_context")
         self.interfaces = self.get_option("interfaces")
         self.headers = {
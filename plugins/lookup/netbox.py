@@ -20,6 +20,11 @@ from ansible.utils.display import Display
 
 import pynetbox
 
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy import (
+    NetboxProxyError,
+    start_proxy,
+)
+
 __metaclass__ = type
 
 DOCUMENTATION = """
@@ -52,6 +57,17 @@ DOCUMENTATION = """
             description:
                 - The location of the private key tied to user account.
             required: False
+        proxy:
+            description:
+                - If True, the queries are sent through the caching proxy shared with the modules and
+                  the inventory, started on demand. See the proxy option of the modules.
+            type: boolean
+            default: False
+        proxy_ttl:
+            description:
+                - Seconds the proxy answers a query from its cache, set by the first user starting the proxy.
+            type: int
+            default: 60
     requirements:
         - pynetbox
 """
@@ -187,13 +203,22 @@ class LookupModule(LookupBase):
         netbox_api_endpoint = kwargs.get("api_endpoint")
         netbox_private_key_file = kwargs.get("key_file")
         netbox_api_filter = kwargs.get("api_filter")
+        netbox_proxy = kwargs.get("proxy", False)
+        netbox_proxy_ttl = kwargs.get("proxy_ttl", 60)
 
         if not isinstance(terms, list):
             terms = [terms]
 
+        netbox_url = netbox_api_endpoint
+        if netbox_proxy:
+            try:
+                netbox_url = start_proxy(netbox_api_endpoint, ttl=int(netbox_proxy_ttl))
+            except (NetboxProxyError, IOError, OSError) as e:
+                raise AnsibleError("Failed to start the Netbox proxy: %s" % e)
+
         try:
             netbox = pynetbox.api(
-                netbox_api_endpoint,
+                netbox_url,
                 token=netbox_api_token,
                 private_key_file=netbox_private_key_file,
             )
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+from functools import partial
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+        NetboxDeferredError,
+        CONVERT_TO_ID,
+        ENDPOINT_NAME_MAPPING,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk import (
+        NetboxBulkModule,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_utils import (
+        NetboxModule,
+        NetboxDeferredError,
+        CONVERT_TO_ID,
+        ENDPOINT_NAME_MAPPING,
+    )
+    from netbox_bulk import NetboxBulkModule
+
+# Fields deferred first when the endpoints of the document depend on each other, as they
+# usually point to objects created after the object itself. ex. the primary IP of a device
+DEFERRED_FIELDS_FIRST = ("primary_ip", "primary_ip4", "primary_ip6", "nat_inside")
+
+
+class NetboxApplyModule(NetboxModule):
+    """
+    Applies a document holding the objects of several endpoints. The endpoints are ordered
+    in layers from the relations of CONVERT_TO_ID, every layer only referring to the layers
+    before it. The endpoints of a layer are applied concurrently by NetboxBulkModule.
+    Relations that can not be ordered, such as the primary IP of a device or the parent of
+    a region, are left out of the objects and set by a last pass once every object exists.
+    """
+
+    def __init__(self, module, nb_client=None):
+        super().__init__(module, None, nb_client)
+
+    def _get_dependencies(self, objects):
+        """
+        :returns dependencies (dict): For every endpoint of the document, the fields of its
+        objects per endpoint of the document they refer to. ex. {"devices": {"sites": {"site"}}}
+        :params objects (dict): Objects of the document per endpoint
+        """
+        dependencies = dict()
+        for endpoint, items in objects.items():
+            dependencies[endpoint] = dict()
+            for item in items:
+                for field, value in item.items():
+                    target = CONVERT_TO_ID.get(field)
+                    if value is not None and target in objects:
+                        dependencies[endpoint].setdefault(target, set()).add(field)
+        return dependencies
+
+    def _plan_layers(self, dependencies):
+        """Orders the endpoints by layer. When the remaining endpoints all depend on each
+        other, the fields of one of them are deferred to break the cycle
+        :returns tuple(layers, deferred): The endpoints of every layer and the deferred
+        fields per endpoint
+        :params dependencies (dict): See _get_dependencies
+        """
+        deferred = dict()
+        remaining = dict()
+        for endpoint, targets in dependencies.items():
+            remaining[endpoint] = dict(targets)
+            # An object referring to objects of its own endpoint is created without them
+            if endpoint in remaining[endpoint]:
+                deferred[endpoint] = remaining[endpoint].pop(endpoint)
+
+        layers = list()
+        while remaining:
+            layer = sorted(
+                endpoint
+                for endpoint, targets in remaining.items()
+                if not set(targets).intersection(remaining)
+            )
+            if not layer:
+                endpoint = self._pick_deferred_endpoint(remaining)
+                for target in list(remaining[endpoint]):
+                    if target in remaining:
+                        deferred.setdefault(endpoint, set()).update(
+                            remaining[endpoint].pop(target)
+                        )
+                continue
+            layers.append(layer)
+            for endpoint in layer:
+                del remaining[endpoint]
+
+        return layers, deferred
+
+    def _pick_deferred_endpoint(self, remaining):
+        """
+        :returns endpoint (str): The endpoint whose fields are deferred to break a cycle,
+        preferring fields of DEFERRED_FIELDS_FIRST, then the endpoint with the fewest fields
+        :params remaining (dict): Dependencies of the endpoints not planned yet
+        """
+
+        def cycle_fields(endpoint):
+            return set().union(
+                *[
+                    fields
+                    for target, fields in remaining[endpoint].items()
+                    if target in remaining
+                ]
+            )
+
+        candidates = sorted(remaining)
+        for endpoint in candidates:
+            fields = cycle_fields(endpoint)
+            if fields and fields.issubset(DEFERRED_FIELDS_FIRST):
+                return endpoint
+        return min(candidates, key=lambda endpoint: len(cycle_fields(endpoint)))
+
+    def _apply_endpoint(self, endpoint, state, items):
+        """
+        :returns tuple(results, counts): See NetboxBulkModule._apply_items, or the error in
+        check mode, where objects referring to objects the plan creates can not be resolved
+        """
+        bulk = NetboxBulkModule.from_module(self, endpoint, state)
+        bulk._thread_state.defer_errors = True
+        try:
+            return bulk._apply_items(items)
+        except NetboxDeferredError as e:
+            if self.check_mode:
+                return e.msg
+            raise
+
+    def _apply_layer(self, layer, state, objects):
+        """Applies the endpoints of a layer concurrently
+        :returns outcomes (list): Outcome of every endpoint, see _apply_endpoint
+        """
+        tasks = [
+            partial(self._apply_endpoint, endpoint, state, objects[endpoint])
+            for endpoint in layer
+        ]
+        try:
+            return self._run_concurrently(tasks)
+        except NetboxDeferredError as e:
+            # Layers of a single endpoint are applied within this thread
+            self._handle_errors(msg=e.msg)
+
+    def _without_fields(self, items, fields):
+        return [
+            dict((k, v) for k, v in item.items() if k not in fields) for item in items
+        ]
+
+    def run(self):
+        """
+        Applies the objects of the document layer by layer, in reverse order when state is
+        absent, then sets the deferred fields. Returns the plan along with the outcome of
+        every object per endpoint
+        """
+        self.result = {"changed": False}
+
+        objects = self.module.params["objects"]
+        unknown = sorted(set(objects).difference(ENDPOINT_NAME_MAPPING))
+        if unknown:
+            self._handle_errors(msg="%s is not a valid endpoint" % (", ".join(unknown)))
+
+        layers, deferred = self._plan_layers(self._get_dependencies(objects))
+        if self.state == "absent":
+            passes = [(layer, objects) for layer in reversed(layers)]
+        else:
+            passes = [
+                (
+                    layer,
+                    dict(
+                        (
+                            endpoint,
+                            self._without_fields(
+                                objects[endpoint], deferred.get(endpoint, ())
+                            ),
+                        )
+                        for endpoint in layer
+                    ),
+                )
+                for layer in layers
+            ]
+            if deferred:
+                passes.append((sorted(deferred), objects))
+
+        results = dict()
+        counts = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        unresolved = dict()
+        for layer, layer_objects in passes:
+            outcomes = self._apply_layer(layer, self.state, layer_objects)
+            for endpoint, outcome in zip(layer, outcomes):
+                if not isinstance(outcome, tuple):
+                    unresolved[endpoint] = outcome
+                elif endpoint in results:
+                    self._merge_deferred_results(
+                        endpoint, results[endpoint], outcome[0], counts
+                    )
+                else:
+                    results[endpoint] = outcome[0]
+                    for key, count in outcome[1].items():
+                        counts[key] += count
+
+        self.result["changed"] = bool(
+            counts["created"] or counts["updated"] or counts["deleted"]
+        )
+        self.result["msg"] = (
+            "%(created)s created, %(updated)s updated, %(deleted)s deleted, "
+            "%(unchanged)s unchanged" % counts
+        )
+        self.result["plan"] = {
+            "layers": layers,
+            "deferred": dict((k, sorted(v)) for k, v in deferred.items()),
+        }
+        self.result["results"] = results
+        if unresolved:
+            self.result["unresolved"] = unresolved
+
+        self._exit_json()
+
+    def _merge_deferred_results(self, endpoint, results, deferred_results, counts):
+        """The deferred pass only updates objects already applied by their layer, an object
+        it changes counts as updated unless its layer created or updated it
+        """
+        endpoint_name = ENDPOINT_NAME_MAPPING[endpoint]
+        for index, deferred_result in enumerate(deferred_results):
+            if not deferred_result["changed"]:
+                continue
+            if results[index]["changed"]:
+                results[index][endpoint_name] = deferred_result[endpoint_name]
+            else:
+                results[index] = deferred_result
+                counts["unchanged"] -= 1
+                counts["updated"] += 1
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+        ALLOWED_QUERY_PARAMS,
+        ENDPOINT_NAME_MAPPING,
+        QUERY_PARAMS_IDS,
+        request_errors,
+        SLUG_REQUIRED,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientError,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_utils import (
+        NetboxModule,
+        ALLOWED_QUERY_PARAMS,
+        ENDPOINT_NAME_MAPPING,
+        QUERY_PARAMS_IDS,
+        request_errors,
+        SLUG_REQUIRED,
+    )
+    from netbox_client import NetboxClientError
+
+# Keys used to name an object within results and messages, in order of preference
+NAME_KEYS = ("name", "model", "slug", "address", "prefix", "cid")
+
+# Query params only narrowing down the objects found, such as the VRF of an address
+SCOPE_KEYS = QUERY_PARAMS_IDS | set(["vlan_group"])
+
+
+class NetboxBulkModule(NetboxModule):
+    """
+    Runs the NetboxModule normalization and ID resolution over a list of objects of a single
+    endpoint, then creates, updates or deletes them with as few requests as possible
+    """
+
+    def __init__(self, module, endpoint, nb_client=None):
+        super().__init__(module, endpoint, nb_client)
+
+    @classmethod
+    def from_module(cls, netbox_module, endpoint, state):
+        """Used by the modules applying several endpoints within a single module run
+        :returns bulk (NetboxBulkModule): Bulk module sharing the connection, version and
+        resolved IDs and choices of netbox_module
+        :params netbox_module (NetboxModule): The module run
+        :params endpoint (str): The endpoint the bulk module applies objects to. ex. sites
+        :params state (str): present or absent
+        """
+        bulk = cls(netbox_module.module, endpoint, nb_client=netbox_module.nb)
+        bulk.state = state
+        bulk.version = netbox_module.version
+        bulk.registry = netbox_module.registry
+        bulk.cache = netbox_module.cache
+        bulk._object_ids = netbox_module._object_ids
+        bulk._choices = netbox_module._choices
+        bulk._choices_lock = netbox_module._choices_lock
+        return bulk
+
+    def _get_item_name(self, data):
+        for key in NAME_KEYS:
+            if data.get(key):
+                return data[key]
+        return None
+
+    def _missing_identity_keys(self, endpoint_name, data):
+        """
+        :returns missing (list): Fields of ALLOWED_QUERY_PARAMS the object is found with that
+        are not within data
+        :params endpoint_name (str): Endpoint name, key of ALLOWED_QUERY_PARAMS. ex. site
+        :params data (dict): User defined data of the object
+        """
+        missing = list()
+        for key in sorted(ALLOWED_QUERY_PARAMS.get(endpoint_name, set()) - SCOPE_KEYS):
+            if key == "slug" and self.endpoint == "sites":
+                # The slug of sites is always built from their name
+                key = "name"
+            elif key == "slug" and self.endpoint in SLUG_REQUIRED:
+                if self._get_item_name(data):
+                    continue
+            if data.get(key) in (None, ""):
+                missing.append(key)
+        return missing
+
+    def _chunks(self, items):
+        chunk_size = self.module.params["chunk_size"]
+        for index in range(0, len(items), chunk_size):
+            yield items[index : index + chunk_size]
+
+    def _bulk_request(self, verb, nb_endpoint, data):
+        """Sends a list of objects to the list view of the endpoint
+        :returns response (list): Response of Netbox or None if Netbox does not support bulk
+        operations for the verb (Netbox < 2.10)
+        :params verb (str): patch or delete
+        :params nb_endpoint (pynetbox endpoint object): The endpoint the objects belong to
+        :params data (list): List of dicts with the ID of the object and any fields to update
+        """
+        response = getattr(self.nb.http_session, verb)(
+            "%s/" % (nb_endpoint.url),
+            json=data,
+            headers=self._build_headers(),
+            verify=getattr(self.nb, "ssl_verify", True),
+        )
+        if response.status_code == 405:
+            return None
+        if not response.ok:
+            raise NetboxClientError(response)
+        return response.json() if verb == "patch" else []
+
+    def _create_items(self, nb_endpoint, items):
+        for chunk in self._chunks(items):
+            if self.check_mode:
+                nb_objects = [item["data"] for item in chunk]
+            else:
+                try:
+                    nb_objects = nb_endpoint.create([item["data"] for item in chunk])
+                except request_errors() as e:
+                    self._handle_errors(msg=e.error)
+            for item, nb_object in zip(chunk, nb_objects):
+                item["object"] = nb_object
+
+        if items and not self.check_mode:
+            self._invalidate_cache()
+
+    def _update_items(self, nb_endpoint, items):
+        for chunk in self._chunks(items):
+            if self.check_mode:
+                for item in chunk:
+                    item["object"] = item["updated_object"]
+                continue
+            try:
+                updated = self._bulk_request(
+                    "patch",
+                    nb_endpoint,
+                    [
+                        dict(item["diff"]["after"], id=item["object"].id)
+                        for item in chunk
+                    ],
+                )
+                if updated is None:
+                    updated = [
+                        self._patch_netbox_object(
+                            item["object"],
+                            item["updated_object"],
+                            item["diff"]["after"],
+                        )
+                        for item in chunk
+                    ]
+                else:
+                    # Serialized the same way as the objects updated one at a time
+                    responses = dict((response["id"], response) for response in updated)
+                    updated = [
+                        self._merge_patch_response(
+                            responses[item["object"].id],
+                            item["updated_object"],
+                            item["diff"]["after"],
+                        )
+                        for item in chunk
+                    ]
+            except request_errors() as e:
+                self._handle_errors(msg=e.error)
+            for item, nb_object in zip(chunk, updated):
+                item["object"] = nb_object
+
+        if items and not self.check_mode:
+            self._invalidate_cache()
+
+    def _delete_items(self, nb_endpoint, items):
+        for chunk in self._chunks(items):
+            if self.check_mode:
+                continue
+            try:
+                deleted = self._bulk_request(
+                    "delete", nb_endpoint, [{"id": item["object"].id} for item in chunk]
+                )
+                if deleted is None:
+                    for item in chunk:
+                        item["object"].delete()
+            except request_errors() as e:
+                self._handle_errors(msg=e.error)
+
+        if items and not self.check_mode:
+            self._invalidate_cache()
+
+    def _create_items_assuming_absent(self, nb_endpoint, endpoint_name, items):
+        """Creates the items without looking them up first. Netbox creates a chunk atomically,
+        so every item of a chunk rejected because one of its objects already exists is
+        looked up and handled the regular way
+        :returns tuple(created, pending): Items created and items left to look up
+        :params nb_endpoint (pynetbox endpoint object): The endpoint the objects belong to
+        :params endpoint_name (str): Endpoint name used within messages. ex. site
+        :params items (list): Items built by run()
+        """
+        created, pending = list(), list()
+        for chunk in self._chunks(items):
+            try:
+                nb_objects = nb_endpoint.create([item["data"] for item in chunk])
+            except request_errors() as e:
+                if not self._is_unique_error(e):
+                    self._handle_errors(msg=e.error)
+                pending.extend(chunk)
+                continue
+            for item, nb_object in zip(chunk, nb_objects):
+                item["object"] = nb_object
+                item["msg"] = "%s %s created" % (endpoint_name, item["name"])
+                item["diff"] = self._build_diff(
+                    before={"state": "absent"}, after={"state": "present"}
+                )
+                created.append(item)
+
+        if created:
+            self._invalidate_cache()
+        return created, pending
+
+    def _apply_items(self, items_data, repeats=False):
+        """
+        Creates, updates or deletes every object of items_data on the endpoint passed in.
+        Existing objects are found with batched filter requests, creates are sent as chunked list
+        POST requests and updates and deletes as chunked list PATCH and DELETE requests when
+        supported by Netbox.
+        :returns tuple(results, counts): Result of every item and the number of objects
+        created, updated, deleted and unchanged
+        :params items_data (list): User defined data of the objects
+        :params repeats (bool): Whether an object may be listed more than once. Each repeat
+        then starts a new batch, applied once the items listed before it are. Otherwise listing
+        an object twice fails
+        """
+        # Used to dynamically set key when returning results
+        endpoint_name = ENDPOINT_NAME_MAPPING[self.endpoint]
+        counts = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+        if self.module.params["chunk_size"] < 1:
+            self._handle_errors(msg="chunk_size must be at least 1")
+            return list(), counts
+
+        for index, item_data in enumerate(items_data):
+            missing = self._missing_identity_keys(endpoint_name, item_data)
+            if missing:
+                self._handle_errors(
+                    msg="Item %s of %s is missing %s"
+                    % (index, self.endpoint, ", ".join(missing))
+                )
+                return list(), counts
+
+        application = self._find_app(self.endpoint)
+        nb_app = getattr(self.nb, application)
+        nb_endpoint = getattr(nb_app, self.endpoint)
+
+        items = list()
+        for item_data in items_data:
+            data = self._prepare_data(dict(item_data))
+            name = self._get_item_name(data)
+            if self.endpoint in SLUG_REQUIRED and not data.get("slug"):
+                data["slug"] = self._to_slug(name)
+            query_params = self._build_query_params(endpoint_name, data)
+            items.append({"name": name, "data": data, "query_params": query_params})
+
+        # Duplicates within a batch would each be found missing and created twice
+        batches = [list()]
+        identities = set()
+        for item in items:
+            identity = self._normalize_query_params(item["query_params"])
+            if identity in identities:
+                if not repeats:
+                    self._handle_errors(
+                        msg="%s %s is listed more than once"
+                        % (endpoint_name, item["name"])
+                    )
+                    return list(), counts
+                batches.append(list())
+                identities = set()
+            identities.add(identity)
+            batches[-1].append(item)
+
+        for batch in batches:
+            for key, count in self._apply_batch(
+                nb_endpoint, endpoint_name, batch
+            ).items():
+                counts[key] += count
+
+        results = list()
+        for item in items:
+            serialized_object = self._serialize_object(item["object"])
+            result = {
+                "changed": "diff" in item,
+                "msg": item["msg"],
+                endpoint_name: serialized_object if self.state == "present" else None,
+            }
+            if "diff" in item:
+                result["diff"] = item["diff"]
+            results.append(result)
+
+        counts["unchanged"] = (
+            len(items) - counts["created"] - counts["updated"] - counts["deleted"]
+        )
+        return results, counts
+
+    def _apply_batch(self, nb_endpoint, endpoint_name, items):
+        """Applies items listing every object at most once
+        :returns counts (dict): Number of objects created, updated and deleted
+        :params nb_endpoint (pynetbox endpoint object): The endpoint the objects belong to
+        :params endpoint_name (str): Endpoint name used within messages. ex. site
+        :params items (list): Items built by _apply_items
+        """
+        if self._assume_absent():
+            created, pending = self._create_items_assuming_absent(
+                nb_endpoint, endpoint_name, items
+            )
+        else:
+            created, pending = list(), items
+
+        nb_objects = self._get_objects(
+            nb_endpoint, [item["query_params"] for item in pending], endpoint_name
+        )
+
+        creates, updates, deletes = list(), list(), list()
+        for item, nb_object in zip(pending, nb_objects):
+            item["object"] = nb_object
+            if self.state == "absent":
+                if nb_object:
+                    item["msg"] = "%s %s deleted" % (endpoint_name, item["name"])
+                    item["diff"] = self._build_diff(
+                        before={"state": "present"}, after={"state": "absent"}
+                    )
+                    deletes.append(item)
+                else:
+                    item["msg"] = "%s %s already absent" % (endpoint_name, item["name"])
+            elif not nb_object:
+                item["msg"] = "%s %s created" % (endpoint_name, item["name"])
+                item["diff"] = self._build_diff(
+                    before={"state": "absent"}, after={"state": "present"}
+                )
+                creates.append(item)
+            else:
+                updated_obj, data_before, data_after = self._find_changed_fields(
+                    nb_object.serialize(), item["data"]
+                )
+                if data_after:
+                    item["msg"] = "%s %s updated" % (endpoint_name, item["name"])
+                    item["diff"] = self._build_diff(
+                        before=data_before, after=data_after
+                    )
+                    item["updated_object"] = updated_obj
+                    updates.append(item)
+                else:
+                    item["msg"] = "%s %s already exists" % (endpoint_name, item["name"])
+
+        self._create_items(nb_endpoint, creates)
+        creates = created + creates
+        self._update_items(nb_endpoint, updates)
+        self._delete_items(nb_endpoint, deletes)
+
+        return {
+            "created": len(creates),
+            "updated": len(updates),
+            "deleted": len(deletes),
+        }
+
+    def run(self):
+        """
+        Applies every object within items, see _apply_items
+        """
+        self.result = {"changed": False}
+
+        results, counts = self._apply_items(self.module.params["items"])
+
+        self.result["changed"] = bool(
+            counts["created"] or counts["updated"] or counts["deleted"]
+        )
+        self.result["msg"] = (
+            "%(created)s created, %(updated)s updated, %(deleted)s deleted, "
+            "%(unchanged)s unchanged" % counts
+        )
+        self.result["results"] = results
+
+        self._exit_json()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+# Used when the module does not specify a location for the cache
+DEFAULT_CACHE_CONNECTION = "~/.ansible/netbox_cache"
+
+# Oldest entries are evicted once a namespace holds more than this many keys
+CACHE_MAX_ENTRIES = 5000
+
+
+class NetboxCache(object):
+    """
+    Small on-disk key/value store shared by every module run against the same Netbox instance.
+    Each namespace (usually an endpoint such as sites) is stored in its own JSON file and every
+    write is done under an exclusive lock and atomically replaced so concurrent forks are safe.
+    :params connection (str): Directory used to store the cache files
+    :params netbox_url (str): URL of the Netbox instance, used to separate caches per instance
+    :params timeout (int): Seconds an entry is considered valid
+    """
+
+    def __init__(self, connection, netbox_url, timeout=3600):
+        self.timeout = timeout
+        url_hash = hashlib.sha1(netbox_url.rstrip("/").encode("utf-8")).hexdigest()
+        self.path = os.path.join(
+            os.path.expanduser(connection or DEFAULT_CACHE_CONNECTION), url_hash
+        )
+        try:
+            os.makedirs(self.path, mode=0o700)
+        except OSError:
+            if not os.path.isdir(self.path):
+                raise
+
+    def _namespace_file(self, namespace):
+        return os.path.join(self.path, "%s.json" % (namespace))
+
+    @contextmanager
+    def _lock(self, namespace):
+        """Holds an exclusive lock on the namespace while it is being modified"""
+        with open(os.path.join(self.path, "%s.lock" % (namespace)), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self, namespace):
+        try:
+            with open(self._namespace_file(namespace), "r") as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def _dump(self, namespace, entries):
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".%s." % (namespace))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.rename(tmp_path, self._namespace_file(namespace))
+        except (IOError, OSError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _make_key(self, key):
+        return json.dumps(key, sort_keys=True, default=str)
+
+    def get(self, namespace, key):
+        """
+        :returns value: Cached value or None if missing or expired
+        :params namespace (str): Namespace the key lives under. ex. sites
+        :params key (obj): JSON serializable key. ex. the query params
+        """
+        entry = self._load(namespace).get(self._make_key(key))
+        if entry and entry["expires"] > time.time():
+            return entry["value"]
+        return None
+
+    def set(self, namespace, key, value, timeout=None):
+        """
+        Stores value under key and prunes expired or excess entries from the namespace
+        :params timeout (int): Overrides the default timeout for this entry
+        """
+        now = time.time()
+        if timeout is None:
+            timeout = self.timeout
+        with self._lock(namespace):
+            entries = self._load(namespace)
+            entries[self._make_key(key)] = {"value": value, "expires": now + timeout}
+            entries = dict(
+                (k, v) for k, v in entries.items() if v.get("expires", 0) > now
+            )
+            if len(entries) > CACHE_MAX_ENTRIES:
+                newest = sorted(
+                    entries.items(), key=lambda item: item[1]["expires"], reverse=True
+                )
+                entries = dict(newest[:CACHE_MAX_ENTRIES])
+            self._dump(namespace, entries)
+
+    def invalidate(self, namespace):
+        """Removes every entry within the namespace"""
+        with self._lock(namespace):
+            try:
+                os.remove(self._namespace_file(namespace))
+            except OSError:
+                pass
+
+
+class NetboxConnectionCache(object):
+    """
+    Same interface as NetboxCache for the modules run with the netbox httpapi connection, the
+    entries are held in memory by the persistent connection for the lifetime of the play
+    :params connection (Connection): Connection to the socket of the persistent connection
+    :params timeout (int): Seconds an entry is considered valid
+    """
+
+    def __init__(self, connection, timeout=3600):
+        self.connection = connection
+        self.timeout = timeout
+
+    def _make_key(self, key):
+        return json.dumps(key, sort_keys=True, default=str)
+
+    def get(self, namespace, key):
+        """
+        :returns value: Cached value or None if missing or expired
+        :params namespace (str): Namespace the key lives under. ex. sites
+        :params key (obj): JSON serializable key. ex. the query params
+        """
+        return self.connection.cache_get(namespace, self._make_key(key))
+
+    def set(self, namespace, key, value, timeout=None):
+        """
+        Stores value under key
+        :params timeout (int): Overrides the default timeout for this entry
+        """
+        if timeout is None:
+            timeout = self.timeout
+        self.connection.cache_set(namespace, self._make_key(key), value, timeout)
+
+    def invalidate(self, namespace):
+        """Removes every entry within the namespace"""
+        self.connection.cache_invalidate(namespace)
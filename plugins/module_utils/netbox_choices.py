@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Choices of the endpoints within REQUIRED_ID_FIND as (value, display_name) per field, keyed by
+# Netbox version. Versions not listed here query the choices from the endpoint instead
+NETBOX_CHOICES = {
+    "2.7": {
+        "circuits": {
+            "status": [
+                ("planned", "Planned"),
+                ("provisioning", "Provisioning"),
+                ("active", "Active"),
+                ("offline", "Offline"),
+                ("deprovisioning", "Deprovisioning"),
+                ("decommissioned", "Decommissioned"),
+            ]
+        },
+        "device_types": {"subdevice_role": [("parent", "Parent"), ("child", "Child")]},
+        "devices": {
+            "face": [("front", "Front"), ("rear", "Rear")],
+            "status": [
+                ("offline", "Offline"),
+                ("active", "Active"),
+                ("planned", "Planned"),
+                ("staged", "Staged"),
+                ("failed", "Failed"),
+                ("inventory", "Inventory"),
+                ("decommissioning", "Decommissioning"),
+            ],
+        },
+        "interfaces": {
+            "type": [
+                ("virtual", "Virtual"),
+                ("lag", "Link Aggregation Group (LAG)"),
+                ("100base-tx", "100BASE-TX (10/100ME)"),
+                ("1000base-t", "1000BASE-T (1GE)"),
+                ("2.5gbase-t", "2.5GBASE-T (2.5GE)"),
+                ("5gbase-t", "5GBASE-T (5GE)"),
+                ("10gbase-t", "10GBASE-T (10GE)"),
+                ("10gbase-cx4", "10GBASE-CX4 (10GE)"),
+                ("1000base-x-gbic", "GBIC (1GE)"),
+                ("1000base-x-sfp", "SFP (1GE)"),
+                ("10gbase-x-sfpp", "SFP+ (10GE)"),
+                ("10gbase-x-xfp", "XFP (10GE)"),
+                ("10gbase-x-xenpak", "XENPAK (10GE)"),
+                ("10gbase-x-x2", "X2 (10GE)"),
+                ("25gbase-x-sfp28", "SFP28 (25GE)"),
+                ("40gbase-x-qsfpp", "QSFP+ (40GE)"),
+                ("50gbase-x-sfp28", "QSFP28 (50GE)"),
+                ("100gbase-x-cfp", "CFP (100GE)"),
+                ("100gbase-x-cfp2", "CFP2 (100GE)"),
+                ("200gbase-x-cfp2", "CFP2 (200GE)"),
+                ("100gbase-x-cfp4", "CFP4 (100GE)"),
+                ("100gbase-x-cpak", "Cisco CPAK (100GE)"),
+                ("100gbase-x-qsfp28", "QSFP28 (100GE)"),
+                ("200gbase-x-qsfp56", "QSFP56 (200GE)"),
+                ("400gbase-x-qsfpdd", "QSFP-DD (400GE)"),
+                ("400gbase-x-osfp", "OSFP (400GE)"),
+                ("ieee802.11a", "IEEE 802.11a"),
+                ("ieee802.11g", "IEEE 802.11b/g"),
+                ("ieee802.11n", "IEEE 802.11n"),
+                ("ieee802.11ac", "IEEE 802.11ac"),
+                ("ieee802.11ad", "IEEE 802.11ad"),
+                ("ieee802.11ax", "IEEE 802.11ax"),
+                ("gsm", "GSM"),
+                ("cdma", "CDMA"),
+                ("lte", "LTE"),
+                ("sonet-oc3", "OC-3/STM-1"),
+                ("sonet-oc12", "OC-12/STM-4"),
+                ("sonet-oc48", "OC-48/STM-16"),
+                ("sonet-oc192", "OC-192/STM-64"),
+                ("sonet-oc768", "OC-768/STM-256"),
+                ("sonet-oc1920", "OC-1920/STM-640"),
+                ("sonet-oc3840", "OC-3840/STM-1234"),
+                ("1gfc-sfp", "SFP (1GFC)"),
+                ("2gfc-sfp", "SFP (2GFC)"),
+                ("4gfc-sfp", "SFP (4GFC)"),
+                ("8gfc-sfpp", "SFP+ (8GFC)"),
+                ("16gfc-sfpp", "SFP+ (16GFC)"),
+                ("32gfc-sfp28", "SFP28 (32GFC)"),
+                ("128gfc-sfp28", "QSFP28 (128GFC)"),
+                ("inifiband-sdr", "SDR (2 Gbps)"),
+                ("inifiband-ddr", "DDR (4 Gbps)"),
+                ("inifiband-qdr", "QDR (8 Gbps)"),
+                ("inifiband-fdr10", "FDR10 (10 Gbps)"),
+                ("inifiband-fdr", "FDR (13.5 Gbps)"),
+                ("inifiband-edr", "EDR (25 Gbps)"),
+                ("inifiband-hdr", "HDR (50 Gbps)"),
+                ("inifiband-ndr", "NDR (100 Gbps)"),
+                ("inifiband-xdr", "XDR (250 Gbps)"),
+                ("t1", "T1 (1.544 Mbps)"),
+                ("e1", "E1 (2.048 Mbps)"),
+                ("t3", "T3 (45 Mbps)"),
+                ("e3", "E3 (34 Mbps)"),
+                ("cisco-stackwise", "Cisco StackWise"),
+                ("cisco-stackwise-plus", "Cisco StackWise Plus"),
+                ("cisco-flexstack", "Cisco FlexStack"),
+                ("cisco-flexstack-plus", "Cisco FlexStack Plus"),
+                ("juniper-vcp", "Juniper VCP"),
+                ("extreme-summitstack", "Extreme SummitStack"),
+                ("extreme-summitstack-128", "Extreme SummitStack-128"),
+                ("extreme-summitstack-256", "Extreme SummitStack-256"),
+                ("extreme-summitstack-512", "Extreme SummitStack-512"),
+                ("other", "Other"),
+            ],
+            "mode": [
+                ("access", "Access"),
+                ("tagged", "Tagged"),
+                ("tagged-all", "Tagged (All)"),
+            ],
+        },
+        "ip_addresses": {
+            "status": [
+                ("active", "Active"),
+                ("reserved", "Reserved"),
+                ("deprecated", "Deprecated"),
+                ("dhcp", "DHCP"),
+            ],
+            "role": [
+                ("loopback", "Loopback"),
+                ("secondary", "Secondary"),
+                ("anycast", "Anycast"),
+                ("vip", "VIP"),
+                ("vrrp", "VRRP"),
+                ("hsrp", "HSRP"),
+                ("glbp", "GLBP"),
+                ("carp", "CARP"),
+            ],
+        },
+        "prefixes": {
+            "status": [
+                ("container", "Container"),
+                ("active", "Active"),
+                ("reserved", "Reserved"),
+                ("deprecated", "Deprecated"),
+            ]
+        },
+        "racks": {
+            "status": [
+                ("reserved", "Reserved"),
+                ("available", "Available"),
+                ("planned", "Planned"),
+                ("active", "Active"),
+                ("deprecated", "Deprecated"),
+            ],
+            "type": [
+                ("2-post-frame", "2-post frame"),
+                ("4-post-frame", "4-post frame"),
+                ("4-post-cabinet", "4-post cabinet"),
+                ("wall-frame", "Wall-mounted frame"),
+                ("wall-cabinet", "Wall-mounted cabinet"),
+            ],
+            "width": [(19, "19 inches"), (23, "23 inches")],
+            "outer_unit": [("mm", "Millimeters"), ("in", "Inches")],
+        },
+        "services": {"protocol": [("tcp", "TCP"), ("udp", "UDP")]},
+        "sites": {
+            "status": [
+                ("active", "Active"),
+                ("planned", "Planned"),
+                ("retired", "Retired"),
+            ]
+        },
+        "virtual_machines": {
+            "status": [
+                ("active", "Active"),
+                ("offline", "Offline"),
+                ("staged", "Staged"),
+            ]
+        },
+        "vlans": {
+            "status": [
+                ("active", "Active"),
+                ("reserved", "Reserved"),
+                ("deprecated", "Deprecated"),
+            ]
+        },
+    },
+}
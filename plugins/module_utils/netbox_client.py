@@ -0,0 +1,589 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import gzip
+import socket
+import ssl
+import threading
+import time
+from itertools import chain
+from json import dumps as json_dumps, loads as json_loads
+
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlencode, urlsplit
+
+# Same as netbox_transport, kept here so the client never imports requests
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+# Methods retried on RETRY_STATUS_CODES, POST requests are only retried when rate limited
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"])
+
+# Errors raised when Netbox closed a keep-alive connection while it was idle
+STALE_CONNECTION_ERRORS = (
+    http_client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# Fields holding free form JSON, kept as dicts instead of nested objects
+JSON_FIELDS = frozenset(
+    ["custom_fields", "config_context", "local_context_data", "data", "object_data"]
+)
+
+# List fields Netbox does not keep the order of, serialized as sets as pynetbox does
+LIST_AS_SET = ("tags", "tagged_vlans")
+
+
+class NetboxClientError(Exception):
+    """
+    Raised when Netbox rejects a request, with the same attributes as pynetbox.RequestError
+    :params response: The response of Netbox, from NetboxClientSession or requests
+    """
+
+    def __init__(self, response):
+        if response.status_code == 404:
+            message = "The requested url: %s could not be found." % (response.url)
+        else:
+            try:
+                message = "The request failed with code %s %s: %s" % (
+                    response.status_code,
+                    response.reason,
+                    response.json(),
+                )
+            except ValueError:
+                message = "The request failed with code %s %s" % (
+                    response.status_code,
+                    response.reason,
+                )
+        super().__init__(message)
+        self.req = response
+        self.request_body = response.request.body
+        self.base = response.url
+        self.error = response.text
+
+
+class NetboxClientHeaders(dict):
+    """Response headers looked up regardless of their case"""
+
+    def __init__(self, headers):
+        super().__init__((k.lower(), v) for k, v in headers)
+
+    def __getitem__(self, key):
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key):
+        return super().__contains__(key.lower())
+
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+class NetboxClientRequest(object):
+    def __init__(self, method, url, body):
+        self.method = method
+        self.url = url
+        self.body = body
+
+
+class NetboxClientResponse(object):
+    """The parts of a requests response read by the modules"""
+
+    def __init__(self, request, status_code, reason, headers, content):
+        self.request = request
+        self.url = request.url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return to_text(self.content, errors="surrogate_or_replace")
+
+    def json(self):
+        return json_loads(self.text)
+
+
+class NetboxClientSession(object):
+    """
+    Keep-alive HTTP session built on http.client, with the interface of requests.Session used
+    by the modules. Connections are kept in a pool shared by every thread, as the lookups of a
+    module run concurrently within worker threads that do not outlive them. Failed requests are
+    retried the same way as the sessions built by netbox_transport.build_http_session
+    :params timeout (int): Seconds to wait for Netbox to respond to a request
+    :params retries (int): Number of times a failed request is retried
+    :params backoff_factor (float): Sleeps backoff_factor * (2 ** (retry - 1)) seconds between retries
+    :params verify (bool): Whether the certificate of Netbox is verified
+    :params pool_size (int): Number of idle connections kept alive per host
+    """
+
+    def __init__(
+        self, timeout=60, retries=3, backoff_factor=0.5, verify=True, pool_size=10
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.verify = verify
+        self.pool_size = pool_size
+        self.headers = {"Accept-Encoding": "gzip"}
+        self._idle = dict()
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme, netloc, verify):
+        if scheme == "https":
+            context = ssl.create_default_context()
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            return http_client.HTTPSConnection(
+                netloc, timeout=self.timeout, context=context
+            )
+        return http_client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _get_connection(self, key):
+        """
+        :returns connection (HTTPConnection): An idle connection to the host, or a new one
+        :params key (tuple): Scheme, host and certificate verification of the connection
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        return self._new_connection(*key)
+
+    def _release_connection(self, key, connection):
+        """Puts the connection back into the pool once its response was read"""
+        with self._lock:
+            idle = self._idle.setdefault(key, list())
+            if len(idle) < self.pool_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _exchange(self, connection, request, path, headers):
+        connection.request(request.method, path, body=request.body, headers=headers)
+        response = connection.getresponse()
+        content = response.read()
+        if response.getheader("Content-Encoding") == "gzip":
+            content = gzip.decompress(content)
+        return NetboxClientResponse(
+            request,
+            response.status,
+            response.reason,
+            NetboxClientHeaders(response.getheaders()),
+            content,
+        )
+
+    def _send(self, request, headers, verify):
+        url = urlsplit(request.url)
+        path = url.path
+        if url.query:
+            path = "%s?%s" % (path, url.query)
+
+        key = (url.scheme, url.netloc, verify)
+        connection = self._get_connection(key)
+        reused = connection.sock is not None
+        try:
+            try:
+                response = self._exchange(connection, request, path, headers)
+            except STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                connection.close()
+                connection = self._new_connection(*key)
+                response = self._exchange(connection, request, path, headers)
+        except Exception:
+            # A connection failing midway can not send another request
+            connection.close()
+            raise
+        self._release_connection(key, connection)
+        return response
+
+    def _retry_after(self, response, retry):
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+        return self.backoff_factor * (2 ** (retry - 1))
+
+    def request(
+        self, method, url, params=None, json=None, data=None, headers=None, verify=None
+    ):
+        """
+        :returns response (NetboxClientResponse): The response of Netbox
+        :params params (dict): Query params, lists are sent as repeated params
+        :params json (obj): Body of the request, serialized to JSON
+        """
+        method = method.upper()
+        if params:
+            url = "%s%s%s" % (url, "&" if "?" in url else "?", urlencode(params, True))
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        body = None
+        if json is not None:
+            body = to_bytes(json_dumps(json))
+            request_headers["Content-Type"] = "application/json"
+        elif data is not None:
+            body = to_bytes(data)
+        if verify is None:
+            verify = self.verify
+
+        request = NetboxClientRequest(method, url, body)
+        retry = 0
+        while True:
+            try:
+                response = self._send(request, request_headers, verify)
+            except (http_client.HTTPException, socket.error):
+                retry += 1
+                if method not in IDEMPOTENT_METHODS or retry > self.retries:
+                    raise
+                time.sleep(self.backoff_factor * (2 ** (retry - 1)))
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or retry >= self.retries:
+                return response
+            if method not in IDEMPOTENT_METHODS and response.status_code != 429:
+                return response
+            retry += 1
+            time.sleep(self._retry_after(response, retry))
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def options(self, url, **kwargs):
+        return self.request("OPTIONS", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, dict()
+        for connection in chain.from_iterable(idle.values()):
+            connection.close()
+
+
+def _serialize_nested(values):
+    """Serializes a nested object the way pynetbox does, to its ID, choice value or name"""
+    if sorted(values) == ["id", "label", "value"]:
+        return values["value"]
+    for key in ("id", "value"):
+        if key in values:
+            return values[key]
+    return values.get("name") or values.get("label") or ""
+
+
+class NetboxClientRecord(object):
+    """
+    Object returned by Netbox, holding the JSON dict of the response. Fields are read as
+    attributes, nested objects are records as well
+    :params values (dict): The object as returned by Netbox
+    :params api (NetboxClientApi): The client the object was read with
+    :params endpoint (NetboxClientEndpoint): The endpoint the object belongs to
+    """
+
+    def __init__(self, values, api, endpoint):
+        self._values = values
+        self.api = api
+        self.endpoint = endpoint
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            value = self._values[name]
+        except KeyError:
+            raise AttributeError('object has no attribute "%s"' % (name))
+        if name in JSON_FIELDS:
+            return value
+        if isinstance(value, dict):
+            return NetboxClientRecord(value, self.api, self.endpoint)
+        if isinstance(value, list):
+            return [
+                NetboxClientRecord(v, self.api, self.endpoint)
+                if isinstance(v, dict)
+                else v
+                for v in value
+            ]
+        return value
+
+    def __iter__(self):
+        for item in self._values.items():
+            yield item
+
+    def __str__(self):
+        return to_text(
+            self._values.get("name")
+            or self._values.get("label")
+            or self._values.get("display")
+            or ""
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def serialize(self):
+        """
+        :returns serialized_object (dict): The object as pynetbox serializes it, nested
+        objects are replaced by their ID and choices by their value
+        """
+        serialized_object = dict()
+        for key, value in self._values.items():
+            if key == "custom_fields" and isinstance(value, dict):
+                value = dict(
+                    (k, v["value"] if isinstance(v, dict) else v)
+                    for k, v in value.items()
+                )
+            elif key in JSON_FIELDS:
+                pass
+            elif isinstance(value, dict):
+                value = _serialize_nested(value)
+            elif isinstance(value, list):
+                value = [v.get("id") if isinstance(v, dict) else v for v in value]
+                if key in LIST_AS_SET:
+                    value = list(set(value))
+            serialized_object[key] = value
+        return serialized_object
+
+    @property
+    def url(self):
+        return "%s/%s/" % (self.endpoint.url, self._values["id"])
+
+    def patch(self, data):
+        """
+        :returns object (dict): The object updated by Netbox
+        :params data (dict): The fields to update
+        """
+        return self.api.request("PATCH", self.url, data=data)
+
+    def delete(self):
+        return self.api.request("DELETE", self.url)
+
+    @property
+    def available_ips(self):
+        return NetboxClientDetailEndpoint(self, "available-ips")
+
+    @property
+    def available_prefixes(self):
+        return NetboxClientDetailEndpoint(self, "available-prefixes")
+
+
+class NetboxClientDetailEndpoint(object):
+    """Detail route of an object, such as the available-ips of a prefix"""
+
+    def __init__(self, record, name):
+        self.api = record.api
+        self.url = "%s%s/" % (record.url, name)
+
+    def list(self, **kwargs):
+        return self.api.request("GET", self.url, params=kwargs)
+
+    def create(self, data=None):
+        return self.api.request("POST", self.url, data=data or {})
+
+
+class NetboxClientEndpoint(object):
+    """
+    Endpoint of the API with the methods of pynetbox endpoints used by the modules
+    :params api (NetboxClientApi): The client the endpoint belongs to
+    :params app (str): The application the endpoint lives under
+    :params name (str): The endpoint. ex. ip_addresses
+    """
+
+    return_obj = NetboxClientRecord
+
+    def __init__(self, api, app, name):
+        self.api = api
+        self.name = name.replace("_", "-")
+        self.url = "%s/%s/%s" % (api.base_url, app, self.name)
+        self._choices = None
+
+    def _record(self, values):
+        return self.return_obj(values, self.api, self)
+
+    def filter(self, *args, **kwargs):
+        if args:
+            kwargs["q"] = args[0]
+        return [
+            self._record(values)
+            for values in self.api.iter_results("%s/" % (self.url), kwargs)
+        ]
+
+    def all(self):
+        return self.filter()
+
+    def get(self, *args, **kwargs):
+        """
+        :returns object (NetboxClientRecord): The object with the ID passed in or matching the
+        query params, or None if it was not found
+        :raises ValueError: When more than one object matches, same as pynetbox
+        """
+        if args and args[0]:
+            try:
+                return self._record(
+                    self.api.request("GET", "%s/%s/" % (self.url, args[0]))
+                )
+            except NetboxClientError as e:
+                if e.req.status_code == 404:
+                    return None
+                raise
+
+        results = self.filter(**kwargs)
+        if len(results) > 1:
+            raise ValueError(
+                "get() returned more than one result. Check that the kwarg(s) passed "
+                "are valid for this endpoint or use filter() or all() instead."
+            )
+        return results[0] if results else None
+
+    def create(self, *args, **kwargs):
+        response = self.api.request(
+            "POST", "%s/" % (self.url), data=args[0] if args else kwargs
+        )
+        if isinstance(response, list):
+            return [self._record(values) for values in response]
+        return self._record(response)
+
+    def choices(self):
+        """
+        :returns choices (dict): Choices of every field of the endpoint, read once
+        """
+        if self._choices is None:
+            response = self.api.request("OPTIONS", "%s/" % (self.url))
+            try:
+                fields = response["actions"]["POST"]
+            except (KeyError, TypeError):
+                raise ValueError(
+                    "Unexpected format in the OPTIONS response at %s" % (self.url)
+                )
+            self._choices = dict(
+                (field, values["choices"])
+                for field, values in fields.items()
+                if "choices" in values
+            )
+        return self._choices
+
+
+class NetboxClientApp(object):
+    def __init__(self, api, name):
+        self.api = api
+        self.name = name
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.api._get_endpoint(self.name, name)
+
+
+class NetboxClientApi(object):
+    """
+    Stand-in for pynetbox.api built on the standard library. Responses are kept as the JSON
+    dicts returned by Netbox and wrapped by NetboxClientRecord, which only parses the fields
+    that are read
+    :params url (str): URL of Netbox
+    :params token (str): Token used to authenticate every request
+    :params ssl_verify (bool): Whether the certificate of Netbox is verified
+    """
+
+    def __init__(self, url, token=None, ssl_verify=True):
+        self.base_url = "%s/api" % (url.rstrip("/"))
+        self.token = token
+        self.ssl_verify = ssl_verify
+        self.http_session = NetboxClientSession(verify=ssl_verify)
+        self._endpoints = dict()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return NetboxClientApp(self, name)
+
+    def _get_endpoint(self, app, name):
+        if (app, name) not in self._endpoints:
+            self._endpoints[(app, name)] = NetboxClientEndpoint(self, app, name)
+        return self._endpoints[(app, name)]
+
+    def _build_headers(self):
+        headers = {"Accept": "application/json"}
+        if self.token:
+            headers["Authorization"] = "Token %s" % (self.token)
+        return headers
+
+    def request(self, method, url, params=None, data=None):
+        """
+        :returns response: The decoded JSON of the response, True for deletes or None when
+        Netbox returns no content
+        :raises NetboxClientError: When Netbox rejects the request
+        """
+        response = self.http_session.request(
+            method,
+            url,
+            params=params,
+            json=data,
+            headers=self._build_headers(),
+            verify=self.ssl_verify,
+        )
+        if not response.ok:
+            raise NetboxClientError(response)
+        if method == "DELETE":
+            return True
+        if response.status_code == 204 or not response.content:
+            return None
+        return response.json()
+
+    def iter_results(self, url, params):
+        """Iterates over the objects of every page of a list view. Once the first page tells
+        how many objects match, the rest is requested at once, the same way as pynetbox
+        :params url (str): URL of the list view
+        :params params (dict): Query params of the read
+        """
+        page = self.request("GET", url, params=params)
+        results = page["results"]
+        for values in results:
+            yield values
+
+        read = len(results)
+        next_url = page.get("next")
+        if next_url:
+            page = self.request(
+                "GET",
+                url,
+                params=dict(params, limit=page["count"] - read, offset=read),
+            )
+            for values in page["results"]:
+                yield values
+            next_url = page.get("next")
+        # Netbox caps the size of a page with MAX_PAGE_SIZE
+        while next_url:
+            page = self.request("GET", next_url)
+            for values in page["results"]:
+                yield values
+            next_url = page.get("next")
+
+    @property
+    def version(self):
+        response = self.http_session.get(
+            "%s/" % (self.base_url),
+            headers=self._build_headers(),
+            verify=self.ssl_verify,
+        )
+        if not response.ok:
+            raise NetboxClientError(response)
+        return response.headers.get("API-Version", "")
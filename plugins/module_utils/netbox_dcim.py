@@ -15,11 +15,15 @@ try:
         ENDPOINT_NAME_MAPPING,
         SLUG_REQUIRED,
     )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientApi,
+    )
 except ImportError:
     import sys
 
     sys.path.append(".")
     from netbox_utils import NetboxModule, ENDPOINT_NAME_MAPPING, SLUG_REQUIRED
+    from netbox_client import NetboxClientApi
 
 
 NB_DEVICE_BAYS = "device_bays"
@@ -38,6 +42,8 @@ NB_SITES = "sites"
 
 
 class NetboxDcimModule(NetboxModule):
+    api_class = NetboxClientApi
+
     def __init__(self, module, endpoint):
         super().__init__(module, endpoint)
 
@@ -88,7 +94,9 @@ class NetboxDcimModule(NetboxModule):
             data["color"] = data["color"].lower()
 
         object_query_params = self._build_query_params(endpoint_name, data)
-        self.nb_object = self._nb_endpoint_get(nb_endpoint, object_query_params, name)
+        self.nb_object = self._find_existing_object(
+            nb_endpoint, object_query_params, name
+        )
 
         # This is logic to handle interfaces on a VC
         if self.endpoint == "interfaces":
@@ -107,11 +115,8 @@ class NetboxDcimModule(NetboxModule):
         elif self.state == "absent":
             self._ensure_object_absent(endpoint_name, name)
 
-        try:
-            serialized_object = self.nb_object.serialize()
-        except AttributeError:
-            serialized_object = self.nb_object
+        serialized_object = self._serialize_object(self.nb_object)
 
         self.result.update({endpoint_name: serialized_object})
 
-        self.module.exit_json(**self.result)
+        self._exit_json()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import json
+import os
+import tempfile
+import time
+from functools import partial
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+        API_APPS_ENDPOINTS,
+        request_errors,
+        REQUIRED_ID_FIND,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_snapshot import (
+        SNAPSHOT_FORMAT,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_utils import (
+        NetboxModule,
+        API_APPS_ENDPOINTS,
+        request_errors,
+        REQUIRED_ID_FIND,
+    )
+    from netbox_snapshot import SNAPSHOT_FORMAT
+
+# Endpoints used by the modules that are not within API_APPS_ENDPOINTS
+EXTRA_EXPORT_ENDPOINTS = [("virtualization", "interfaces")]
+
+
+class NetboxExportModule(NetboxModule):
+    """
+    Writes every object of the endpoints used by the modules to a snapshot file, which the
+    modules read from in check mode when passed in with the snapshot option
+    """
+
+    def __init__(self, module, nb_client=None):
+        super().__init__(module, None, nb_client)
+
+    def _get_export_endpoints(self):
+        """
+        :returns endpoints (list): (app, endpoint) tuples to export, limited to the endpoints
+        option when defined
+        """
+        endpoints = list()
+        for app, app_endpoints in sorted(API_APPS_ENDPOINTS.items()):
+            for endpoint in sorted(set(app_endpoints)):
+                endpoints.append((app, endpoint))
+        endpoints.extend(EXTRA_EXPORT_ENDPOINTS)
+
+        wanted = self.module.params.get("endpoints")
+        if wanted:
+            unknown = set(wanted).difference(endpoint for app, endpoint in endpoints)
+            if unknown:
+                self._handle_errors(
+                    msg="%s is not a valid endpoint" % (", ".join(sorted(unknown)))
+                )
+            endpoints = [
+                (app, endpoint) for app, endpoint in endpoints if endpoint in wanted
+            ]
+        return endpoints
+
+    def _export_endpoint(self, app, endpoint):
+        """
+        :returns tuple(objects, choices): Every object of the endpoint and its choices
+        :params app (str): The application the endpoint lives under
+        :params endpoint (str): The endpoint to export. ex. sites
+        """
+        nb_app = getattr(self.nb, app)
+        nb_endpoint = getattr(nb_app, endpoint)
+        choices = dict()
+        try:
+            objects = [dict(nb_object) for nb_object in nb_endpoint.all()]
+            if endpoint in REQUIRED_ID_FIND:
+                choices = nb_endpoint.choices()
+        except request_errors() as e:
+            self._handle_errors(msg=e.error)
+
+        return objects, choices
+
+    def _write_snapshot(self, dest, snapshot):
+        dest = os.path.expanduser(dest)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(dest)), prefix=".netbox_snapshot."
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(snapshot, f)
+        self.module.atomic_move(tmp_path, dest)
+
+    def run(self):
+        """
+        Exports the endpoints concurrently and writes them as a single snapshot to dest
+        """
+        self.result = {"changed": False}
+
+        endpoints = self._get_export_endpoints()
+        tasks = [
+            partial(self._export_endpoint, app, endpoint) for app, endpoint in endpoints
+        ]
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "netbox_url": self.module.params["netbox_url"],
+            "version": str(self.version),
+            "exported": int(time.time()),
+            "objects": dict(),
+            "choices": dict(),
+        }
+        counts = dict()
+        for (app, endpoint), (objects, choices) in zip(
+            endpoints, self._run_concurrently(tasks)
+        ):
+            snapshot["objects"].setdefault(app, dict())[endpoint] = objects
+            if choices:
+                snapshot["choices"].setdefault(app, dict())[endpoint] = choices
+            counts["%s.%s" % (app, endpoint)] = len(objects)
+
+        if not self.check_mode:
+            self._write_snapshot(self.module.params["dest"], snapshot)
+
+        self.result["changed"] = True
+        self.result["msg"] = "Exported %s objects of %s endpoints to %s" % (
+            sum(counts.values()),
+            len(counts),
+            self.module.params["dest"],
+        )
+        self.result["endpoints"] = counts
+
+        self._exit_json()
@@ -11,14 +11,20 @@ try:
         NetboxModule,
         ENDPOINT_NAME_MAPPING,
     )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientApi,
+    )
 except ImportError:
     import sys
 
     sys.path.append(".")
     from netbox_utils import NetboxModule, ENDPOINT_NAME_MAPPING
+    from netbox_client import NetboxClientApi
 
 
 class NetboxExtrasModule(NetboxModule):
+    api_class = NetboxClientApi
+
     def __init__(self, module, endpoint):
         super().__init__(module, endpoint)
 
@@ -45,18 +51,17 @@ class NetboxExtrasModule(NetboxModule):
         data["slug"] = self._to_slug(name)
 
         object_query_params = self._build_query_params(endpoint_name, data)
-        self.nb_object = self._nb_endpoint_get(nb_endpoint, object_query_params, name)
+        self.nb_object = self._find_existing_object(
+            nb_endpoint, object_query_params, name
+        )
 
         if self.state == "present":
             self._ensure_object_exists(nb_endpoint, endpoint_name, name, data)
         elif self.state == "absent":
             self._ensure_object_absent(endpoint_name, name)
 
-        try:
-            serialized_object = self.nb_object.serialize()
-        except AttributeError:
-            serialized_object = self.nb_object
+        serialized_object = self._serialize_object(self.nb_object)
 
         self.result.update({endpoint_name: serialized_object})
 
-        self.module.exit_json(**self.result)
+        self._exit_json()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+from itertools import groupby
+
+from ansible.module_utils._text import to_native
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+        NetboxDeferredError,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk import (
+        NetboxBulkModule,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_journal import (
+        NetboxJournal,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_utils import NetboxModule, NetboxDeferredError
+    from netbox_bulk import NetboxBulkModule
+    from netbox_journal import NetboxJournal
+
+
+class NetboxFlushModule(NetboxModule):
+    """
+    Applies the writes queued in the journal by the modules run with the journal option.
+    Consecutive entries of the same endpoint and state are applied together by
+    NetboxBulkModule, in the order they were queued so objects are created before the objects
+    referring to them and later writes of an object are applied after the earlier ones
+    """
+
+    def __init__(self, module, nb_client=None):
+        super().__init__(module, None, nb_client)
+
+    def run(self):
+        """
+        Applies the journal one group of entries at a time, removing the entries of every group
+        once applied. The first group that fails stops the flush, its entries and the entries
+        after it are kept in the journal
+        """
+        self.result = {"changed": False}
+
+        journal = NetboxJournal(
+            self.module.params["journal"], self.module.params["netbox_url"]
+        )
+        try:
+            entries = journal.read()
+        except (IOError, OSError, ValueError) as e:
+            self._handle_errors(
+                msg="Failed to read journal %s: %s"
+                % (self.module.params["journal"], to_native(e))
+            )
+
+        results = list()
+        counts = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        error = None
+        for (endpoint, state), group in groupby(
+            entries, key=lambda entry: (entry["endpoint"], entry["state"])
+        ):
+            group = list(group)
+            bulk = NetboxBulkModule.from_module(self, endpoint, state)
+            # Errors are reported along with the outcome of the entries applied before them
+            bulk._thread_state.defer_errors = True
+            try:
+                group_results, group_counts = bulk._apply_items(
+                    [entry["data"] for entry in group], repeats=True
+                )
+            except NetboxDeferredError as e:
+                error = "Failed to apply %s %s entries: %s" % (
+                    len(group),
+                    endpoint,
+                    e.msg,
+                )
+                break
+
+            for entry, result in zip(group, group_results):
+                result.update(entry=entry["id"], endpoint=endpoint, state=state)
+                results.append(result)
+            for key, count in group_counts.items():
+                counts[key] += count
+            if not self.check_mode:
+                journal.remove([entry["id"] for entry in group])
+
+        self.result["changed"] = bool(
+            counts["created"] or counts["updated"] or counts["deleted"]
+        )
+        self.result["msg"] = (
+            "%(created)s created, %(updated)s updated, %(deleted)s deleted, "
+            "%(unchanged)s unchanged" % counts
+        )
+        self.result["results"] = results
+        self.result["pending"] = len(entries) - len(results)
+
+        if error:
+            self.result["msg"] = error
+            self.module.fail_json(**self.result)
+        self._exit_json()
@@ -7,7 +7,6 @@ __metaclass__ = type
 
 # Import necessary packages
 import traceback
-from ansible.module_utils.compat import ipaddress
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import missing_required_lib
 
@@ -16,12 +15,24 @@ try:
         NetboxModule,
         ENDPOINT_NAME_MAPPING,
         SLUG_REQUIRED,
+        allocation_errors,
+        request_errors,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientApi,
     )
 except ImportError:
     import sys
 
     sys.path.append(".")
-    from netbox_utils import NetboxModule, ENDPOINT_NAME_MAPPING, SLUG_REQUIRED
+    from netbox_utils import (
+        NetboxModule,
+        ENDPOINT_NAME_MAPPING,
+        SLUG_REQUIRED,
+        allocation_errors,
+        request_errors,
+    )
+    from netbox_client import NetboxClientApi
 
 
 NB_AGGREGATES = "aggregates"
@@ -34,10 +45,16 @@ NB_VLAN_GROUPS = "vlan_groups"
 NB_VRFS = "vrfs"
 NB_SERVICES = "services"
 
+# Statuses Netbox answers a POST to available-ips or available-prefixes with when the prefix is
+# full, 204 up to Netbox 2.8 and 409 since
+NO_SPACE_STATUS_CODES = (204, 409)
+
 
 class NetboxIpamModule(NetboxModule):
-    def __init__(self, module, endpoint):
-        super().__init__(module, endpoint)
+    api_class = NetboxClientApi
+
+    def __init__(self, module, endpoint, nb_client=None):
+        super().__init__(module, endpoint, nb_client)
 
     def _handle_state_new_present(self, nb_app, nb_endpoint, endpoint_name, name, data):
         if data.get("address"):
@@ -68,9 +85,9 @@ class NetboxIpamModule(NetboxModule):
         if data.get("vrf"):
             query_params["vrf_id"] = data["vrf"]
 
-        attached_ips = nb_endpoint.filter(**query_params)
-        if attached_ips:
-            self.nb_object = attached_ips[-1].serialize()
+        attached_ip = self._nb_endpoint_last(nb_endpoint, query_params)
+        if attached_ip:
+            self.nb_object = attached_ip.serialize()
             self.result["changed"] = False
             self.result["msg"] = "%s %s already attached" % (
                 endpoint_name,
@@ -87,39 +104,72 @@ class NetboxIpamModule(NetboxModule):
             self.result["msg"] = "%s does not exist - please create first" % (
                 data["prefix"]
             )
-        elif prefix.available_ips.list():
-            self.nb_object, diff = self._create_netbox_object(
+        else:
+            self.nb_object, diff = self._create_available_object(
                 prefix.available_ips, data
             )
+            if self.nb_object is None:
+                self.result["changed"] = False
+                self.result["msg"] = "No available IPs available within %s" % (
+                    data["prefix"]
+                )
+                return
             self.result["changed"] = True
             self.result["msg"] = "%s %s created" % (
                 endpoint_name,
                 self.nb_object["address"],
             )
             self.result["diff"] = diff
-        else:
-            self.result["changed"] = False
-            self.result["msg"] = "No available IPs available within %s" % (
-                data["prefix"]
-            )
 
     def _get_new_available_prefix(self, data, endpoint_name):
         if not self.nb_object:
             self.result["changed"] = False
             self.result["msg"] = "Parent prefix does not exist - %s" % (data["parent"])
-        elif self.nb_object.available_prefixes.list():
-            self.nb_object, diff = self._create_netbox_object(
+        else:
+            self.nb_object, diff = self._create_available_object(
                 self.nb_object.available_prefixes, data
             )
+            if self.nb_object is None:
+                self.result["changed"] = False
+                self.result["msg"] = "No available prefixes within %s" % (
+                    data["parent"]
+                )
+                return
             self.result["changed"] = True
             self.result["msg"] = "%s %s created" % (
                 endpoint_name,
                 self.nb_object["prefix"],
             )
             self.result["diff"] = diff
+
+    def _create_available_object(self, nb_detail_endpoint, data):
+        """Allocates the object with a single POST to the available-ips or available-prefixes of
+        a prefix, Netbox picks the first free address or network itself instead of listing them
+        all beforehand. Check mode only reads the first free one to know whether there is room
+        :returns tuple(nb_obj, diff): The created object and the Ansible diff, or None and None
+        when the prefix has no room left
+        :params nb_detail_endpoint (obj): available_ips or available_prefixes of the prefix
+        :params data (dict): Fields of the object to create
+        """
+        if self.check_mode:
+            if not nb_detail_endpoint.list(limit=1):
+                return None, None
+            nb_obj = data
         else:
-            self.result["changed"] = False
-            self.result["msg"] = "No available prefixes within %s" % (data["parent"])
+            try:
+                nb_obj = nb_detail_endpoint.create(data)
+            except allocation_errors():
+                nb_obj = None
+            except request_errors() as e:
+                if e.req.status_code not in NO_SPACE_STATUS_CODES:
+                    self._handle_errors(msg=e.error)
+                nb_obj = None
+            if not nb_obj:
+                return None, None
+            self._invalidate_cache()
+
+        diff = self._build_diff(before={"state": "absent"}, after={"state": "present"})
+        return nb_obj, diff
 
     def run(self):
         """
@@ -148,6 +198,8 @@ class NetboxIpamModule(NetboxModule):
 
         if self.endpoint == "ip_addresses":
             if data.get("address"):
+                import ipaddress
+
                 try:
                     data["address"] = to_text(ipaddress.ip_network(data["address"]))
                 except ValueError:
@@ -174,7 +226,7 @@ class NetboxIpamModule(NetboxModule):
                 nb_app.prefixes, object_query_params, name
             )
         else:
-            self.nb_object = self._nb_endpoint_get(
+            self.nb_object = self._find_existing_object(
                 nb_endpoint, object_query_params, name
             )
 
@@ -189,11 +241,8 @@ class NetboxIpamModule(NetboxModule):
         elif self.state == "absent":
             self._ensure_object_absent(endpoint_name, name)
 
-        try:
-            serialized_object = self.nb_object.serialize()
-        except AttributeError:
-            serialized_object = self.nb_object
+        serialized_object = self._serialize_object(self.nb_object)
 
         self.result.update({endpoint_name: serialized_object})
 
-        self.module.exit_json(**self.result)
+        self._exit_json()
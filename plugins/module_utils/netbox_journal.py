@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import fcntl
+import json
+import os
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+
+class NetboxJournal(object):
+    """
+    Append only file of the writes deferred by the modules until netbox_flush applies them.
+    Every entry is a JSON document on its own line, appended under an exclusive lock so
+    modules running in parallel forks never interleave their entries.
+    :params path (str): Path of the journal
+    :params netbox_url (str): URL of the Netbox instance, a journal may hold the writes of
+    several instances and only the entries of this one are read and removed
+    """
+
+    def __init__(self, path, netbox_url):
+        self.path = os.path.expanduser(path)
+        self.netbox_url = netbox_url.rstrip("/")
+
+    @contextmanager
+    def _lock(self):
+        """Holds an exclusive lock on the journal while it is being modified"""
+        with open("%s.lock" % (self.path), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self):
+        entries = list()
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        entries.append(json.loads(line))
+        except (IOError, OSError):
+            pass
+        return entries
+
+    def append(self, operations):
+        """
+        :returns ids (list): IDs of the entries, returned by netbox_flush with their outcome
+        :params operations (list): Dicts with the endpoint, state and data of each write
+        """
+        entries = list()
+        for operation in operations:
+            entry = dict(operation)
+            entry.update(
+                id=uuid.uuid4().hex, netbox_url=self.netbox_url, queued=time.time()
+            )
+            entries.append(entry)
+
+        with self._lock():
+            with open(self.path, "a") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, sort_keys=True) + "\n")
+        return [entry["id"] for entry in entries]
+
+    def read(self):
+        """
+        :returns entries (list): Entries of the Netbox instance, in the order they were queued
+        """
+        with self._lock():
+            entries = self._load()
+        return [entry for entry in entries if entry["netbox_url"] == self.netbox_url]
+
+    def remove(self, ids):
+        """Removes the applied entries, entries queued since they were read are kept
+        :params ids (list): IDs of the entries to remove
+        """
+        ids = set(ids)
+        with self._lock():
+            entries = [entry for entry in self._load() if entry["id"] not in ids]
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)),
+                prefix=".netbox_journal.",
+            )
+            with os.fdopen(fd, "w") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, sort_keys=True) + "\n")
+            os.rename(tmp_path, self.path)
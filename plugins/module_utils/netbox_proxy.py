@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import binascii
+import fcntl
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six import string_types
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible.module_utils.six.moves.BaseHTTPServer import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+)
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_cache import (
+        DEFAULT_CACHE_CONNECTION,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientSession,
+    )
+except ImportError:
+    sys.path.append(".")
+    from netbox_cache import DEFAULT_CACHE_CONNECTION
+    from netbox_client import NetboxClientSession
+
+# Module run with python -m as the proxy process
+PROXY_MODULE = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy"
+
+# Path answering the counters of the proxy instead of forwarding to Netbox
+STATS_PATH = "/_proxy/stats"
+
+# Seconds a proxy keeps running without receiving a request
+PROXY_IDLE_TIMEOUT = 900
+
+# Seconds a module waits for the proxy it started to accept requests
+PROXY_START_TIMEOUT = 10
+
+# Methods whose responses are cached, Netbox answers the choices of an endpoint to OPTIONS
+CACHED_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Request headers that change the response of Netbox, responses are cached per value
+VARY_HEADERS = ("Authorization", "X-Session-Key", "Accept")
+
+# Headers describing a single hop, never forwarded
+HOP_HEADERS = frozenset(
+    [
+        "connection",
+        "content-encoding",
+        "content-length",
+        "host",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    ]
+)
+
+# Endpoints whose cached reads are also dropped by writes to another endpoint, the available
+# IPs and prefixes are read through the prefixes endpoint
+LINKED_ENDPOINTS = {
+    "/api/ipam/ip-addresses": ("/api/ipam/prefixes",),
+    "/api/ipam/prefixes": ("/api/ipam/ip-addresses",),
+}
+
+
+class NetboxProxyError(Exception):
+    pass
+
+
+def _endpoint(path):
+    """
+    :returns endpoint (str): Endpoint the path belongs to. ex. /api/dcim/sites for
+    /api/dcim/sites/1/?brief=1
+    """
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    if len(parts) >= 3 and parts[0] == "api":
+        return "/%s" % ("/".join(parts[:3]))
+    return "/%s" % ("/".join(parts))
+
+
+class NetboxProxyCache(object):
+    """
+    Responses of the reads sent through the proxy. Identical reads received while the first
+    one is sent to Netbox wait for its response instead of sending their own, the same way
+    NetboxModule._nb_read coalesces reads within a module run. Every write drops the responses
+    of its endpoint, reads sent to Netbox before the write completed are not cached.
+    :params ttl (int): Seconds a response is served from the cache
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = dict()
+        self._in_flight = dict()
+        self._generations = dict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "writes": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, key, fetch):
+        """
+        :returns response (tuple): Status, headers and body of the response, None if Netbox
+        could not be reached
+        :params key (tuple): Method, endpoint, path and varying headers of the request
+        :params fetch (callable): Sends the request to Netbox
+        """
+        endpoint = key[1]
+        leader = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.time():
+                self.stats["hits"] += 1
+                return entry[1]
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                self.stats["coalesced"] += 1
+            else:
+                self.stats["misses"] += 1
+                flight = {"event": threading.Event(), "response": None}
+                self._in_flight[key] = flight
+                generation = self._generations.get(endpoint, 0)
+                leader = True
+
+        if not leader:
+            flight["event"].wait()
+            return flight["response"]
+
+        response = None
+        try:
+            response = fetch()
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+                if (
+                    response is not None
+                    and response[0] == 200
+                    and self._generations.get(endpoint, 0) == generation
+                ):
+                    self._entries[key] = (time.time() + self.ttl, response)
+            flight["response"] = response
+            flight["event"].set()
+        return response
+
+    def invalidate(self, endpoint):
+        """Drops the responses of the endpoint and of its linked endpoints after a write"""
+        with self._lock:
+            self.stats["writes"] += 1
+            for name in (endpoint,) + LINKED_ENDPOINTS.get(endpoint, ()):
+                self._generations[name] = self._generations.get(name, 0) + 1
+                for key in [k for k in self._entries if k[1] == name]:
+                    del self._entries[key]
+                    self.stats["invalidations"] += 1
+                # Reads received from now on must not wait for a response sent before the write
+                for key in [k for k in self._in_flight if k[1] == name]:
+                    del self._in_flight[key]
+
+    def report(self):
+        """
+        :returns stats (dict): Counters of the cache along with its hit rate
+        """
+        with self._lock:
+            stats = dict(self.stats, entries=len(self._entries))
+        reads = stats["hits"] + stats["coalesced"] + stats["misses"]
+        stats["hit_rate"] = (
+            round(float(stats["hits"] + stats["coalesced"]) / reads, 4)
+            if reads
+            else 0.0
+        )
+        return stats
+
+
+class NetboxProxyHandler(BaseHTTPRequestHandler):
+    """Forwards the requests to Netbox, answering the reads from the cache of the server. Only
+    requests whose path starts with the secret of the server are answered, other local users
+    can reach the port but can not read the state file holding it"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else None
+
+    def _authorize(self):
+        """Strips the secret of the server from the path of the request into self.netbox_path
+        :returns authorized (bool): Whether the request started with the secret
+        """
+        prefix = to_bytes("/%s" % (self.server.secret))
+        path = to_bytes(self.path)
+        if hmac.compare_digest(path[: len(prefix)], prefix) and path[
+            len(prefix) : len(prefix) + 1
+        ] in (b"/", b"?"):
+            self.netbox_path = self.path[len(prefix) :]
+            self.server.touch()
+            return True
+
+        self.close_connection = True
+        self._send((403, [], b'{"detail": "Invalid proxy secret"}'))
+        return False
+
+    def _forward(self, body=None):
+        """
+        :returns response (tuple): Status, headers and body of the response of Netbox, None
+        if Netbox could not be reached
+        """
+        headers = dict(
+            (k, v) for k, v in self.headers.items() if k.lower() not in HOP_HEADERS
+        )
+        try:
+            response = self.server.session.request(
+                self.command,
+                "%s%s" % (self.server.netbox_url, self.netbox_path),
+                data=body,
+                headers=headers,
+            )
+        except (http_client.HTTPException, IOError, OSError):
+            return None
+        return (
+            response.status_code,
+            [
+                (k, v)
+                for k, v in response.headers.items()
+                if k.lower() not in HOP_HEADERS
+            ],
+            response.content,
+        )
+
+    def _fetch(self):
+        """Forwards a read, pointing the next and previous links of list views at the proxy
+        as Netbox builds them from its own URL
+        """
+        response = self._forward()
+        if response is None or response[0] != 200 or b'"next"' not in response[2]:
+            return response
+        status, headers, body = response
+        try:
+            data = json.loads(to_text(body))
+        except ValueError:
+            return response
+        if not isinstance(data, dict):
+            return response
+        for key in ("next", "previous"):
+            if isinstance(data.get(key), string_types):
+                data[key] = self.server.proxy_link(data[key])
+        return status, headers, to_bytes(json.dumps(data))
+
+    def _cache_key(self):
+        return (self.command, _endpoint(self.netbox_path), self.netbox_path) + tuple(
+            self.headers.get(header) for header in VARY_HEADERS
+        )
+
+    def _send(self, response):
+        if response is None:
+            response = (502, [], b'{"detail": "Netbox could not be reached"}')
+        status, headers, body = response
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _read(self):
+        if not self._authorize():
+            return
+        if self.netbox_path == STATS_PATH:
+            body = to_bytes(json.dumps(self.server.report()))
+            return self._send((200, [("Content-Type", "application/json")], body))
+        self._send(self.server.cache.get(self._cache_key(), self._fetch))
+
+    def _write(self):
+        if not self._authorize():
+            return
+        body = self._read_body()
+        try:
+            response = self._forward(body)
+        finally:
+            self.server.cache.invalidate(_endpoint(self.netbox_path))
+        self._send(response)
+
+    do_GET = do_HEAD = do_OPTIONS = _read
+    do_POST = do_PUT = do_PATCH = do_DELETE = _write
+
+
+class NetboxProxyServer(ThreadingMixIn, HTTPServer):
+    """
+    Caching proxy in front of a single Netbox instance, listening on localhost
+    :params netbox_url (str): URL of Netbox
+    :params session (NetboxClientSession): Session the requests are sent to Netbox with
+    :params ttl (int): Seconds a read is served from the cache
+    :params idle_timeout (int): Seconds without requests before the proxy stops
+    """
+
+    daemon_threads = True
+
+    def __init__(self, netbox_url, session, ttl, idle_timeout=PROXY_IDLE_TIMEOUT):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), NetboxProxyHandler)
+        self.netbox_url = netbox_url.rstrip("/")
+        self.session = session
+        self.cache = NetboxProxyCache(ttl)
+        self.idle_timeout = idle_timeout
+        self.secret = to_text(binascii.hexlify(os.urandom(16)))
+        self.started = time.time()
+        self.last_request = time.time()
+
+    @property
+    def url(self):
+        """URL of the proxy, the secret is part of it so every client passes it along"""
+        return "http://127.0.0.1:%s/%s" % (self.server_address[1], self.secret)
+
+    def proxy_link(self, link):
+        """
+        :returns link (str): The link to Netbox rewritten to go through the proxy
+        :params link (str): Link returned by Netbox, such as the next page of a list view
+        """
+        url = urlsplit(link)
+        netbox_url = urlsplit(self.netbox_url)
+        if url.netloc != netbox_url.netloc or not url.path.startswith(netbox_url.path):
+            return link
+        path = url.path[len(netbox_url.path) :]
+        return "%s%s%s" % (self.url, path, "?%s" % (url.query) if url.query else "")
+
+    def touch(self):
+        self.last_request = time.time()
+
+    def report(self):
+        return dict(
+            self.cache.report(),
+            netbox_url=self.netbox_url,
+            validate_certs=self.session.verify,
+            ttl=self.cache.ttl,
+            uptime=int(time.time() - self.started),
+        )
+
+    def stop_when_idle(self):
+        while time.time() - self.last_request < self.idle_timeout:
+            time.sleep(min(5, self.idle_timeout))
+        self.shutdown()
+
+
+def _state_dir(netbox_url, cache_connection):
+    """Directory of the proxy of a Netbox instance, shared with NetboxCache"""
+    url_hash = hashlib.sha1(netbox_url.rstrip("/").encode("utf-8")).hexdigest()
+    return os.path.join(
+        os.path.expanduser(cache_connection or DEFAULT_CACHE_CONNECTION), url_hash
+    )
+
+
+def _write_state(path, state):
+    # mkstemp creates the file readable by its owner only, the state holds the secret
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".proxy.")
+    with os.fdopen(fd, "w") as f:
+        json.dump(state, f)
+    os.rename(tmp_path, path)
+
+
+def _read_state(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _collection_root(state_dir):
+    """Finds the directory holding the ansible_collections package the proxy is started from.
+    Under AnsiballZ this file lives within the payload of the module, which is deleted once the
+    task exits, so the payload is extracted next to the state of the proxy first
+    :returns root (str): Directory to run python -m PROXY_MODULE from
+    :raises NetboxProxyError: When this file is not part of an installed collection
+    :params state_dir (str): Directory holding the state of the proxy
+    """
+    path = os.path.abspath(__file__)
+    parts = path.split(os.sep)
+    archive = None
+    for index in range(1, len(parts)):
+        candidate = os.sep.join(parts[:index])
+        if candidate.endswith(".zip") and os.path.isfile(candidate):
+            archive = candidate
+            break
+
+    if archive is None:
+        root = path
+        for part in PROXY_MODULE.split("."):
+            root = os.path.dirname(root)
+    else:
+        with open(archive, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        root = os.path.join(state_dir, "payload-%s" % (digest[:12]))
+        if not os.path.isdir(root):
+            tmp_root = tempfile.mkdtemp(dir=state_dir, prefix=".payload.")
+            with zipfile.ZipFile(archive) as payload:
+                payload.extractall(tmp_root)
+            os.rename(tmp_root, root)
+            # Payloads of other versions of the collection, running proxies imported theirs
+            for name in os.listdir(state_dir):
+                if name.startswith("payload-") and name != os.path.basename(root):
+                    shutil.rmtree(os.path.join(state_dir, name), ignore_errors=True)
+
+    if not os.path.isfile(os.path.join(root, *PROXY_MODULE.split(".")) + ".py"):
+        raise NetboxProxyError(
+            "%s is not part of the netbox_community.ansible_modules collection" % (path)
+        )
+    return root
+
+
+def proxy_stats(proxy_url, timeout=2):
+    """
+    :returns stats (dict): Counters of the proxy, see NetboxProxyCache.report, or None if no
+    proxy answers at proxy_url
+    """
+    url = urlsplit(proxy_url)
+    connection = http_client.HTTPConnection(url.netloc, timeout=timeout)
+    try:
+        connection.request("GET", "%s%s" % (url.path, STATS_PATH))
+        response = connection.getresponse()
+        if response.status != 200:
+            return None
+        return json.loads(to_text(response.read()))
+    except (http_client.HTTPException, IOError, OSError, ValueError):
+        return None
+    finally:
+        connection.close()
+
+
+@contextmanager
+def _lock(state_dir):
+    """Only lets a single module start the proxy when forks start at the same time"""
+    with open(os.path.join(state_dir, "proxy.lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def start_proxy(
+    netbox_url,
+    validate_certs=True,
+    ttl=60,
+    cache_connection=None,
+    timeout=60,
+    retries=3,
+    backoff_factor=0.5,
+):
+    """Starts the proxy of a Netbox instance unless one is already running. The proxy runs as a
+    process of its own, shared by every fork and task using the same Netbox instance, cache
+    directory and validate_certs until it stays idle for PROXY_IDLE_TIMEOUT seconds
+    :returns proxy_url (str): URL to send the requests to instead of netbox_url
+    :raises NetboxProxyError: When the proxy does not start within PROXY_START_TIMEOUT
+    :params netbox_url (str): URL of Netbox
+    :params validate_certs (bool): Whether the proxy verifies the certificate of Netbox
+    :params ttl (int): Seconds a read is served from the cache, set by the module starting it
+    :params cache_connection (str): Directory holding the state of the proxy
+    """
+    netbox_url = netbox_url.rstrip("/")
+    state_dir = _state_dir(netbox_url, cache_connection)
+    try:
+        os.makedirs(state_dir, mode=0o700)
+    except OSError:
+        if not os.path.isdir(state_dir):
+            raise
+    # A proxy not verifying the certificate of Netbox must not serve callers requiring it
+    state_path = os.path.join(
+        state_dir, "proxy.json" if validate_certs else "proxy-insecure.json"
+    )
+
+    with _lock(state_dir):
+        state = _read_state(state_path)
+        if state is not None:
+            stats = proxy_stats(state["url"])
+            if (
+                stats is not None
+                and stats.get("netbox_url") == netbox_url
+                and stats.get("validate_certs") == validate_certs
+            ):
+                return state["url"]
+
+        config = dict(
+            netbox_url=netbox_url,
+            validate_certs=validate_certs,
+            ttl=ttl,
+            state_path=state_path,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+        )
+        root = _collection_root(state_dir)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [root] + [path for path in [env.get("PYTHONPATH")] if path]
+        )
+        with open(os.devnull, "r+b") as devnull:
+            subprocess.Popen(
+                [sys.executable, "-m", PROXY_MODULE, json.dumps(config)],
+                cwd=root,
+                env=env,
+                stdin=devnull,
+                stdout=devnull,
+                stderr=devnull,
+                close_fds=True,
+                start_new_session=True,
+            )
+
+        deadline = time.time() + PROXY_START_TIMEOUT
+        while time.time() < deadline:
+            new_state = _read_state(state_path)
+            if new_state is not None and new_state != state:
+                return new_state["url"]
+            time.sleep(0.05)
+    raise NetboxProxyError(
+        "The proxy of %s did not start within %s seconds"
+        % (netbox_url, PROXY_START_TIMEOUT)
+    )
+
+
+def main():
+    """Entry point of the proxy process started by start_proxy"""
+    config = json.loads(sys.argv[1])
+    session = NetboxClientSession(
+        timeout=config["timeout"],
+        retries=config["retries"],
+        backoff_factor=config["backoff_factor"],
+        verify=config["validate_certs"],
+    )
+    server = NetboxProxyServer(config["netbox_url"], session, config["ttl"])
+    _write_state(config["state_path"], {"pid": os.getpid(), "url": server.url})
+
+    watcher = threading.Thread(target=server.stop_when_idle)
+    watcher.daemon = True
+    watcher.start()
+    try:
+        server.serve_forever()
+    finally:
+        if (_read_state(config["state_path"]) or {}).get("pid") == os.getpid():
+            try:
+                os.remove(config["state_path"])
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Locations of the OpenAPI document, Netbox < 3.0 (drf-yasg) then Netbox >= 3.0 (drf-spectacular)
+SCHEMA_PATHS = ("/api/docs/?format=openapi", "/api/schema/?format=json")
+
+# Query params accepted by every list view without being filters
+PAGINATION_PARAMS = frozenset(["brief", "limit", "offset"])
+
+
+class NetboxRegistry(object):
+    """
+    Apps, endpoints and filters of a Netbox instance as described by its OpenAPI document
+    :params endpoints (dict): Filters of every endpoint per app, None when they are unknown.
+    ex. {"dcim": {"sites": [...]}}
+    """
+
+    def __init__(self, endpoints):
+        self.endpoints = endpoints
+        self._apps = dict()
+        self._filters = dict()
+        for app, app_endpoints in sorted(endpoints.items()):
+            for endpoint, filters in app_endpoints.items():
+                self._apps.setdefault(endpoint, app)
+                if filters is not None:
+                    self._filters[(app, endpoint)] = frozenset(filters)
+
+    @classmethod
+    def from_schema(cls, schema):
+        """Builds the registry from the list views of the OpenAPI (or Swagger 2.0) document
+        :returns registry (NetboxRegistry): The registry
+        :params schema (dict): The OpenAPI document of Netbox
+        """
+        endpoints = dict()
+        for path, operations in schema.get("paths", {}).items():
+            parts = [part for part in path.split("/") if part]
+            if parts and parts[0] == "api":
+                parts = parts[1:]
+            if len(parts) != 2 or "{" in path or "get" not in operations:
+                continue
+
+            app, endpoint = parts[0].replace("-", "_"), parts[1].replace("-", "_")
+            parameters = operations.get("parameters", []) + operations["get"].get(
+                "parameters", []
+            )
+            if any("$ref" in parameter for parameter in parameters):
+                # Filters defined elsewhere are unknown, so the query params are not validated
+                endpoints.setdefault(app, dict())[endpoint] = None
+                continue
+            endpoints.setdefault(app, dict())[endpoint] = sorted(
+                set(
+                    parameter["name"]
+                    for parameter in parameters
+                    if parameter.get("in") == "query"
+                )
+            )
+        return cls(endpoints)
+
+    def find_app(self, endpoint):
+        """
+        :returns app (str): The application the endpoint lives under or None if unknown
+        :params endpoint (str): The endpoint. ex. sites
+        """
+        return self._apps.get(endpoint)
+
+    def get_filters(self, app, endpoint):
+        """
+        :returns filters (frozenset): Query params accepted by the endpoint or None if the
+        endpoint is unknown
+        """
+        return self._filters.get((app, endpoint))
+
+    def invalid_query_params(self, app, endpoint, query_params):
+        """
+        :returns invalid (list): Query params Netbox would ignore, which makes the query match
+        more objects than intended
+        :params app (str): The application the endpoint lives under
+        :params endpoint (str): The endpoint. ex. sites
+        :params query_params (dict): Query params of the read
+        """
+        filters = self.get_filters(app, endpoint)
+        if filters is None:
+            return []
+        return sorted(
+            param
+            for param in query_params
+            if param not in filters and param not in PAGINATION_PARAMS
+        )
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import ipaddress
+import json
+from itertools import chain
+from ansible.module_utils._text import to_text
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientRecord,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_client import NetboxClientRecord
+
+# Format of the snapshot files written by netbox_export
+SNAPSHOT_FORMAT = 1
+
+# Fields indexed by the snapshot endpoints as most lookups filter on one of them
+INDEXED_FIELDS = ("id", "name", "slug", "cid")
+
+# Fields compared by the q filter, a close enough match of the search of Netbox
+SEARCH_FIELDS = ("name", "slug", "cid", "model", "address", "prefix", "description")
+
+
+def _strip_urls(values):
+    """Removes the url of nested objects so no client ever tries to fetch their details"""
+    if isinstance(values, dict):
+        return dict((k, _strip_urls(v)) for k, v in values.items() if k != "url")
+    elif isinstance(values, list):
+        return [_strip_urls(v) for v in values]
+    return values
+
+
+def _ip_interface(value):
+    try:
+        return ipaddress.ip_interface(to_text(value))
+    except ValueError:
+        return None
+
+
+def _ip_network(value):
+    try:
+        return ipaddress.ip_network(to_text(value), strict=False)
+    except ValueError:
+        return None
+
+
+def _nested_id(value):
+    if isinstance(value, dict):
+        return value.get("id")
+    return getattr(value, "id", value)
+
+
+class NetboxSnapshotRecord(NetboxClientRecord):
+    """Record built from an object of the snapshot, serializes exactly as the objects
+    returned by Netbox itself"""
+
+    @property
+    def available_ips(self):
+        return NetboxSnapshotDetailEndpoint(self.api.available_ips, self)
+
+    @property
+    def available_prefixes(self):
+        return NetboxSnapshotDetailEndpoint(self.api.available_prefixes, self)
+
+
+class NetboxSnapshotDetailEndpoint(object):
+    """Stands in for the available-ips and available-prefixes endpoints of a prefix"""
+
+    def __init__(self, find_available, prefix):
+        self.find_available = find_available
+        self.prefix = prefix
+
+    def list(self, **kwargs):
+        return self.find_available(self.prefix)
+
+
+class NetboxSnapshotEndpoint(object):
+    """Answers the reads of NetboxModule from the objects of a single endpoint of the snapshot.
+    Filters are matched locally, filters that do not apply to the endpoint are ignored the same
+    way Netbox ignores them
+    :params api (NetboxSnapshotApi): The snapshot the endpoint belongs to
+    :params app (str): The application the endpoint lives under
+    :params name (str): The endpoint. ex. sites
+    """
+
+    def __init__(self, api, app, name):
+        self.api = api
+        self.name = name.replace("_", "-")
+        self.url = "%s/%s/%s" % (api.base_url, app, self.name)
+        self._objects = api.snapshot["objects"].get(app, {}).get(name, [])
+        self._choices = api.snapshot.get("choices", {}).get(app, {}).get(name, {})
+        self._indexes = dict()
+
+    def _get_index(self, field):
+        """
+        :returns index (dict): Maps the text of the value of field to the objects holding it
+        """
+        if field not in self._indexes:
+            index = dict()
+            for values in self._objects:
+                if values.get(field) is not None:
+                    index.setdefault(to_text(values[field]), []).append(values)
+            self._indexes[field] = index
+        return self._indexes[field]
+
+    def _candidates(self, kwargs):
+        for field in INDEXED_FIELDS:
+            value = kwargs.get(field)
+            if value is None or isinstance(value, dict):
+                continue
+            index = self._get_index(field)
+            wanted = value if isinstance(value, list) else [value]
+            return list(chain.from_iterable(index.get(to_text(v), []) for v in wanted))
+        return self._objects
+
+    def _record(self, values):
+        return NetboxSnapshotRecord(_strip_urls(values), self.api, self)
+
+    def _match_value(self, key, current, value):
+        if key == "address":
+            current_ip = _ip_interface(current)
+            wanted_ip = _ip_interface(value)
+            return bool(current_ip and wanted_ip and current_ip.ip == wanted_ip.ip)
+        elif isinstance(current, dict):
+            candidates = [
+                current.get(field) for field in ("id", "value", "slug", "name", "label")
+            ]
+        else:
+            candidates = [current]
+        return any(
+            candidate is not None and to_text(candidate) == to_text(value)
+            for candidate in candidates
+        )
+
+    def _within(self, values, parent):
+        if parent is None:
+            return False
+        if values.get("address"):
+            address = _ip_interface(values["address"])
+            return address is not None and address.ip in parent
+        network = _ip_network(values.get("prefix"))
+        return (
+            network is not None
+            and network.version == parent.version
+            and network.subnet_of(parent)
+        )
+
+    def _match(self, values, key, value):
+        wanted = value if isinstance(value, list) else [value]
+        if key == "q":
+            return any(
+                to_text(v).lower() in to_text(values.get(field) or "").lower()
+                for field in SEARCH_FIELDS
+                for v in wanted
+            )
+        elif key == "parent":
+            return any(self._within(values, _ip_network(v)) for v in wanted)
+        elif key.endswith("_id") and key[:-3] in values:
+            current = _nested_id(values[key[:-3]])
+            return any(to_text(current) == to_text(v) for v in wanted)
+        elif key not in values:
+            return True
+        return any(self._match_value(key, values[key], v) for v in wanted)
+
+    def filter(self, *args, **kwargs):
+        return [
+            self._record(values)
+            for values in self._candidates(kwargs)
+            if all(self._match(values, k, v) for k, v in kwargs.items())
+        ]
+
+    def all(self):
+        return [self._record(values) for values in self._objects]
+
+    def get(self, *args, **kwargs):
+        if args:
+            kwargs["id"] = args[0]
+        results = self.filter(**kwargs)
+        if len(results) > 1:
+            raise ValueError(
+                "get() returned more than one result. Check that the kwarg(s) passed "
+                "are valid for this endpoint or use filter() or all() instead."
+            )
+        return results[0] if results else None
+
+    def choices(self):
+        return self._choices
+
+
+class NetboxSnapshotApp(object):
+    def __init__(self, api, name):
+        self.api = api
+        self.name = name
+
+    def __getattr__(self, name):
+        return self.api._get_endpoint(self.name, name)
+
+
+class NetboxSnapshotApi(object):
+    """
+    Read only stand-in for pynetbox.api answering every read from a snapshot written by
+    netbox_export, so check mode does not send a single request to Netbox
+    :params snapshot (dict): The loaded snapshot
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.base_url = "%s/api" % (snapshot["netbox_url"].rstrip("/"))
+        self.version = snapshot["version"]
+        self.token = None
+        self.http_session = None
+        self._endpoints = dict()
+
+    @classmethod
+    def load(cls, path):
+        """
+        :returns api (NetboxSnapshotApi): The snapshot stored at path
+        :params path (str): Path of the snapshot written by netbox_export
+        """
+        with open(path, "r") as f:
+            snapshot = json.load(f)
+        if snapshot.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(
+                "unsupported snapshot format %s" % (snapshot.get("format"))
+            )
+        return cls(snapshot)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return NetboxSnapshotApp(self, name)
+
+    def _get_endpoint(self, app, name):
+        if (app, name) not in self._endpoints:
+            self._endpoints[(app, name)] = NetboxSnapshotEndpoint(self, app, name)
+        return self._endpoints[(app, name)]
+
+    def _same_vrf(self, values, prefix):
+        return _nested_id(values.get("vrf")) == _nested_id(getattr(prefix, "vrf", None))
+
+    def available_ips(self, prefix):
+        """
+        :returns available_ips (list): The first free address of the prefix, or an empty list
+        :params prefix (NetboxSnapshotRecord): The prefix
+        """
+        network = _ip_network(prefix.prefix)
+        used = set()
+        for values in self.snapshot["objects"].get("ipam", {}).get("ip_addresses", []):
+            address = _ip_interface(values.get("address"))
+            if address and address.ip in network and self._same_vrf(values, prefix):
+                used.add(address.ip)
+
+        for host in network.hosts() if network.num_addresses > 2 else network:
+            if host not in used:
+                return [{"address": "%s/%s" % (host, network.prefixlen)}]
+        return []
+
+    def available_prefixes(self, prefix):
+        """
+        :returns available_prefixes (list): The free networks of the prefix
+        :params prefix (NetboxSnapshotRecord): The prefix
+        """
+        network = _ip_network(prefix.prefix)
+        children = list()
+        for values in self.snapshot["objects"].get("ipam", {}).get("prefixes", []):
+            child = _ip_network(values.get("prefix"))
+            if (
+                child
+                and child.version == network.version
+                and child != network
+                and child.subnet_of(network)
+                and self._same_vrf(values, prefix)
+            ):
+                children.append(child)
+
+        available = [network]
+        for child in ipaddress.collapse_addresses(children):
+            remaining = list()
+            for free in available:
+                if child.subnet_of(free):
+                    remaining.extend(free.address_exclude(child))
+                else:
+                    remaining.append(free)
+            available = remaining
+        return [{"prefix": to_text(free)} for free in sorted(available)]
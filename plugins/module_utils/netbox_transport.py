@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Import necessary packages
+import traceback
+
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+
+REQUESTS_IMP_ERR = None
+try:
+    import requests
+    from requests.adapters import BaseAdapter, HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+    from urllib3.util.retry import Retry
+
+    HAS_REQUESTS = True
+except ImportError:
+    REQUESTS_IMP_ERR = traceback.format_exc()
+    BaseAdapter = HTTPAdapter = Retry = object
+    HAS_REQUESTS = False
+
+# Responses that are retried, honoring the Retry-After header sent with them
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+class NetboxRetry(Retry):
+    """
+    Retries idempotent requests on RETRY_STATUS_CODES with an exponential backoff.
+    POST requests are only retried when rate limited as Netbox has not processed them.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST" and status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class NetboxHTTPAdapter(HTTPAdapter):
+    """Pooled adapter that applies a default timeout to every request"""
+
+    def __init__(self, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class NetboxConnectionAdapter(BaseAdapter):
+    """
+    Sends the requests through the persistent connection of the netbox httpapi plugin, which
+    holds the session to Netbox. Only the path and query string of the URL built by pynetbox
+    are kept, the host is the host of the connection
+    :params connection (Connection): Connection to the socket of the persistent connection
+    """
+
+    def __init__(self, connection):
+        super().__init__()
+        self.connection = connection
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        path = url.path
+        if url.query:
+            path = "%s?%s" % (path, url.query)
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        # The connection authenticates the requests with its own token
+        headers = dict(
+            (k, v) for k, v in request.headers.items() if k.lower() != "authorization"
+        )
+        result = self.connection.send_request(
+            body, path=path, method=request.method, headers=headers
+        )
+
+        response = requests.Response()
+        response.status_code = result["status_code"]
+        response.reason = result["reason"]
+        response.headers = CaseInsensitiveDict(result["headers"])
+        response._content = to_bytes(result["text"])
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def build_connection_session(connection):
+    """
+    Builds the session used by pynetbox when the module runs with the netbox httpapi connection
+    :returns session (requests.Session): Session sending every request through the connection
+    :params connection (Connection): Connection to the socket of the persistent connection
+    """
+    adapter = NetboxConnectionAdapter(connection)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def build_http_session(timeout=60, retries=3, backoff_factor=0.5, pool_size=10):
+    """
+    Builds the keep-alive session used for every request sent to Netbox by pynetbox
+    :returns session (requests.Session): Session with the pooled, retrying adapter mounted
+    :params timeout (int): Seconds to wait for Netbox to respond to a request
+    :params retries (int): Number of times a failed request is retried
+    :params backoff_factor (float): Sleeps backoff_factor * (2 ** (retry - 1)) seconds between retries
+    :params pool_size (int): Number of connections kept alive to Netbox
+    """
+    allowed_methods = getattr(Retry, "DEFAULT_ALLOWED_METHODS", None)
+    if allowed_methods is None:
+        # urllib3 < 1.26
+        retry_methods = dict(
+            method_whitelist=Retry.DEFAULT_METHOD_WHITELIST.union(["PATCH"])
+        )
+    else:
+        retry_methods = dict(allowed_methods=allowed_methods.union(["PATCH"]))
+
+    retry = NetboxRetry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+        **retry_methods
+    )
+    adapter = NetboxHTTPAdapter(
+        timeout=timeout,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    # requests already keeps connections alive, make sure responses are compressed as well
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
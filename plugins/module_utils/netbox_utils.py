@@ -7,24 +7,142 @@ __metaclass__ = type
 
 # Import necessary packages
 import traceback
+import hashlib
+import os
 import re
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from importlib.util import find_spec
 from itertools import chain
-from ansible.module_utils.compat import ipaddress
 from ansible.module_utils._text import to_text
 
 # from ._text import to_native
 from ansible.module_utils._text import to_native
 from ansible.module_utils.common.collections import is_iterable
-from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib, env_fallback
+from ansible.module_utils.connection import Connection
+from ansible.module_utils.six import string_types
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_cache import (
+        NetboxCache,
+        NetboxConnectionCache,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_cache import NetboxCache, NetboxConnectionCache
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_choices import (
+        NETBOX_CHOICES,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_choices import NETBOX_CHOICES
 
-PYNETBOX_IMP_ERR = None
 try:
-    import pynetbox
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_registry import (
+        NetboxRegistry,
+        SCHEMA_PATHS,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_registry import NetboxRegistry, SCHEMA_PATHS
 
-    HAS_PYNETBOX = True
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_journal import (
+        NetboxJournal,
+    )
 except ImportError:
-    PYNETBOX_IMP_ERR = traceback.format_exc()
-    HAS_PYNETBOX = False
+    import sys
+
+    sys.path.append(".")
+    from netbox_journal import NetboxJournal
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientApi,
+        NetboxClientEndpoint,
+        NetboxClientError,
+        NetboxClientRecord,
+        NetboxClientSession,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append(".")
+    from netbox_client import (
+        NetboxClientApi,
+        NetboxClientEndpoint,
+        NetboxClientError,
+        NetboxClientRecord,
+        NetboxClientSession,
+    )
+
+# pynetbox, and requests with it, are only imported by the modules talking to Netbox through
+# pynetbox, see import_pynetbox
+PYNETBOX_IMP_ERR = None
+HAS_PYNETBOX = find_spec("pynetbox") is not None
+
+
+def import_pynetbox():
+    """
+    :returns pynetbox (module): pynetbox, imported on first use, or None if it is not installed
+    """
+    global PYNETBOX_IMP_ERR
+    try:
+        import pynetbox
+    except ImportError:
+        PYNETBOX_IMP_ERR = traceback.format_exc()
+        return None
+    return pynetbox
+
+
+def request_errors():
+    """Evaluated when an error is raised, the errors of pynetbox can only be raised once it
+    was imported
+    :returns errors (tuple): Errors raised when Netbox rejects a request through either client
+    """
+    pynetbox = sys.modules.get("pynetbox")
+    if pynetbox is None:
+        return (NetboxClientError,)
+    return (pynetbox.RequestError, NetboxClientError)
+
+
+def allocation_errors():
+    """Evaluated when an error is raised, like request_errors
+    :returns errors (tuple): Errors raised by pynetbox when Netbox has no room left within the
+    prefix for the object posted to its available-ips or available-prefixes
+    """
+    pynetbox = sys.modules.get("pynetbox")
+    if pynetbox is None:
+        return ()
+    return (pynetbox.AllocationError,)
+
+
+def is_api_endpoint(nb_endpoint):
+    """
+    :returns is_api_endpoint (bool): Whether the endpoint reads from the API of Netbox, rather
+    than from a snapshot
+    :params nb_endpoint (obj): Endpoint of pynetbox, NetboxClientApi or NetboxSnapshotApi
+    """
+    if isinstance(nb_endpoint, NetboxClientEndpoint):
+        return True
+    pynetbox = sys.modules.get("pynetbox")
+    return pynetbox is not None and isinstance(
+        nb_endpoint, pynetbox.core.endpoint.Endpoint
+    )
+
 
 # Used to map endpoints to applications dynamically
 API_APPS_ENDPOINTS = dict(
@@ -62,6 +180,13 @@ API_APPS_ENDPOINTS = dict(
     virtualization=["cluster_groups", "cluster_types", "clusters", "virtual_machines"],
 )
 
+# Application of every endpoint, built once from API_APPS_ENDPOINTS
+ENDPOINT_APPS = dict(
+    (endpoint, app)
+    for app, endpoints in API_APPS_ENDPOINTS.items()
+    for endpoint in endpoints
+)
+
 # Used to normalize data for the respective query types used to find endpoints
 QUERY_TYPES = dict(
     circuit="cid",
@@ -241,6 +366,12 @@ QUERY_PARAMS_IDS = set(
     ]
 )
 
+# Exact match fields that Netbox accepts multiple values for, used to resolve lists of objects in one request
+BATCH_QUERY_FIELDS = ("name", "slug", "cid")
+
+# First Netbox version accepting multiple values for every exact match filter
+MULTI_VALUE_FILTER_VERSION = 2.7
+
 REQUIRED_ID_FIND = {
     "circuits": set(["status"]),
     "devices": set(["status", "face"]),
@@ -255,6 +386,12 @@ REQUIRED_ID_FIND = {
     "vlans": set(["status"]),
 }
 
+# Choice fields compared by their value regardless of case or type, form_factor became type in 2.7
+CHOICE_FIELDS = set(chain.from_iterable(REQUIRED_ID_FIND.values())) | set(["type"])
+
+# List fields Netbox does not keep the order of, compared as sets
+SET_FIELDS = set(["tags", "tagged_vlans", "ports", "ipaddresses"])
+
 # This is used to map non-clashing keys to Netbox API compliant keys to prevent bad logic in code for similar keys but different modules
 CONVERT_KEYS = {
     "circuit_type": "type",
@@ -289,14 +426,111 @@ SLUG_REQUIRED = {
     "vlan_groups",
 }
 
+# Endpoints whose objects Netbox keeps unique on fields they are found with, so creating an
+# object that already exists is rejected instead of creating a duplicate, see assume_absent.
+# Devices for instance are found by name but only unique per site and tenant
+UNIQUE_ENDPOINTS = {
+    "circuit_terminations",
+    "circuit_types",
+    "cluster_groups",
+    "cluster_types",
+    "clusters",
+    "device_bays",
+    "device_roles",
+    "interfaces",
+    "manufacturers",
+    "platforms",
+    "providers",
+    "rack_roles",
+    "regions",
+    "rirs",
+    "roles",
+    "sites",
+    "tenant_groups",
+    "tenants",
+}
+
+# Errors returned by Netbox when the object being created already exists
+UNIQUE_ERROR_RE = re.compile(r"already exists|must make a unique set")
+
 
 NETBOX_ARG_SPEC = dict(
     netbox_url=dict(type="str", required=True),
     netbox_token=dict(type="str", required=True, no_log=True),
     state=dict(required=False, default="present", choices=["present", "absent"]),
     validate_certs=dict(type="bool", default=True),
+    cache=dict(type="bool", default=False, fallback=(env_fallback, ["NETBOX_CACHE"])),
+    cache_timeout=dict(
+        type="int", default=3600, fallback=(env_fallback, ["NETBOX_CACHE_TIMEOUT"])
+    ),
+    cache_connection=dict(
+        type="path",
+        required=False,
+        fallback=(env_fallback, ["NETBOX_CACHE_CONNECTION"]),
+    ),
+    max_workers=dict(type="int", default=4),
+    netbox_version=dict(type="str", required=False),
+    timeout=dict(type="int", default=60),
+    retries=dict(type="int", default=3),
+    backoff_factor=dict(type="float", default=0.5),
+    pool_size=dict(type="int", default=10),
+    snapshot=dict(
+        type="path", required=False, fallback=(env_fallback, ["NETBOX_SNAPSHOT"])
+    ),
+    return_mode=dict(
+        type="str",
+        default="full",
+        choices=["id", "brief", "full"],
+        fallback=(env_fallback, ["NETBOX_RETURN_MODE"]),
+    ),
+    return_fields=dict(type="list", elements="str", required=False),
+    journal=dict(
+        type="path", required=False, fallback=(env_fallback, ["NETBOX_JOURNAL"])
+    ),
+    assume_absent=dict(
+        type="bool", default=False, fallback=(env_fallback, ["NETBOX_ASSUME_ABSENT"])
+    ),
+    fingerprint=dict(
+        type="bool", default=False, fallback=(env_fallback, ["NETBOX_FINGERPRINT"])
+    ),
+    proxy=dict(type="bool", default=False, fallback=(env_fallback, ["NETBOX_PROXY"])),
+    proxy_ttl=dict(
+        type="int", default=60, fallback=(env_fallback, ["NETBOX_PROXY_TTL"])
+    ),
 )
 
+# Fields of the nested (brief) representation of objects, kept by return_mode brief
+BRIEF_FIELDS = (
+    "id",
+    "url",
+    "name",
+    "slug",
+    "display_name",
+    "model",
+    "cid",
+    "address",
+    "prefix",
+    "vid",
+    "family",
+)
+
+# Seconds the detected Netbox version is cached for, kept short to pick up upgrades quickly
+VERSION_CACHE_TIMEOUT = 300
+
+# Seconds the endpoint registry is cached for, it is stored per version so upgrades get a new one
+REGISTRY_CACHE_TIMEOUT = 604800
+
+# Seconds a fingerprint is kept for, every fingerprint is validated against Netbox before use
+FINGERPRINT_TIMEOUT = 604800
+
+
+class NetboxDeferredError(Exception):
+    """Raised instead of failing the module when an error happens within a worker thread"""
+
+    def __init__(self, msg):
+        super().__init__(msg)
+        self.msg = msg
+
 
 class NetboxModule(object):
     """
@@ -307,14 +541,32 @@ class NetboxModule(object):
     :params nb_client (obj): pynetbox.api object passed in (not required)
     """
 
+    # Set by enable_shared_state when the modules run in-process, see plugins/action/netbox.py
+    _shared_state = None
+    # Client built to talk to Netbox, pynetbox.api when None. Module classes set it to
+    # NetboxClientApi to skip importing pynetbox and building its records on every task
+    api_class = None
+
     def __init__(self, module, endpoint, nb_client=None):
         self.module = module
         self.state = self.module.params["state"]
         self.check_mode = self.module.check_mode
         self.endpoint = endpoint
         self.version = None
-
-        if not HAS_PYNETBOX:
+        self.max_workers = self.module.params.get("max_workers") or 1
+        self._thread_state = threading.local()
+        self._query_param_ids = dict()
+        # Responses of the reads sent by this module run, see _nb_read
+        self._reads = dict()
+        self._reads_in_flight = dict()
+        self._reads_lock = threading.Lock()
+        self.read_stats = {"requests": 0, "coalesced": 0}
+        # Key and hash of the user defined data, see _get_fingerprint
+        self._fingerprint = None
+        # URL of the caching proxy the requests are sent through, see _start_proxy
+        self.proxy_url = None
+
+        if self.api_class is None and import_pynetbox() is None:
             self.module.fail_json(
                 msg=missing_required_lib("pynetbox"), exception=PYNETBOX_IMP_ERR
             )
@@ -322,25 +574,351 @@ class NetboxModule(object):
         url = self.module.params["netbox_url"]
         token = self.module.params["netbox_token"]
         ssl_verify = self.module.params["validate_certs"]
+        # Check mode reads everything from the snapshot instead of Netbox when one is passed in
+        snapshot = self.module.params.get("snapshot") if self.check_mode else None
 
-        # Attempt to initiate connection to Netbox
-        if nb_client is None:
-            self.nb = self._connect_netbox_api(url, token, ssl_verify)
+        # Deferred writes are journaled without a single request to Netbox, see netbox_flush
+        deferred_items = self._get_deferred_items()
+        if deferred_items is not None:
+            self._queue_writes(deferred_items)
+            return
+
+        shared_state = self._get_shared_state(
+            url, token, ssl_verify, nb_client, snapshot
+        )
+        self._object_ids = shared_state["object_ids"]
+        self._choices = shared_state["choices"]
+        self._choices_lock = shared_state["choices_lock"]
+        self.registry = None
+        # Lookup skipped by _find_existing_object, sent if the object turns out to exist
+        self._skipped_lookup = None
+
+        # Requests go through the netbox httpapi connection when the module runs with it
+        socket_path = getattr(self.module, "_socket_path", None)
+        if isinstance(socket_path, string_types) and not snapshot:
+            self.connection = Connection(socket_path)
+        else:
+            self.connection = None
+
+        if self.connection:
+            # The connection holds the cache for the lifetime of the play
+            self.cache = NetboxConnectionCache(
+                self.connection, self.module.params.get("cache_timeout", 3600)
+            )
+        # Opt-in cache of resolved IDs shared between tasks
+        elif self.module.params.get("cache") and not snapshot:
+            self.cache = NetboxCache(
+                self.module.params.get("cache_connection"),
+                url,
+                self.module.params.get("cache_timeout", 3600),
+            )
         else:
+            self.cache = None
+
+        # Opt-in store of the data last applied per object, see _get_fingerprint
+        if self.module.params.get("fingerprint") and not snapshot:
+            self.fingerprints = NetboxCache(
+                self.module.params.get("cache_connection"), url, FINGERPRINT_TIMEOUT
+            )
+        else:
+            self.fingerprints = None
+
+        if self.module.params.get("netbox_version"):
+            try:
+                self.version = float(self.module.params["netbox_version"])
+            except ValueError:
+                self.module.fail_json(
+                    msg="netbox_version must be in the format major.minor, ex. 2.7"
+                )
+
+        # Attempt to initiate connection to Netbox
+        if nb_client is not None:
             self.nb = nb_client
+        elif shared_state["nb"] is not None:
+            self.nb = shared_state["nb"]
+            self.version = self.version or shared_state["version"]
+        else:
+            if snapshot:
+                self.nb = self._load_snapshot(snapshot)
+            else:
+                self.nb = self._connect_netbox_api(url, token, ssl_verify)
+            shared_state["nb"] = self.nb
+            shared_state["version"] = self.version
+
+        # The registry is only worth its request when it can be cached between tasks
+        if self.cache:
+            if shared_state.get("registry") is None:
+                shared_state["registry"] = self._load_registry()
+            self.registry = shared_state["registry"]
+
+        if self.fingerprints:
+            self._fingerprint = self._get_fingerprint()
+            if self._fingerprint_matches():
+                return
+
+        # Modules managing a single object pass it within data
+        if "data" in self.module.params:
+            self.data = self._prepare_data(self.module.params["data"])
+
+    @classmethod
+    def enable_shared_state(cls):
+        """Shares the pynetbox client, Netbox version, resolved IDs and choices between every
+        module run within the current process against the same Netbox instance. Only used when
+        the modules run in-process, as a module process otherwise only runs a single module
+        """
+        if NetboxModule._shared_state is None:
+            NetboxModule._shared_state = dict()
+
+    def _get_deferred_items(self):
+        """
+        :returns items (list): User defined data of the objects whose writes are deferred to
+        netbox_flush, or None when the writes of this module run are sent right away
+        """
+        params = self.module.params
+        if (
+            not params.get("journal")
+            or self.check_mode
+            or self.state not in ("present", "absent")
+            or self.endpoint not in ENDPOINT_NAME_MAPPING
+            or params.get("first_available")
+        ):
+            return None
+
+        if "items" in params:
+            items = params["items"]
+        elif "data" in params:
+            items = [params["data"]]
+        else:
+            return None
+        items = [self._remove_arg_spec_default(item) for item in items]
+
+        if self.endpoint == "ip_addresses" and not all(
+            item.get("address") for item in items
+        ):
+            # Addresses assigned from a prefix depend on Netbox at the time the task runs
+            return None
+        if self.endpoint == "interfaces" and any(
+            "virtual_machine" in item for item in items
+        ):
+            # netbox_flush applies interfaces to the interfaces of devices
+            return None
+        return items
+
+    def _queue_writes(self, items):
+        """Appends the objects to the journal instead of writing them to Netbox. IDs and choices
+        are resolved by netbox_flush, as the objects may refer to objects queued before them
+        :params items (list): User defined data of the objects
+        """
+        journal = NetboxJournal(
+            self.module.params["journal"], self.module.params["netbox_url"]
+        )
+        try:
+            entry_ids = journal.append(
+                [
+                    {"endpoint": self.endpoint, "state": self.state, "data": item}
+                    for item in items
+                ]
+            )
+        except (IOError, OSError) as e:
+            self.module.fail_json(
+                msg="Failed to queue writes in %s: %s"
+                % (self.module.params["journal"], to_native(e))
+            )
 
-        # These methods will normalize the regular data
-        cleaned_data = self._remove_arg_spec_default(module.params["data"])
+        self.result = {
+            "changed": True,
+            "msg": "%s %s queued in %s"
+            % (len(entry_ids), self.endpoint, self.module.params["journal"]),
+            "journal_entries": entry_ids,
+        }
+        self._exit_json()
+
+    def _get_fingerprint(self):
+        """Fingerprints are computed from the user defined data before any of it is resolved,
+        so an unchanged object is found without resolving its IDs
+        :returns fingerprint (tuple): Key of the object within the fingerprint store and hash of
+        its normalized data, or None when the object is not identified by its data alone
+        """
+        params = self.module.params
+        endpoint_name = ENDPOINT_NAME_MAPPING.get(self.endpoint)
+        if (
+            endpoint_name is None
+            or not params.get("data")
+            or params.get("first_available")
+        ):
+            return None
+
+        data = self._normalize_data(
+            self._remove_arg_spec_default(deepcopy(params["data"]))
+        )
+        if self.endpoint == "ip_addresses" and not data.get("address"):
+            # Addresses assigned from a prefix may be a different address every run
+            return None
+        identity = dict(
+            (k, v)
+            for k, v in data.items()
+            if k in ALLOWED_QUERY_PARAMS.get(endpoint_name, ())
+        )
+        if not identity:
+            return None
+
+        query_params = params.get("query_params")
+        key = [identity, query_params]
+        digest = hashlib.sha1(
+            json.dumps([data, query_params], sort_keys=True, default=str).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        return key, digest
+
+    def _fingerprint_matches(self):
+        """Exits the module unchanged when the data matches the data last applied to the object
+        and the object has not been modified since, which takes a single request
+        :returns matches (bool): Whether the module exited
+        """
+        if self._fingerprint is None or self.state != "present":
+            return False
+
+        key, digest = self._fingerprint
+        entry = self.fingerprints.get("%s.fingerprints" % (self.endpoint), key)
+        if not entry or entry["hash"] != digest:
+            return False
+
+        app = self._find_app(self.endpoint)
+        nb_endpoint = getattr(getattr(self.nb, app), self.endpoint)
+        nb_object = self._nb_read(nb_endpoint, "get", {"id": entry["id"]})
+        if not nb_object or to_text(nb_object.last_updated) != entry["last_updated"]:
+            return False
+
+        endpoint_name = ENDPOINT_NAME_MAPPING[self.endpoint]
+        self._fingerprint = None
+        self.result = {
+            "changed": False,
+            "msg": "%s %s already exists" % (endpoint_name, to_text(nb_object)),
+            endpoint_name: self._serialize_object(nb_object),
+        }
+        self._exit_json()
+        return True
+
+    def _record_fingerprint(self):
+        """Stores the fingerprint of the object applied by the module run, or forgets it once
+        the object is deleted
+        """
+        key, digest = self._fingerprint
+        nb_object = getattr(self, "nb_object", None)
+        entry = None
+        if self.state == "present" and nb_object:
+            try:
+                serialized_object = nb_object.serialize()
+            except AttributeError:
+                serialized_object = nb_object
+            if serialized_object.get("last_updated"):
+                entry = {
+                    "hash": digest,
+                    "id": serialized_object["id"],
+                    "last_updated": to_text(serialized_object["last_updated"]),
+                }
+        self.fingerprints.set("%s.fingerprints" % (self.endpoint), key, entry)
+
+    def _get_shared_state(self, url, token, ssl_verify, nb_client, snapshot=None):
+        """
+        :returns state (dict): The state shared with previous module runs against the Netbox
+        instance (or snapshot), or state private to this module run when sharing is disabled
+        """
+        state = None
+        shared_state = NetboxModule._shared_state
+        state_key = (os.getpid(), url.rstrip("/"), token, ssl_verify, snapshot)
+        if shared_state is not None and nb_client is None:
+            state = shared_state.get(state_key)
+
+        if state is None:
+            state = {
+                "nb": None,
+                "version": None,
+                "object_ids": dict(),
+                "choices": dict(),
+                "choices_lock": threading.Lock(),
+            }
+            if shared_state is not None and nb_client is None:
+                # Connections must not be shared with forked processes
+                for key in [k for k in shared_state if k[0] != os.getpid()]:
+                    del shared_state[key]
+                shared_state[state_key] = state
+
+        return state
+
+    def _prepare_data(self, data):
+        """Normalizes the user defined data of an object and resolves it to IDs and choice values
+        :returns data (dict): Data ready to be sent to Netbox
+        :params data (dict): User defined data of the object
+        """
+        cleaned_data = self._remove_arg_spec_default(data)
+        if self.state == "absent":
+            cleaned_data = self._remove_non_identity_keys(cleaned_data)
         norm_data = self._normalize_data(cleaned_data)
         choices_data = self._change_choices_id(self.endpoint, norm_data)
         data = self._find_ids(choices_data)
-        self.data = self._convert_identical_keys(data)
+        return self._convert_identical_keys(data)
+
+    def _remove_non_identity_keys(self, data):
+        """Used when state is absent, where only the keys used to find the object matter.
+        Removes the keys that would otherwise have to be resolved to an ID or choice value
+        without being part of the object query params, as defined by ALLOWED_QUERY_PARAMS
+        :returns data (dict): data without the keys that do not identify the object
+        :params data (dict): User defined data passed into the module
+        """
+        endpoint_name = ENDPOINT_NAME_MAPPING.get(self.endpoint)
+        identity_keys = set(ALLOWED_QUERY_PARAMS.get(endpoint_name, ()))
+        if self.endpoint == "ip_addresses":
+            # IP addresses can be found through their prefix
+            identity_keys.update(ALLOWED_QUERY_PARAMS["prefix"])
+
+        choices = REQUIRED_ID_FIND.get(self.endpoint, set())
+        return dict(
+            (k, v)
+            for k, v in data.items()
+            if k in identity_keys
+            or isinstance(v, int)
+            or (k not in CONVERT_TO_ID and k not in choices)
+        )
 
     def _connect_netbox_api(self, url, token, ssl_verify):
         try:
-            nb = pynetbox.api(url, token=token, ssl_verify=ssl_verify)
+            from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_transport import (
+                build_http_session,
+                build_connection_session,
+            )
+        except ImportError:
+            from netbox_transport import build_http_session, build_connection_session
+
+        if self.module.params.get("proxy") and not self.connection:
+            url = self.proxy_url = self._start_proxy(url, ssl_verify)
+
+        try:
+            if self.api_class is not None:
+                nb = self.api_class(url, token=token, ssl_verify=ssl_verify)
+            else:
+                nb = import_pynetbox().api(url, token=token, ssl_verify=ssl_verify)
+            if self.connection:
+                nb.http_session = build_connection_session(self.connection)
+            elif isinstance(nb, NetboxClientApi):
+                nb.http_session = NetboxClientSession(
+                    timeout=self.module.params.get("timeout", 60),
+                    retries=self.module.params.get("retries", 3),
+                    backoff_factor=self.module.params.get("backoff_factor", 0.5),
+                    verify=ssl_verify,
+                    pool_size=self.module.params.get("pool_size", 10),
+                )
+            else:
+                nb.http_session = build_http_session(
+                    timeout=self.module.params.get("timeout", 60),
+                    retries=self.module.params.get("retries", 3),
+                    backoff_factor=self.module.params.get("backoff_factor", 0.5),
+                    pool_size=self.module.params.get("pool_size", 10),
+                )
             try:
-                self.version = float(nb.version)
+                if self.version is None:
+                    self.version = self._get_netbox_version(nb)
             except AttributeError:
                 self.module.fail_json(msg="Must have pynetbox >=4.1.0")
             except Exception:
@@ -351,10 +929,280 @@ class NetboxModule(object):
         except Exception:
             self.module.fail_json(msg="Failed to establish connection to Netbox API")
 
-    def _nb_endpoint_get(self, nb_endpoint, query_params, search_item):
+    def _start_proxy(self, url, ssl_verify):
+        """Starts the caching proxy shared by the forks unless it is already running
+        :returns proxy_url (str): URL of the proxy to connect to instead of url
+        :params url (str): URL of Netbox
+        :params ssl_verify (bool): Whether the proxy verifies the certificate of Netbox
+        """
+        try:
+            from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy import (
+                NetboxProxyError,
+                start_proxy,
+            )
+        except ImportError:
+            from netbox_proxy import NetboxProxyError, start_proxy
+
         try:
-            response = nb_endpoint.get(**query_params)
-        except pynetbox.RequestError as e:
+            return start_proxy(
+                url,
+                validate_certs=ssl_verify,
+                ttl=self.module.params.get("proxy_ttl", 60),
+                cache_connection=self.module.params.get("cache_connection"),
+                timeout=self.module.params.get("timeout", 60),
+                retries=self.module.params.get("retries", 3),
+                backoff_factor=self.module.params.get("backoff_factor", 0.5),
+            )
+        except (NetboxProxyError, IOError, OSError) as e:
+            self.module.fail_json(
+                msg="Failed to start the Netbox proxy: %s" % (to_native(e))
+            )
+
+    def _load_snapshot(self, path):
+        """Loads the snapshot written by netbox_export, used in place of the pynetbox client
+        :returns nb (NetboxSnapshotApi): Read only client answering from the snapshot
+        :params path (str): Path of the snapshot
+        """
+        try:
+            from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_snapshot import (
+                NetboxSnapshotApi,
+            )
+        except ImportError:
+            from netbox_snapshot import NetboxSnapshotApi
+
+        try:
+            nb = NetboxSnapshotApi.load(path)
+        except (IOError, OSError, KeyError, ValueError) as e:
+            self.module.fail_json(
+                msg="Failed to load snapshot %s: %s" % (path, to_native(e))
+            )
+        if self.version is None:
+            self.version = float(nb.version)
+        return nb
+
+    def _get_netbox_version(self, nb):
+        """Detects the version of Netbox, which costs a request to the API unless a version
+        detected by a previous task is still cached
+        :returns version (float): Netbox version. ex. 2.7
+        :params nb (obj): pynetbox.api object
+        """
+        if self.cache:
+            version = self.cache.get("version", "version")
+            if version is not None:
+                return version
+
+        if self.connection:
+            # pynetbox < 5.0 reads the version without its session, bypassing the connection
+            response = nb.http_session.get(
+                "%s/" % (nb.base_url), headers={"Accept": "application/json"}
+            )
+            version = float(response.headers["API-Version"])
+        else:
+            version = float(nb.version)
+        if self.cache:
+            self.cache.set(
+                "version",
+                "version",
+                version,
+                timeout=min(VERSION_CACHE_TIMEOUT, self.cache.timeout),
+            )
+        return version
+
+    def _load_registry(self):
+        """Builds the endpoint registry from the OpenAPI schema of Netbox, which is only read
+        once per Netbox version while the cache is valid
+        :returns registry (NetboxRegistry): The registry or None if the schema is unavailable,
+        in which case the hand maintained tables are used on their own
+        """
+        endpoints = self.cache.get("registry", self.version)
+        if endpoints is None:
+            schema = self._fetch_schema()
+            if schema is None:
+                # Retried once the version is detected again rather than on every task
+                self.cache.set(
+                    "registry", self.version, {}, timeout=VERSION_CACHE_TIMEOUT
+                )
+                return None
+            endpoints = NetboxRegistry.from_schema(schema).endpoints
+            self.cache.set(
+                "registry", self.version, endpoints, timeout=REGISTRY_CACHE_TIMEOUT
+            )
+        elif not endpoints:
+            return None
+        return NetboxRegistry(endpoints)
+
+    def _fetch_schema(self):
+        """
+        :returns schema (dict): The OpenAPI schema of Netbox or None if it can not be read
+        """
+        base_url = self.nb.base_url[: -len("/api")]
+        for path in SCHEMA_PATHS:
+            try:
+                response = self.nb.http_session.get(
+                    base_url + path,
+                    headers=self._build_headers(),
+                    verify=getattr(self.nb, "ssl_verify", True),
+                )
+                if response.ok:
+                    return response.json()
+            except Exception:
+                pass
+        return None
+
+    def _validate_query_params(self, nb_endpoint, query_params):
+        """Fails before the read is sent when Netbox would ignore some of the query params,
+        which makes the read match more objects than intended
+        :params nb_endpoint (pynetbox endpoint object): The endpoint to read from
+        :params query_params (dict): Query params of the read
+        """
+        app, endpoint = nb_endpoint.url.rstrip("/").split("/")[-2:]
+        endpoint = endpoint.replace("-", "_")
+        invalid = self.registry.invalid_query_params(app, endpoint, query_params)
+        if invalid:
+            self._handle_errors(
+                msg="Netbox does not accept the %s filters of %s.%s"
+                % (", ".join(invalid), app, endpoint)
+            )
+
+    def _normalize_query_params(self, query_params):
+        """
+        :returns key (str): Query params as text that is identical for identical queries,
+        regardless of the order of the params or of the values of multi-value filters
+        """
+        normalized = dict()
+        for k, v in query_params.items():
+            if isinstance(v, (list, set, tuple)):
+                v = sorted(v, key=to_text)
+            normalized[k] = v
+        return json.dumps(normalized, sort_keys=True, default=str)
+
+    def _nb_read(self, nb_endpoint, method, query_params):
+        """Every read of an endpoint goes through here so identical reads within the module run
+        are only sent once. Concurrent identical reads wait for the read already in flight
+        :returns response: Response of the pynetbox method
+        :params nb_endpoint (pynetbox endpoint object): The endpoint to read from
+        :params method (str): get, get_brief (see _nb_brief_get) or filter
+        :params query_params (dict): Query params passed to the method
+        """
+        if self.registry is not None:
+            self._validate_query_params(nb_endpoint, query_params)
+
+        reads = self._reads.setdefault(nb_endpoint.name, dict())
+        key = (method, self._normalize_query_params(query_params))
+        # Identical reads of other endpoints must not wait for each other
+        flight_key = (nb_endpoint.name,) + key
+        while True:
+            with self._reads_lock:
+                if key in reads:
+                    self.read_stats["coalesced"] += 1
+                    return reads[key]
+                in_flight = self._reads_in_flight.get(flight_key)
+                if in_flight is None:
+                    in_flight = self._reads_in_flight[flight_key] = threading.Event()
+                    break
+            # Another thread is sending the same read, use its response unless it failed
+            in_flight.wait()
+
+        try:
+            with self._reads_lock:
+                self.read_stats["requests"] += 1
+            if method == "get_brief":
+                response = self._nb_brief_get(nb_endpoint, query_params)
+            else:
+                response = getattr(nb_endpoint, method)(**query_params)
+            if method == "filter":
+                response = list(response)
+            with self._reads_lock:
+                reads[key] = response
+        finally:
+            with self._reads_lock:
+                del self._reads_in_flight[flight_key]
+            in_flight.set()
+
+        return response
+
+    def _build_headers(self):
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Authorization": "Token %s" % (self.nb.token),
+        }
+
+    def _nb_endpoint_page(self, nb_endpoint, query_params, limit, offset=0):
+        """Reads a single page of the list view of an endpoint, pynetbox always reads every page
+        :returns tuple(count, objects): Number of objects matching the query params and the
+        objects within the page
+        :params nb_endpoint (pynetbox endpoint object): The endpoint to read from
+        :params query_params (dict): Query params of the read
+        :params limit (int): Size of the page
+        :params offset (int): Number of objects before the page
+        """
+        params = dict(query_params, limit=limit, offset=offset)
+        response = self.nb.http_session.get(
+            "%s/" % (nb_endpoint.url),
+            params=params,
+            headers=self._build_headers(),
+            verify=getattr(self.nb, "ssl_verify", True),
+        )
+        if not response.ok:
+            raise NetboxClientError(response)
+
+        page = response.json()
+        return_obj = nb_endpoint.return_obj
+        return (
+            page["count"],
+            [return_obj(values, self.nb, nb_endpoint) for values in page["results"]],
+        )
+
+    def _nb_brief_get(self, nb_endpoint, query_params):
+        """Finds an object when only its ID is required. Reads the brief representation of at
+        most two objects, enough to tell whether the query matches a single object
+        :returns object (pynetbox Record object): Brief object or None if it was not found
+        :raises ValueError: When more than one object matches, same as pynetbox get()
+        """
+        if not is_api_endpoint(nb_endpoint):
+            # Reads of a snapshot are answered locally
+            return nb_endpoint.get(**query_params)
+
+        count, nb_objects = self._nb_endpoint_page(
+            nb_endpoint, dict(query_params, brief=1), limit=2
+        )
+        if count > 1:
+            raise ValueError("get() returned more than one result")
+        return nb_objects[0] if nb_objects else None
+
+    def _nb_endpoint_last(self, nb_endpoint, query_params):
+        """
+        :returns object (pynetbox Record object): The last object matching the query params,
+        read with a page of one object instead of every object, or None if nothing matches
+        :params nb_endpoint (pynetbox endpoint object): The endpoint to read from
+        :params query_params (dict): Query params of the read
+        """
+        try:
+            if not is_api_endpoint(nb_endpoint):
+                nb_objects = list(nb_endpoint.filter(**query_params))
+                return nb_objects[-1] if nb_objects else None
+
+            count, nb_objects = self._nb_endpoint_page(nb_endpoint, query_params, 1)
+            if count > 1:
+                # Keeps the first object if objects were removed in between
+                nb_objects = (
+                    self._nb_endpoint_page(
+                        nb_endpoint, query_params, 1, offset=count - 1
+                    )[1]
+                    or nb_objects
+                )
+        except request_errors() as e:
+            self._handle_errors(msg=e.error)
+
+        return nb_objects[0] if nb_objects else None
+
+    def _nb_endpoint_get(self, nb_endpoint, query_params, search_item, brief=False):
+        try:
+            response = self._nb_read(
+                nb_endpoint, "get_brief" if brief else "get", query_params
+            )
+        except request_errors() as e:
             self._handle_errors(msg=e.error)
         except ValueError:
             self._handle_errors(
@@ -363,14 +1211,225 @@ class NetboxModule(object):
 
         return response
 
+    def _get_object_id(self, app, endpoint, query_params, search_item):
+        """Used when only the ID of an object is required, such as resolving user defined data
+        to IDs. Checks the IDs already resolved by this module and the cache (if enabled)
+        before querying Netbox
+        :returns id (int): ID of the object or None if it could not be found
+        :params app (str): The application the endpoint lives under
+        :params endpoint (str): The endpoint to query. ex. sites
+        :params query_params (dict): Query params used to find the object
+        :params search_item (str): Used for error messages
+        """
+        cache_key = [app, query_params]
+        memo_key = json.dumps(cache_key, sort_keys=True, default=str)
+        object_ids = self._object_ids.setdefault(endpoint, dict())
+        if memo_key in object_ids:
+            with self._reads_lock:
+                self.read_stats["coalesced"] += 1
+            return object_ids[memo_key]
+
+        if self.cache:
+            cached_id = self.cache.get(endpoint, cache_key)
+            if cached_id is not None:
+                object_ids[memo_key] = cached_id
+                return cached_id
+
+        nb_app = getattr(self.nb, app)
+        nb_endpoint = getattr(nb_app, endpoint)
+        result = self._nb_endpoint_get(
+            nb_endpoint, query_params, search_item, brief=True
+        )
+        if not result:
+            return None
+
+        object_ids[memo_key] = result.id
+        if self.cache:
+            self.cache.set(endpoint, cache_key, result.id)
+        return result.id
+
+    def _get_objects(self, nb_endpoint, queries, search_item, brief=False):
+        """Finds the object of each query of a list of queries against the same endpoint.
+        Queries that only differ by a field within BATCH_QUERY_FIELDS are resolved with a single
+        multi-value filter request and mapped back locally. Other queries, and on Netbox versions
+        without multi-value filters the queries left unresolved, fall back to _nb_endpoint_get
+        :returns objects (list): Objects in the same order as queries, None for objects not found
+        :params nb_endpoint (pynetbox endpoint object): The endpoint to query
+        :params queries (list): List of query params dicts
+        :params search_item (str): Used for error messages
+        :params brief (bool): Read the brief representation when only IDs are used
+        """
+        objects = [None] * len(queries)
+        batched = set()
+        batches = dict()
+        for index, query_params in enumerate(queries):
+            for field in BATCH_QUERY_FIELDS:
+                if isinstance(query_params.get(field), str):
+                    shared = dict((k, v) for k, v in query_params.items() if k != field)
+                    batch_key = (field, json.dumps(shared, sort_keys=True, default=str))
+                    batches.setdefault(batch_key, (field, shared, []))[2].append(index)
+                    break
+
+        for field, shared, indexes in batches.values():
+            if len(indexes) < 2:
+                continue
+
+            query_params = dict(shared)
+            query_params[field] = sorted(set(queries[i][field] for i in indexes))
+            if brief:
+                query_params["brief"] = 1
+            try:
+                results = self._nb_read(nb_endpoint, "filter", query_params)
+            except request_errors() as e:
+                self._handle_errors(msg=e.error)
+
+            found = dict()
+            for result in results:
+                found.setdefault(getattr(result, field, None), []).append(result)
+
+            for index in indexes:
+                matches = found.get(queries[index][field], [])
+                if len(matches) > 1:
+                    self._handle_errors(
+                        msg="More than one result returned for %s" % (search_item)
+                    )
+                elif matches:
+                    objects[index] = matches[0]
+                if self.version and self.version >= MULTI_VALUE_FILTER_VERSION:
+                    batched.add(index)
+
+        for index, query_params in enumerate(queries):
+            if objects[index] is None and index not in batched:
+                objects[index] = self._nb_endpoint_get(
+                    nb_endpoint, query_params, search_item, brief=brief
+                )
+
+        return objects
+
+    def _get_object_ids(self, app, endpoint, queries, search_item):
+        """Resolves a list of queries against the same endpoint with as few requests as possible,
+        see _get_objects
+        :returns ids (list): IDs in the same order as queries, None for objects not found
+        :params app (str): The application the endpoint lives under
+        :params endpoint (str): The endpoint to query. ex. vlans
+        :params queries (list): List of query params dicts
+        :params search_item (str): Used for error messages
+        """
+        ids = [None] * len(queries)
+        pending = list()
+        for index, query_params in enumerate(queries):
+            if self.cache:
+                ids[index] = self.cache.get(endpoint, [app, query_params])
+            if ids[index] is None:
+                pending.append(index)
+
+        nb_app = getattr(self.nb, app)
+        nb_endpoint = getattr(nb_app, endpoint)
+        nb_objects = self._get_objects(
+            nb_endpoint, [queries[i] for i in pending], search_item, brief=True
+        )
+        for index, nb_object in zip(pending, nb_objects):
+            if nb_object:
+                ids[index] = nb_object.id
+                if self.cache:
+                    self.cache.set(endpoint, [app, queries[index]], nb_object.id)
+
+        return ids
+
+    def _invalidate_cache(self):
+        """Drops cached IDs and reads of the module's endpoint after the endpoint has been
+        modified"""
+        self._object_ids.pop(self.endpoint, None)
+        # pynetbox names endpoints as within their URL
+        self._reads.pop(self.endpoint.replace("_", "-"), None)
+        if self.cache:
+            self.cache.invalidate(self.endpoint)
+
     def _handle_errors(self, msg):
         """
         Returns message and changed = False
         :params msg (str): Message indicating why there is no change
         """
         if msg:
+            if getattr(self._thread_state, "defer_errors", False):
+                raise NetboxDeferredError(msg)
             self.module.fail_json(msg=msg, changed=False)
 
+    def _run_deferring_errors(self, task):
+        self._thread_state.defer_errors = True
+        return task()
+
+    def _run_concurrently(self, tasks):
+        """Runs independent lookups within a thread pool bounded by max_workers. Errors raised
+        within the workers are reported from the calling thread in the order of the tasks
+        :returns results (list): Results of the tasks in the same order as tasks
+        :params tasks (list): Callables that do not take any arguments
+        """
+        if self.max_workers < 2 or len(tasks) < 2:
+            return [task() for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+            futures = [pool.submit(self._run_deferring_errors, task) for task in tasks]
+
+        results = list()
+        for future in futures:
+            try:
+                results.append(future.result())
+            except NetboxDeferredError as e:
+                self._handle_errors(msg=e.msg)
+                results.append(None)
+        return results
+
+    def _exit_json(self):
+        """Exits the module with self.result, adding the read counters when running with -vvv"""
+        if self._fingerprint is not None and not self.check_mode:
+            self._record_fingerprint()
+        if self.module._verbosity >= 3:
+            self.result["netbox_reads"] = dict(self.read_stats)
+            if self.proxy_url:
+                self.result["netbox_proxy"] = self._proxy_stats()
+        self.module.exit_json(**self.result)
+
+    def _proxy_stats(self):
+        """
+        :returns stats (dict): Hit rate and counters of the proxy shared by the forks
+        """
+        try:
+            from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy import (
+                proxy_stats,
+            )
+        except ImportError:
+            from netbox_proxy import proxy_stats
+
+        return proxy_stats(self.proxy_url)
+
+    def _serialize_object(self, nb_object):
+        """Serializes the object returned by the module, trimmed down to the fields requested
+        with return_fields or return_mode so large plays do not carry full objects around
+        :returns serialized_object (dict): The serialized object or None if there is no object
+        :params nb_object (pynetbox object or dict): The object managed by the module
+        """
+        try:
+            serialized_object = nb_object.serialize()
+        except AttributeError:
+            serialized_object = nb_object
+        if not isinstance(serialized_object, dict):
+            return serialized_object
+
+        return_fields = self.module.params.get("return_fields")
+        return_mode = self.module.params.get("return_mode") or "full"
+        if return_fields:
+            fields = set(return_fields)
+            fields.add("id")
+        elif return_mode == "id":
+            fields = set(["id"])
+        elif return_mode == "brief":
+            fields = set(BRIEF_FIELDS)
+        else:
+            return serialized_object
+
+        return dict((k, v) for k, v in serialized_object.items() if k in fields)
+
     def _build_diff(self, before=None, after=None):
         """Builds diff of before and after changes"""
         return {"before": before, "after": after}
@@ -386,7 +1445,7 @@ class NetboxModule(object):
         if self.version and self.version >= 2.7:
             if data.get("form_factor"):
                 data["type"] = data.pop("form_factor")
-        for key in data:
+        for key in list(data):
             if key in CONVERT_KEYS:
                 new_key = CONVERT_KEYS[key]
                 value = data.pop(key)
@@ -413,17 +1472,20 @@ class NetboxModule(object):
         """
         if isinstance(data.get(match), int):
             return data[match]
+        elif (
+            isinstance(data.get(match), str)
+            and (match, data[match]) in self._query_param_ids
+        ):
+            return self._query_param_ids[(match, data[match])]
         else:
             endpoint = CONVERT_TO_ID[match]
             app = self._find_app(endpoint)
-            nb_app = getattr(self.nb, app)
-            nb_endpoint = getattr(nb_app, endpoint)
 
             query_params = {QUERY_TYPES.get(match): data[match]}
-            result = self._nb_endpoint_get(nb_endpoint, query_params, match)
+            result = self._get_object_id(app, endpoint, query_params, match)
 
             if result:
-                return result.id
+                return result
             else:
                 return data
 
@@ -483,19 +1545,70 @@ class NetboxModule(object):
         query_dict = self._convert_identical_keys(query_dict)
         return query_dict
 
-    def _fetch_choice_value(self, search, endpoint):
+    def _build_choices_index(self, choices):
+        """
+        :returns index (dict): Maps the lowercase display name and value of each choice to its value
+        :params choices (iterable): (value, display_name) tuples of every field of an endpoint
+        """
+        index = dict()
+        for value, display_name in choices:
+            index.setdefault(display_name.lower(), value)
+            if isinstance(value, str):
+                index.setdefault(value, value)
+        return index
+
+    def _get_choices_index(self, endpoint, refresh=False):
+        """Finds the choices index of an endpoint from the bundled choices of the Netbox version,
+        the cache (if enabled) and lastly the choices of the endpoint itself
+        :returns index (dict): See _build_choices_index
+        :params endpoint (str): The endpoint the choices belong to
+        :params refresh (bool): Whether to query the choices of the endpoint unless this module
+        run already did, the bundled or cached choices may lack the choices added since
+        """
+        with self._choices_lock:
+            entry = self._choices.get(endpoint)
+            if entry is None or (refresh and not entry[1]):
+                entry = self._choices[endpoint] = self._load_choices_index(
+                    endpoint, refresh
+                )
+            return entry[0]
+
+    def _load_choices_index(self, endpoint, refresh=False):
+        """
+        :returns tuple(index, queried): The choices index and whether it was built from the
+        choices of the endpoint itself
+        """
+        index = None
+        bundled_choices = NETBOX_CHOICES.get(str(self.version), {}).get(endpoint)
+        cache_key = [self.version, endpoint]
+        if bundled_choices and not refresh:
+            index = self._build_choices_index(
+                chain.from_iterable(bundled_choices.values())
+            )
+        elif self.cache and not refresh:
+            index = self.cache.get("choices", cache_key)
+        if index is not None:
+            return index, False
+
         app = self._find_app(endpoint)
         nb_app = getattr(self.nb, app)
         nb_endpoint = getattr(nb_app, endpoint)
         endpoint_choices = nb_endpoint.choices()
+        index = self._build_choices_index(
+            (item["value"], item["display_name"])
+            for item in chain.from_iterable(endpoint_choices.values())
+        )
+        if self.cache:
+            self.cache.set("choices", cache_key, index)
+        return index, True
 
-        choices = [x for x in chain.from_iterable(endpoint_choices.values())]
-
-        for item in choices:
-            if item["display_name"].lower() == search.lower():
-                return item["value"]
-            elif item["value"] == search.lower():
-                return item["value"]
+    def _fetch_choice_value(self, search, endpoint):
+        choices = self._get_choices_index(endpoint)
+        if search.lower() not in choices:
+            # Choices added by a patch release or a plugin are missing from the bundled choices
+            choices = self._get_choices_index(endpoint, refresh=True)
+        if search.lower() in choices:
+            return choices[search.lower()]
         self._handle_errors(
             msg="%s was not found as a valid choice for %s" % (search, endpoint)
         )
@@ -508,70 +1621,130 @@ class NetboxModule(object):
         :params data (dict): User defined data passed into the module
         """
         if REQUIRED_ID_FIND.get(endpoint):
-            required_choices = REQUIRED_ID_FIND[endpoint]
-            for choice in required_choices:
-                if data.get(choice):
-                    if isinstance(data[choice], int):
-                        continue
-                    choice_value = self._fetch_choice_value(data[choice], endpoint)
-                    data[choice] = choice_value
+            required_choices = [
+                choice
+                for choice in REQUIRED_ID_FIND[endpoint]
+                if data.get(choice) and not isinstance(data[choice], int)
+            ]
+            tasks = [
+                partial(self._fetch_choice_value, data[choice], endpoint)
+                for choice in required_choices
+            ]
+            for choice, choice_value in zip(
+                required_choices, self._run_concurrently(tasks)
+            ):
+                data[choice] = choice_value
 
         return data
 
     def _find_app(self, endpoint):
         """Dynamically finds application of endpoint passed in using the
-        API_APPS_ENDPOINTS for mapping
+        API_APPS_ENDPOINTS for mapping, then the registry for endpoints missing from it
         :returns nb_app (str): The application the endpoint lives under
         :params endpoint (str): The endpoint requiring resolution to application
         """
-        for k, v in API_APPS_ENDPOINTS.items():
-            if endpoint in v:
-                nb_app = k
+        nb_app = ENDPOINT_APPS.get(endpoint)
+        if nb_app is None and self.registry is not None:
+            nb_app = self.registry.find_app(endpoint)
+        if nb_app is None:
+            self._handle_errors(msg="%s is not a known endpoint" % (endpoint))
         return nb_app
 
+    def _find_nested_query_params(self, data, keys):
+        """Finds the values within nested data that have to be resolved to IDs to build the
+        query params of their parent, as defined by ALLOWED_QUERY_PARAMS and QUERY_PARAMS_IDS
+        :returns nested_params (list): Unique (match, value) tuples
+        :params data (dict): User defined data passed into the module
+        :params keys (list): Keys within data that have a dict or list value
+        """
+        nested_params = list()
+        for k in keys:
+            children = data[k] if isinstance(data[k], list) else [data[k]]
+            for child in children:
+                if not isinstance(child, dict):
+                    continue
+                if isinstance(data[k], list):
+                    child = self._normalize_data(child)
+
+                query_params = ALLOWED_QUERY_PARAMS.get(k, set())
+                for match in query_params.intersection(QUERY_PARAMS_IDS, child):
+                    value = child[match]
+                    if (
+                        match in CONVERT_TO_ID
+                        and isinstance(value, str)
+                        and (match, value) not in nested_params
+                    ):
+                        nested_params.append((match, value))
+
+        return nested_params
+
+    def _find_id(self, k, data):
+        """Resolves the ID(s) of a single key within the user defined data
+        :returns id (int) or id_list (list): The resolved ID(s) of the key
+        :params k (str): Key within data that is in CONVERT_TO_ID
+        :params data (dict): User defined data passed into the module
+        """
+        v = data[k]
+        endpoint = CONVERT_TO_ID[k]
+        search = v
+        app = self._find_app(endpoint)
+
+        if isinstance(v, dict):
+            if k == "interface" and v.get("virtual_machine"):
+                app = "virtualization"
+            query_params = self._build_query_params(k, data, v)
+            query_id = self._get_object_id(app, endpoint, query_params, k)
+
+        elif isinstance(v, list):
+            queries = list()
+            for list_item in v:
+                norm_data = self._normalize_data(list_item)
+                queries.append(self._build_query_params(k, data, norm_data))
+            id_list = self._get_object_ids(app, endpoint, queries, k)
+            for list_item, query_id in zip(v, id_list):
+                if not query_id:
+                    self._handle_errors(msg="%s not found" % (list_item))
+
+        else:
+            query_params = {QUERY_TYPES.get(k, "q"): search}
+            query_id = self._get_object_id(app, endpoint, query_params, k)
+
+        if isinstance(v, list):
+            return id_list
+        elif isinstance(v, int):
+            return v
+        elif query_id:
+            return query_id
+        else:
+            self._handle_errors(msg="Could not resolve id of %s: %s" % (k, v))
+            return v
+
     def _find_ids(self, data):
-        """Will find the IDs of all user specified data if resolvable
+        """Will find the IDs of all user specified data if resolvable.
+        Lookups that do not depend on each other are resolved concurrently, first the keys with
+        a plain value along with any IDs required by nested data, then the keys with nested data
         :returns data (dict): Returns the updated dict with the IDs of user specified data
         :params data (dict): User defined data passed into the module
         """
-        for k, v in data.items():
-            if k in CONVERT_TO_ID:
-                endpoint = CONVERT_TO_ID[k]
-                search = v
-                app = self._find_app(endpoint)
-                nb_app = getattr(self.nb, app)
-                nb_endpoint = getattr(nb_app, endpoint)
-
-                if isinstance(v, dict):
-                    if k == "interface" and v.get("virtual_machine"):
-                        nb_app = getattr(self.nb, "virtualization")
-                        nb_endpoint = getattr(nb_app, endpoint)
-                    query_params = self._build_query_params(k, data, v)
-                    query_id = self._nb_endpoint_get(nb_endpoint, query_params, k)
-
-                elif isinstance(v, list):
-                    id_list = list()
-                    for list_item in v:
-                        norm_data = self._normalize_data(list_item)
-                        temp_dict = self._build_query_params(k, data, norm_data)
-                        query_id = self._nb_endpoint_get(nb_endpoint, temp_dict, k)
-                        if query_id:
-                            id_list.append(query_id.id)
-                        else:
-                            self._handle_errors(msg="%s not found" % (list_item))
-
-                else:
-                    query_params = {QUERY_TYPES.get(k, "q"): search}
-                    query_id = self._nb_endpoint_get(nb_endpoint, query_params, k)
-
-                if isinstance(v, list):
-                    data[k] = id_list
-                elif isinstance(v, int):
-                    pass
-                elif query_id:
-                    data[k] = query_id.id
-                else:
-                    self._handle_errors(msg="Could not resolve id of %s: %s" % (k, v))
+        keys = [k for k in data if k in CONVERT_TO_ID and not isinstance(data[k], int)]
+        nested_keys = [k for k in keys if isinstance(data[k], (dict, list))]
+        flat_keys = [k for k in keys if k not in nested_keys]
+        nested_params = self._find_nested_query_params(data, nested_keys)
+
+        tasks = [partial(self._find_id, k, data) for k in flat_keys]
+        for match, value in nested_params:
+            tasks.append(partial(self._get_query_param_id, match, {match: value}))
+        results = self._run_concurrently(tasks)
+
+        for k, result in zip(flat_keys, results):
+            data[k] = result
+        for nested_param, result in zip(nested_params, results[len(flat_keys) :]):
+            if isinstance(result, int):
+                self._query_param_ids[nested_param] = result
+
+        tasks = [partial(self._find_id, k, data) for k in nested_keys]
+        for k, result in zip(nested_keys, self._run_concurrently(tasks)):
+            data[k] = result
 
         return data
 
@@ -609,6 +1782,9 @@ class NetboxModule(object):
                 elif data_type == "timezone":
                     if " " in v:
                         data[k] = v.replace(" ", "_")
+                elif k == "color" and isinstance(v, str):
+                    # Netbox only accepts lowercase colors
+                    data[k] = v.lower()
         if self.endpoint == "sites":
             site_slug = self._to_slug(data["name"])
             data["slug"] = site_slug
@@ -625,8 +1801,9 @@ class NetboxModule(object):
         else:
             try:
                 nb_obj = nb_endpoint.create(data)
-            except pynetbox.RequestError as e:
+            except request_errors() as e:
                 self._handle_errors(msg=e.error)
+            self._invalidate_cache()
 
         diff = self._build_diff(before={"state": "absent"}, after={"state": "present"})
         return nb_obj, diff
@@ -638,42 +1815,204 @@ class NetboxModule(object):
         if not self.check_mode:
             try:
                 self.nb_object.delete()
-            except pynetbox.RequestError as e:
+            except request_errors() as e:
                 self._handle_errors(msg=e.error)
+            self._invalidate_cache()
 
         diff = self._build_diff(before={"state": "present"}, after={"state": "absent"})
         return diff
 
+    def _normalize_field(self, key, value):
+        """Only used to compare values, never sent to Netbox
+        :returns value: The value in the same form for every representation of it that Netbox
+        considers identical. ex. the order of tags, the case of colors or of IPv6 addresses
+        :params key (str): Field of the object
+        :params value: Value of the field, either from Netbox or from the user defined data
+        """
+        if isinstance(value, dict):
+            if "value" in value and "label" in value:
+                return self._normalize_field(key, value["value"])
+            return dict((k, self._normalize_field(k, v)) for k, v in value.items())
+        elif isinstance(value, list):
+            values = [self._normalize_field(key, v) for v in value]
+            if key in SET_FIELDS:
+                values = sorted(
+                    set(json.dumps(v, sort_keys=True, default=str) for v in values)
+                )
+            return values
+        elif value is None or isinstance(value, bool):
+            return value
+        elif key in ("address", "prefix"):
+            import ipaddress
+
+            try:
+                return to_text(ipaddress.ip_interface(to_text(value)))
+            except ValueError:
+                return value
+        elif key in ("color", "mac_address") or key in CHOICE_FIELDS:
+            return to_text(value).lower()
+        return value
+
+    def _field_changed(self, key, current, wanted):
+        """
+        :returns changed (bool): Whether Netbox would change the field when sent wanted
+        :params key (str): Field of the object
+        :params current: Value of the field on the existing object
+        :params wanted: Value of the field within the user defined data
+        """
+        if (
+            isinstance(current, dict)
+            and current.get("label") is not None
+            and to_text(current["label"]).lower() == to_text(wanted).lower()
+        ):
+            # Choice passed by its label
+            return False
+        return self._normalize_field(key, current) != self._normalize_field(key, wanted)
+
+    def _find_changed_fields(self, serialized_nb_obj, data):
+        """Compares the serialized Netbox object against the user defined data, ignoring
+        differences Netbox does not store such as the order of tags. custom_fields only
+        compares the custom fields within data
+        :returns tuple(updated_obj, data_before, data_after): the serialized object with the
+        changed fields applied and the before and after values of every changed field
+        """
+        updated_obj = serialized_nb_obj.copy()
+        data_before, data_after = {}, {}
+        for key, value in data.items():
+            if key not in serialized_nb_obj:
+                self._handle_errors(
+                    msg="%s does not exist on existing object. Check to make sure valid field."
+                    % (key)
+                )
+                continue
+
+            current = serialized_nb_obj[key]
+            if key == "custom_fields" and isinstance(value, dict):
+                value = dict(current or {}, **value)
+            if self._field_changed(key, current, value):
+                data_before[key] = current
+                data_after[key] = value
+                updated_obj[key] = value
+
+        return updated_obj, data_before, data_after
+
+    def _patch_netbox_object(self, nb_object, updated_obj, data):
+        """Sends only the changed fields of an object within a PATCH request
+        :returns serialized_nb_obj (dict): updated_obj with the fields Netbox sets when saving
+        the object, such as last_updated, taken from the response
+        :params nb_object (pynetbox Record object): The object to update
+        :params updated_obj (dict): The serialized object with the user defined data applied
+        :params data (dict): The fields that differ from the object
+        """
+        if isinstance(nb_object, NetboxClientRecord):
+            try:
+                response = nb_object.patch(data)
+            except request_errors() as e:
+                self._handle_errors(msg=e.error)
+            return self._merge_patch_response(response, updated_obj, data)
+
+        from pynetbox.core.query import Request
+
+        request_kwargs = dict(
+            key=nb_object.id,
+            base=nb_object.endpoint.url,
+            token=nb_object.api.token,
+            http_session=nb_object.api.http_session,
+        )
+        if hasattr(nb_object.api, "ssl_verify"):
+            # pynetbox < 5.0 verifies certificates per request
+            request_kwargs["ssl_verify"] = nb_object.api.ssl_verify
+        try:
+            response = Request(**request_kwargs).patch(data)
+        except request_errors() as e:
+            self._handle_errors(msg=e.error)
+        return self._merge_patch_response(response, updated_obj, data)
+
+    def _merge_patch_response(self, response, updated_obj, data):
+        # Nested objects are kept as IDs to match the serialized object
+        serialized_nb_obj = updated_obj.copy()
+        for key, value in response.items():
+            if key in serialized_nb_obj and key not in data:
+                if not isinstance(value, (dict, list)):
+                    serialized_nb_obj[key] = value
+        return serialized_nb_obj
+
     def _update_netbox_object(self, data):
         """Update a Netbox object.
         :returns tuple(serialized_nb_obj, diff): tuple of the serialized updated
         Netbox object and the Ansible diff.
         """
         serialized_nb_obj = self.nb_object.serialize()
-        updated_obj = serialized_nb_obj.copy()
-        updated_obj.update(data)
+        updated_obj, data_before, data_after = self._find_changed_fields(
+            serialized_nb_obj, data
+        )
         if serialized_nb_obj == updated_obj:
             return serialized_nb_obj, None
         else:
-            data_before, data_after = {}, {}
-            for key in data:
-                try:
-                    if serialized_nb_obj[key] != updated_obj[key]:
-                        data_before[key] = serialized_nb_obj[key]
-                        data_after[key] = updated_obj[key]
-                except KeyError:
-                    self._handle_errors(
-                        msg="%s does not exist on existing object. Check to make sure valid field."
-                        % (key)
-                    )
-
             if not self.check_mode:
-                self.nb_object.update(data)
-                updated_obj = self.nb_object.serialize()
+                updated_obj = self._patch_netbox_object(
+                    self.nb_object, updated_obj, data_after
+                )
+                self._invalidate_cache()
 
             diff = self._build_diff(before=data_before, after=data_after)
             return updated_obj, diff
 
+    def _assume_absent(self):
+        """
+        :returns assume_absent (bool): Whether objects are created without looking them up first
+        """
+        return (
+            bool(self.module.params.get("assume_absent"))
+            and self.state == "present"
+            and not self.check_mode
+            and self.endpoint in UNIQUE_ENDPOINTS
+        )
+
+    def _is_unique_error(self, error):
+        """
+        :returns unique_error (bool): Whether Netbox rejected a create because the object
+        already exists
+        :params error (pynetbox.RequestError): The error raised by the create
+        """
+        return error.req.status_code == 400 and bool(
+            UNIQUE_ERROR_RE.search(to_text(error.error))
+        )
+
+    def _find_existing_object(self, nb_endpoint, query_params, search_item):
+        """Finds the object managed by the module. With assume_absent the read is skipped and
+        only sent when Netbox rejects the create because the object already exists
+        :returns nb_object (pynetbox object): The existing object or None
+        :params nb_endpoint (pynetbox endpoint object): The endpoint of the object
+        :params query_params (dict): Query params used to find the object
+        :params search_item (str): Name of the object, used within error messages
+        """
+        if self._assume_absent():
+            self._skipped_lookup = (nb_endpoint, query_params, search_item)
+            return None
+        return self._nb_endpoint_get(nb_endpoint, query_params, search_item)
+
+    def _create_assuming_absent(self, nb_endpoint, data):
+        """Creates the object without having looked it up, falling back to the skipped lookup
+        when the object already exists
+        :returns tuple(nb_object, created): The created or existing object and whether it
+        was created
+        :params nb_endpoint (pynetbox endpoint object): The endpoint of the object
+        :params data (dict): User defined data passed into the module
+        """
+        try:
+            nb_object = nb_endpoint.create(data)
+        except request_errors() as e:
+            if not self._is_unique_error(e):
+                self._handle_errors(msg=e.error)
+            nb_object = self._nb_endpoint_get(*self._skipped_lookup)
+            if not nb_object:
+                self._handle_errors(msg=e.error)
+            return nb_object, False
+
+        self._invalidate_cache()
+        return nb_object, True
+
     def _ensure_object_exists(self, nb_endpoint, endpoint_name, name, data):
         """Used when `state` is present to make sure object exists or if the object exists
         that it is updated
@@ -683,6 +2022,16 @@ class NetboxModule(object):
         :params name (str): Name of the object
         :params data (dict): User defined data passed into the module
         """
+        if not self.nb_object and self._skipped_lookup is not None:
+            self.nb_object, created = self._create_assuming_absent(nb_endpoint, data)
+            if created:
+                self.result["msg"] = "%s %s created" % (endpoint_name, name)
+                self.result["changed"] = True
+                self.result["diff"] = self._build_diff(
+                    before={"state": "absent"}, after={"state": "present"}
+                )
+                return
+
         if not self.nb_object:
             self.nb_object, diff = self._create_netbox_object(nb_endpoint, data)
             self.result["msg"] = "%s %s created" % (endpoint_name, name)
@@ -0,0 +1,158 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = r"""
+---
+module: netbox_apply
+short_description: Applies the objects of several endpoints within Netbox at once
+description:
+  - Creates, updates or removes the objects of several endpoints described by a single document.
+  - The endpoints are ordered in layers from the fields referring to other endpoints of the document, such as
+    the I(site) of a device. Every layer only refers to the layers before it and the endpoints of a layer
+    are applied concurrently, each with batched lookups and chunked bulk writes, see M(netbox_bulk).
+  - Fields that can not be ordered, such as the I(primary_ip4) of a device whose IP address is assigned
+    to one of its interfaces or the I(parent_region) of a region, are left out of the objects until every
+    object exists, then set by a last pass.
+  - With I(state=absent) the layers are removed in reverse order.
+notes:
+  - This should be ran with connection C(local) and hosts C(localhost)
+  - In check mode the planned layers are returned. Objects referring to objects the plan creates can not be
+    resolved before they exist and are reported within C(unresolved).
+author:
+  - Netbox Ansible Collection contributors (@netbox-community)
+requirements:
+  - pynetbox
+version_added: "2.9"
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+options:
+  netbox_url:
+    description:
+      - URL of the Netbox instance resolvable by Ansible control host
+    required: true
+    type: str
+  netbox_token:
+    description:
+      - The token created within Netbox to authorize API access
+    required: true
+    type: str
+  objects:
+    description:
+      - Lists of objects per endpoint. ex. C(sites), C(devices) or C(ip_addresses)
+      - Every object is defined the same way as I(data) of the module managing the endpoint.
+      - C(interfaces) are device interfaces.
+    required: true
+    type: dict
+  chunk_size:
+    description:
+      - Maximum number of objects sent within a single request, at least 1
+    default: 100
+    type: int
+  state:
+    description:
+      - Use C(present) or C(absent) for adding or removing.
+    choices: [ absent, present ]
+    default: present
+    type: str
+  validate_certs:
+    description:
+      - If C(no), SSL certificates will not be validated. This should only be used on personally controlled sites using self-signed certificates.
+    default: "yes"
+    type: bool
+"""
+
+EXAMPLES = r"""
+- name: "Test Netbox modules"
+  connection: local
+  hosts: localhost
+  gather_facts: False
+
+  tasks:
+    - name: Provision a site with its devices and their management addresses
+      netbox_apply:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        objects:
+          sites:
+            - name: Test Site
+          devices:
+            - name: Test Switch
+              device_type: C9300
+              device_role: Access Switch
+              site: Test Site
+              primary_ip4: 192.168.1.10/24
+          interfaces:
+            - device: Test Switch
+              name: mgmt0
+          ip_addresses:
+            - address: 192.168.1.10/24
+              interface:
+                device: Test Switch
+                name: mgmt0
+        state: present
+"""
+
+RETURN = r"""
+plan:
+  description:
+    - C(layers) lists the endpoints applied together, in order.
+    - C(deferred) lists the fields per endpoint set by the last pass.
+  returned: always
+  type: dict
+results:
+  description: Outcome of every object per endpoint, in the order they were provided
+  returned: always
+  type: dict
+unresolved:
+  description: Errors per endpoint whose objects refer to objects that do not exist yet, only in check mode
+  returned: when check mode finds objects referring to planned objects
+  type: dict
+msg:
+  description: Message indicating failure or info about what has been achieved
+  returned: always
+  type: str
+"""
+
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+    NetboxAnsibleModule,
+    NETBOX_ARG_SPEC,
+)
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_apply import (
+    NetboxApplyModule,
+)
+
+
+def main():
+    """
+    Main entry point for module execution
+    """
+    argument_spec = NETBOX_ARG_SPEC
+    # Writes are always sent to Netbox, the layers depend on the objects of the layers before them
+    argument_spec.pop("journal")
+    argument_spec.update(
+        dict(
+            objects=dict(required=True, type="dict"),
+            chunk_size=dict(required=False, type="int", default=100),
+        )
+    )
+
+    module = NetboxAnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    netbox_apply = NetboxApplyModule(module)
+    netbox_apply.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = r"""
+---
+module: netbox_bulk
+short_description: Create, update or delete many objects of an endpoint within Netbox
+description:
+  - Creates, updates or removes a list of objects of a single endpoint within Netbox.
+  - Every object goes through the same normalization and ID resolution as the single object modules
+    such as M(netbox_device).
+  - Existing objects are found with batched filter requests. New objects are created with chunked
+    list POST requests, updates and deletes are sent as chunked list PATCH and DELETE requests
+    when supported by Netbox (2.10+), otherwise one request per object.
+notes:
+  - Tags should be defined as a YAML list
+  - This should be ran with connection C(local) and hosts C(localhost)
+  - Endpoint specific behaviour of the single object modules, such as I(first_available) for prefixes
+    or finding the next available IP address, is not supported.
+author:
+  - Netbox Ansible Collection contributors (@netbox-community)
+requirements:
+  - pynetbox
+version_added: "2.9"
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+  - netbox_community.ansible_modules.common.journal
+options:
+  netbox_url:
+    description:
+      - URL of the Netbox instance resolvable by Ansible control host
+    required: true
+    type: str
+  netbox_token:
+    description:
+      - The token created within Netbox to authorize API access
+    required: true
+    type: str
+  endpoint:
+    description:
+      - The endpoint the objects belong to. ex. C(devices)
+      - C(interfaces) are device interfaces.
+    required: true
+    type: str
+  items:
+    description:
+      - List of objects, each defined the same way as I(data) of the module managing the endpoint
+      - Each object must include the fields it is found with, such as the I(name) of a site or the I(address) of an IP address
+    required: true
+    type: list
+    elements: dict
+  chunk_size:
+    description:
+      - Maximum number of objects sent within a single request, at least 1
+    default: 100
+    type: int
+  state:
+    description:
+      - Use C(present) or C(absent) for adding or removing.
+    choices: [ absent, present ]
+    default: present
+    type: str
+  validate_certs:
+    description:
+      - If C(no), SSL certificates will not be validated. This should only be used on personally controlled sites using self-signed certificates.
+    default: "yes"
+    type: bool
+"""
+
+EXAMPLES = r"""
+- name: "Test Netbox modules"
+  connection: local
+  hosts: localhost
+  gather_facts: False
+
+  tasks:
+    - name: Create racks within Netbox
+      netbox_bulk:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        endpoint: racks
+        items:
+          - name: Rack 1
+            site: Main
+          - name: Rack 2
+            site: Main
+            rack_role: Compute
+        state: present
+
+    - name: Create devices from a list
+      netbox_bulk:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        endpoint: devices
+        items: "{{ devices | map('combine', {'device_role': 'Leaf', 'site': 'Main'}) | list }}"
+        chunk_size: 250
+        state: present
+
+    - name: Delete devices
+      netbox_bulk:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        endpoint: devices
+        items:
+          - name: Test Device 1
+          - name: Test Device 2
+        state: absent
+"""
+
+RETURN = r"""
+results:
+  description:
+    - Result of every object in the same order as I(items).
+    - Each result has C(changed), C(msg), C(diff) when changed and the serialized object under the
+      singular name of the endpoint. ex. C(device)
+  returned: always
+  type: list
+msg:
+  description: Message indicating failure or info about what has been achieved
+  returned: always
+  type: str
+"""
+
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+    NetboxAnsibleModule,
+    NETBOX_ARG_SPEC,
+    ENDPOINT_NAME_MAPPING,
+)
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk import (
+    NetboxBulkModule,
+)
+
+
+def main():
+    """
+    Main entry point for module execution
+    """
+    argument_spec = NETBOX_ARG_SPEC
+    argument_spec.update(
+        dict(
+            endpoint=dict(
+                required=True, type="str", choices=sorted(ENDPOINT_NAME_MAPPING)
+            ),
+            items=dict(required=True, type="list", elements="dict"),
+            chunk_size=dict(required=False, type="int", default=100),
+        )
+    )
+
+    module = NetboxAnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    netbox_bulk = NetboxBulkModule(module, module.params["endpoint"])
+    netbox_bulk.run()
+
+
+if __name__ == "__main__":
+    main()
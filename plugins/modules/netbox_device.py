@@ -29,6 +29,9 @@ author:
 requirements:
   - pynetbox
 version_added: '2.8'
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+  - netbox_community.ansible_modules.common.journal
 options:
   netbox_url:
     description:
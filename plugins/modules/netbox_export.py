@@ -0,0 +1,140 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = r"""
+---
+module: netbox_export
+short_description: Exports the objects of Netbox to a snapshot file
+description:
+  - Exports every object of the endpoints used by the netbox modules to a single snapshot file.
+  - The netbox modules read from the snapshot instead of Netbox when run in check mode with
+    I(snapshot) pointing to it, which plans the changes of a play without sending any request to Netbox.
+notes:
+  - This should be ran with connection C(local) and hosts C(localhost)
+  - The snapshot is only as current as the last export, objects changed since are not reflected.
+author:
+  - Netbox Ansible Collection contributors (@netbox-community)
+requirements:
+  - pynetbox
+version_added: "2.9"
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+options:
+  netbox_url:
+    description:
+      - URL of the Netbox instance resolvable by Ansible control host
+    required: true
+    type: str
+  netbox_token:
+    description:
+      - The token created within Netbox to authorize API access
+    required: true
+    type: str
+  dest:
+    description:
+      - Path the snapshot is written to
+    required: true
+    type: path
+  endpoints:
+    description:
+      - Only export these endpoints. ex. C(devices)
+      - Every endpoint used by the netbox modules is exported when not defined.
+    required: false
+    type: list
+    elements: str
+  state:
+    description:
+      - Only C(present) is supported.
+    choices: [ present ]
+    default: present
+    type: str
+  validate_certs:
+    description:
+      - If C(no), SSL certificates will not be validated. This should only be used on personally controlled sites using self-signed certificates.
+    default: "yes"
+    type: bool
+"""
+
+EXAMPLES = r"""
+- name: "Plan Netbox changes offline"
+  connection: local
+  hosts: localhost
+  gather_facts: False
+
+  tasks:
+    - name: Export Netbox to a snapshot
+      netbox_export:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        dest: /tmp/netbox_snapshot.json
+      check_mode: no
+
+    - name: Plan device changes against the snapshot
+      netbox_device:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        snapshot: /tmp/netbox_snapshot.json
+        data:
+          name: Test Device
+          device_type: C9300
+          device_role: Access Switch
+          site: Main
+        state: present
+      check_mode: yes
+"""
+
+RETURN = r"""
+endpoints:
+  description: Number of objects exported per endpoint. ex. C(dcim.devices)
+  returned: always
+  type: dict
+msg:
+  description: Message indicating failure or info about what has been achieved
+  returned: always
+  type: str
+"""
+
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+    NetboxAnsibleModule,
+    NETBOX_ARG_SPEC,
+)
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_export import (
+    NetboxExportModule,
+)
+
+
+def main():
+    """
+    Main entry point for module execution
+    """
+    argument_spec = NETBOX_ARG_SPEC
+    # Nothing is written to Netbox, so there is nothing to queue
+    argument_spec.pop("journal")
+    argument_spec.update(
+        dict(
+            dest=dict(required=True, type="path"),
+            endpoints=dict(required=False, type="list", elements="str"),
+            state=dict(required=False, default="present", choices=["present"]),
+        )
+    )
+
+    module = NetboxAnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    netbox_export = NetboxExportModule(module)
+    netbox_export.run()
+
+
+if __name__ == "__main__":
+    main()
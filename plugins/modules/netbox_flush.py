@@ -0,0 +1,158 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = r"""
+---
+module: netbox_flush
+short_description: Applies the writes queued by the netbox modules
+description:
+  - Applies the creates, updates and deletes queued in a journal by the netbox modules run with I(journal).
+  - Entries are applied in the order they were queued. Consecutive entries of the same endpoint and
+    state are looked up with batched requests and written with chunked bulk requests, see M(netbox_bulk).
+  - Applied entries are removed from the journal. The first failure stops the flush and keeps the
+    failed entries and every entry after them in the journal.
+notes:
+  - This should be ran with connection C(local) and hosts C(localhost), usually as the last task of the play.
+  - IDs and choices of the queued objects are resolved when they are applied, so objects may refer to objects queued before them.
+author:
+  - Netbox Ansible Collection contributors (@netbox-community)
+requirements:
+  - pynetbox
+version_added: "2.9"
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+options:
+  netbox_url:
+    description:
+      - URL of the Netbox instance resolvable by Ansible control host
+    required: true
+    type: str
+  netbox_token:
+    description:
+      - The token created within Netbox to authorize API access
+    required: true
+    type: str
+  journal:
+    description:
+      - Path of the journal the writes were queued in.
+      - Can also be set with the C(NETBOX_JOURNAL) environment variable.
+    required: true
+    type: path
+  chunk_size:
+    description:
+      - Maximum number of objects sent within a single request
+    default: 100
+    type: int
+  state:
+    description:
+      - Only C(present) is supported, the state of every entry is the state of the task that queued it.
+    choices: [ present ]
+    default: present
+    type: str
+  validate_certs:
+    description:
+      - If C(no), SSL certificates will not be validated. This should only be used on personally controlled sites using self-signed certificates.
+    default: "yes"
+    type: bool
+"""
+
+EXAMPLES = r"""
+- name: "Provision Netbox with deferred writes"
+  connection: local
+  hosts: localhost
+  gather_facts: False
+  environment:
+    NETBOX_JOURNAL: /tmp/netbox_journal
+
+  tasks:
+    - name: Queue sites
+      netbox_site:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        data:
+          name: "{{ item }}"
+        state: present
+      loop: "{{ sites }}"
+
+    - name: Queue devices, referring to the queued sites
+      netbox_device:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        data:
+          name: "{{ item.name }}"
+          device_type: C9300
+          device_role: Access Switch
+          site: "{{ item.site }}"
+        state: present
+      loop: "{{ devices }}"
+
+    - name: Apply the queued writes
+      netbox_flush:
+        netbox_url: http://netbox.local
+        netbox_token: thisIsMyToken
+        journal: /tmp/netbox_journal
+      register: flush
+"""
+
+RETURN = r"""
+results:
+  description:
+    - Outcome of every applied entry, in the order they were queued.
+    - C(entry) matches an ID within the C(journal_entries) returned by the task that queued it.
+  returned: always
+  type: list
+pending:
+  description: Number of entries left in the journal
+  returned: always
+  type: int
+msg:
+  description: Message indicating failure or info about what has been achieved
+  returned: always
+  type: str
+"""
+
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+    NetboxAnsibleModule,
+    NETBOX_ARG_SPEC,
+)
+from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_flush import (
+    NetboxFlushModule,
+)
+
+
+def main():
+    """
+    Main entry point for module execution
+    """
+    argument_spec = NETBOX_ARG_SPEC
+    argument_spec.update(
+        dict(
+            journal=dict(
+                required=True, type="path", fallback=(env_fallback, ["NETBOX_JOURNAL"]),
+            ),
+            chunk_size=dict(required=False, type="int", default=100),
+            state=dict(required=False, default="present", choices=["present"]),
+        )
+    )
+
+    module = NetboxAnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    netbox_flush = NetboxFlushModule(module)
+    netbox_flush.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,9 @@ author:
 requirements:
   - pynetbox
 version_added: '0.1.0'
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+  - netbox_community.ansible_modules.common.journal
 options:
   netbox_url:
     description:
@@ -131,6 +134,7 @@ msg:
 
 from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
     NetboxAnsibleModule,
+    NETBOX_ARG_SPEC,
 )
 from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_circuits import (
     NetboxCircuitsModule,
@@ -142,13 +146,8 @@ def main():
     """
     Main entry point for module execution
     """
-    argument_spec = dict(
-        netbox_url=dict(type="str", required=True),
-        netbox_token=dict(type="str", required=True, no_log=True),
-        data=dict(type="dict", required=True),
-        state=dict(required=False, default="present", choices=["present", "absent"]),
-        validate_certs=dict(type="bool", default=True),
-    )
+    argument_spec = NETBOX_ARG_SPEC
+    argument_spec.update(dict(data=dict(type="dict", required=True)))
 
     required_if = [("state", "present", ["name"]), ("state", "absent", ["name"])]
 
@@ -26,6 +26,9 @@ author:
 requirements:
   - pynetbox
 version_added: '0.1.5'
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+  - netbox_community.ansible_modules.common.journal
 options:
   netbox_url:
     description:
@@ -27,6 +27,9 @@ author:
 requirements:
   - pynetbox
 version_added: "0.1.0"
+extends_documentation_fragment:
+  - netbox_community.ansible_modules.common
+  - netbox_community.ansible_modules.common.journal
 options:
   netbox_url:
     description:
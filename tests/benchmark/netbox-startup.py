@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+netbox-startup.py
+
+Measures what every task pays before a module talks to Netbox: the size of the AnsiballZ
+payload built for the module, the module_utils packed within it, and the time taken to import
+the module once ansible.module_utils.basic is loaded.
+
+The collection must be installed or linked under ANSIBLE_COLLECTIONS_PATHS, ex.
+    ANSIBLE_COLLECTIONS_PATHS=~/.ansible/collections python tests/benchmark/netbox-startup.py
+    ANSIBLE_COLLECTIONS_PATHS=~/.ansible/collections python tests/benchmark/netbox-startup.py netbox_site
+"""
+
+import argparse
+import base64
+import io
+import os
+import re
+import statistics
+import subprocess
+import sys
+import zipfile
+
+from ansible.executor.module_common import modify_module
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+COLLECTION = "netbox_community.ansible_modules"
+MODULES_PACKAGE = "ansible_collections.netbox_community.ansible_modules.plugins.modules"
+MODULES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "plugins", "modules"
+)
+
+IMPORT_CODE = """
+import time
+import ansible.module_utils.basic
+start = time.perf_counter()
+import %s
+print(time.perf_counter() - start)
+"""
+
+
+def install_collection_loader(collections_paths):
+    try:
+        from ansible.utils.collection_loader import AnsibleCollectionLoader
+
+        sys.meta_path.insert(0, AnsibleCollectionLoader())
+    except ImportError:
+        # Ansible >= 2.10
+        from ansible.utils.collection_loader._collection_finder import (
+            _AnsibleCollectionFinder,
+        )
+
+        _AnsibleCollectionFinder(paths=collections_paths)._install()
+
+
+def payload(module):
+    """
+    :returns tuple(size, module_utils): Size of the AnsiballZ payload of the module in bytes
+    and the module_utils of the collection packed within it
+    """
+    module_data, module_style, shebang = modify_module(
+        "%s.%s" % (COLLECTION, module),
+        os.path.join(MODULES_DIR, "%s.py" % (module)),
+        {},
+        Templar(loader=DataLoader()),
+        task_vars={"ansible_python_interpreter": sys.executable},
+        module_compression="ZIP_DEFLATED",
+    )
+    zip_data = re.search(br'ZIPDATA = """(.*?)"""', module_data, re.S).group(1)
+    names = zipfile.ZipFile(io.BytesIO(base64.b64decode(zip_data))).namelist()
+    module_utils = sorted(
+        os.path.basename(name)[:-3]
+        for name in names
+        if "/plugins/module_utils/" in name and not name.endswith("__init__.py")
+    )
+    return len(module_data), module_utils
+
+
+def import_time(module, collections_paths, runs):
+    """
+    :returns import_time (float): Median time in seconds to import the module in a new
+    interpreter, ansible.module_utils.basic excluded
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(collections_paths))
+    times = [
+        float(
+            subprocess.check_output(
+                [
+                    sys.executable,
+                    "-c",
+                    IMPORT_CODE % ("%s.%s" % (MODULES_PACKAGE, module)),
+                ],
+                env=env,
+            )
+        )
+        for run in range(runs)
+    ]
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("modules", nargs="*", help="Modules to measure, all by default")
+    parser.add_argument("--runs", type=int, default=5, help="Imports timed per module")
+    args = parser.parse_args()
+
+    collections_paths = [
+        os.path.expanduser(path)
+        for path in os.environ.get("ANSIBLE_COLLECTIONS_PATHS", "").split(os.pathsep)
+        if path
+    ]
+    if not collections_paths:
+        parser.error("ANSIBLE_COLLECTIONS_PATHS must point to the collection")
+    install_collection_loader(collections_paths)
+
+    modules = args.modules or sorted(
+        name[:-3]
+        for name in os.listdir(MODULES_DIR)
+        if name.startswith("netbox_") and name.endswith(".py")
+    )
+    print(
+        "%-28s %12s %10s  %s" % ("module", "payload (B)", "import (ms)", "module_utils")
+    )
+    sizes, times = list(), list()
+    for module in modules:
+        size, module_utils = payload(module)
+        seconds = import_time(module, collections_paths, args.runs)
+        sizes.append(size)
+        times.append(seconds)
+        print(
+            "%-28s %12d %10.1f  %s"
+            % (module, size, seconds * 1000, ", ".join(module_utils))
+        )
+    print(
+        "%-28s %12d %10.1f"
+        % ("median", statistics.median(sizes), statistics.median(times) * 1000)
+    )
+
+
+if __name__ == "__main__":
+    main()
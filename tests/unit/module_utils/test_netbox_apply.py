@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_apply import (
+        NetboxApplyModule,
+    )
+
+    BULK_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk.NetboxBulkModule"
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_apply import NetboxApplyModule
+
+    BULK_PATCH_PATH = "netbox_bulk.NetboxBulkModule"
+
+
+@pytest.fixture
+def objects():
+    return {
+        "sites": [{"name": "Site 1"}],
+        "racks": [{"name": "Rack 1", "site": "Site 1"}],
+        "devices": [
+            {
+                "name": "Dev 1",
+                "site": "Site 1",
+                "rack": "Rack 1",
+                "primary_ip4": "10.0.0.1/24",
+            }
+        ],
+        "interfaces": [{"device": "Dev 1", "name": "mgmt0"}],
+        "ip_addresses": [
+            {
+                "address": "10.0.0.1/24",
+                "interface": {"device": "Dev 1", "name": "mgmt0"},
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def mock_ansible_module(objects):
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = False
+    module._verbosity = 0
+    module.params = {
+        "netbox_url": "http://netbox.local/",
+        "netbox_token": "0123456789",
+        "state": "present",
+        "validate_certs": False,
+        "objects": objects,
+        "chunk_size": 100,
+    }
+    return module
+
+
+@pytest.fixture
+def netbox(mocker, mock_ansible_module):
+    return NetboxApplyModule(mock_ansible_module, nb_client=mocker.Mock())
+
+
+def test_plan_defers_primary_ip_to_break_cycle(netbox, objects):
+    layers, deferred = netbox._plan_layers(netbox._get_dependencies(objects))
+
+    assert layers == [
+        ["sites"],
+        ["racks"],
+        ["devices"],
+        ["interfaces"],
+        ["ip_addresses"],
+    ]
+    assert deferred == {"devices": {"primary_ip4"}}
+
+
+def test_plan_defers_references_within_endpoint(netbox):
+    objects = {
+        "regions": [{"name": "Europe"}, {"name": "France", "parent_region": "Europe"}],
+        "sites": [{"name": "Paris", "region": "France"}],
+        "tenants": [{"name": "Tenant 1"}],
+    }
+
+    layers, deferred = netbox._plan_layers(netbox._get_dependencies(objects))
+
+    assert layers == [["regions", "tenants"], ["sites"]]
+    assert deferred == {"regions": {"parent_region"}}
+
+
+def test_run_applies_layers_then_deferred_fields(mocker, netbox, mock_ansible_module):
+    apply_items = mocker.patch("%s._apply_items" % (BULK_PATCH_PATH))
+    apply_items.side_effect = lambda items: (
+        [{"changed": True, "device": item} for item in items],
+        {"created": len(items), "updated": 0, "deleted": 0, "unchanged": 0},
+    )
+
+    netbox.run()
+
+    applied = [call[0][0] for call in apply_items.call_args_list]
+    assert applied[2] == [{"name": "Dev 1", "site": "Site 1", "rack": "Rack 1"}]
+    assert applied[5] == mock_ansible_module.params["objects"]["devices"]
+    result = mock_ansible_module.exit_json.call_args[1]
+    assert result["msg"] == "5 created, 0 updated, 0 deleted, 0 unchanged"
+    assert result["plan"]["deferred"] == {"devices": ["primary_ip4"]}
+
+
+def test_run_removes_layers_in_reverse_order(mocker, netbox, mock_ansible_module):
+    netbox.state = "absent"
+    endpoints = list()
+    from_module = mocker.patch("%s.from_module" % (BULK_PATCH_PATH))
+
+    def bulk(module, endpoint, state):
+        endpoints.append(endpoint)
+        bulk_module = mocker.Mock(name="bulk_mock")
+        bulk_module._apply_items.return_value = (
+            [{"changed": True}],
+            {"created": 0, "updated": 0, "deleted": 1, "unchanged": 0},
+        )
+        return bulk_module
+
+    from_module.side_effect = bulk
+
+    netbox.run()
+
+    assert endpoints == ["ip_addresses", "interfaces", "devices", "racks", "sites"]
+    result = mock_ansible_module.exit_json.call_args[1]
+    assert result["msg"] == "0 created, 0 updated, 5 deleted, 0 unchanged"
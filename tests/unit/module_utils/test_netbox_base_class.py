@@ -6,6 +6,11 @@
 import pytest
 import json
 import os
+import threading
+import time
+from functools import partial
+
+import pynetbox
 from unittest.mock import patch, MagicMock, Mock
 from ansible.module_utils.basic import AnsibleModule
 
@@ -16,6 +21,9 @@ try:
     from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_dcim import (
         NB_DEVICES,
     )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_choices import (
+        NETBOX_CHOICES,
+    )
 
     MOCKER_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils.NetboxModule"
 except ImportError:
@@ -24,6 +32,7 @@ except ImportError:
     sys.path.append("plugins/module_utils")
     from netbox_utils import NetboxModule
     from netbox_dcim import NB_DEVICES
+    from netbox_choices import NETBOX_CHOICES
 
     MOCKER_PATCH_PATH = "netbox_utils.NetboxModule"
 
@@ -293,14 +302,24 @@ def test_update_netbox_object_no_changes(mock_netbox_module, nb_obj_mock):
 
 
 def test_update_netbox_object_with_changes_check_mode_false(
-    mock_netbox_module, nb_obj_mock, changed_serialized_obj, on_update_diff
+    mocker, mock_netbox_module, nb_obj_mock, changed_serialized_obj, on_update_diff
 ):
+    request = mocker.patch("pynetbox.core.query.Request")
+    request.return_value.patch.return_value = dict(
+        changed_serialized_obj, site={"id": 1, "slug": "test-site"}, last_updated="now"
+    )
+    nb_obj_mock.api = mocker.Mock(spec=["token", "http_session"])
+    nb_obj_mock.serialize.reset_mock()
     mock_netbox_module.nb_object = nb_obj_mock
     serialized_obj, diff = mock_netbox_module._update_netbox_object(
         changed_serialized_obj
     )
-    assert nb_obj_mock.update.called_once_with(changed_serialized_obj)
-    assert serialized_obj == nb_obj_mock.serialize()
+    request.return_value.patch.assert_called_once_with(
+        {"name": "Test Device1 (modified)"}
+    )
+    nb_obj_mock.update.assert_not_called()
+    nb_obj_mock.serialize.assert_called_once_with()
+    assert serialized_obj == changed_serialized_obj
     assert diff == on_update_diff
 
 
@@ -318,3 +337,619 @@ def test_update_netbox_object_with_changes_check_mode_true(
     assert nb_obj_mock.update.not_called()
     assert serialized_obj == updated_serialized_obj
     assert diff == on_update_diff
+
+
+def test_get_object_id_uses_cache(mocker, mock_netbox_module, nb_obj_mock):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock")
+    mock_netbox_module.cache.get.return_value = None
+    nb_obj_mock.id = 5
+    endpoint = mock_netbox_module.nb.dcim.sites
+    endpoint.get.return_value = nb_obj_mock
+
+    found_id = mock_netbox_module._get_object_id(
+        "dcim", "sites", {"slug": "test-site"}, "site"
+    )
+    assert found_id == 5
+    mock_netbox_module.cache.set.assert_called_once_with(
+        "sites", ["dcim", {"slug": "test-site"}], 5
+    )
+
+    mock_netbox_module.cache.get.return_value = 5
+    endpoint.get.reset_mock()
+    found_id = mock_netbox_module._get_object_id(
+        "dcim", "sites", {"slug": "test-site"}, "site"
+    )
+    assert found_id == 5
+    endpoint.get.assert_not_called()
+
+
+def test_create_netbox_object_invalidates_cache(
+    mocker, mock_netbox_module, endpoint_mock, normalized_data
+):
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock")
+    mock_netbox_module._create_netbox_object(endpoint_mock, normalized_data)
+    mock_netbox_module.cache.invalidate.assert_called_once_with(NB_DEVICES)
+
+
+def vlan_mock(mocker, vlan_id, name):
+    # name is a reserved argument of Mock so needs to be set afterwards
+    vlan = mocker.Mock(id=vlan_id)
+    vlan.name = name
+    return vlan
+
+
+def test_get_object_ids_batches_queries(mocker, mock_netbox_module):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    endpoint = mock_netbox_module.nb.ipam.vlans
+    endpoint.filter.return_value = [
+        vlan_mock(mocker, 10, "vlan10"),
+        vlan_mock(mocker, 20, "vlan20"),
+    ]
+    queries = [
+        {"name": "vlan20", "site_id": 1},
+        {"name": "vlan10", "site_id": 1},
+    ]
+
+    ids = mock_netbox_module._get_object_ids("ipam", "vlans", queries, "tagged_vlans")
+    assert ids == [20, 10]
+    endpoint.filter.assert_called_once_with(
+        name=["vlan10", "vlan20"], site_id=1, brief=1
+    )
+    endpoint.get.assert_not_called()
+
+
+def test_get_object_ids_falls_back_when_not_batched(mocker, mock_netbox_module):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    endpoint = mock_netbox_module.nb.ipam.vlans
+    endpoint.filter.return_value = [vlan_mock(mocker, 10, "vlan10")]
+    endpoint.get.return_value = mocker.Mock(id=30)
+    queries = [
+        {"name": "vlan10", "site_id": 1},
+        {"name": "vlan30", "site_id": 1},
+        {"name": "vlan40", "site_id": 2},
+    ]
+
+    ids = mock_netbox_module._get_object_ids("ipam", "vlans", queries, "tagged_vlans")
+    assert ids == [10, 30, 30]
+    assert endpoint.get.call_count == 2
+
+
+def test_get_object_ids_ambiguous_match_fails(mocker, mock_netbox_module):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    endpoint = mock_netbox_module.nb.ipam.vlans
+    endpoint.filter.return_value = [
+        vlan_mock(mocker, 10, "vlan10"),
+        vlan_mock(mocker, 11, "vlan10"),
+        vlan_mock(mocker, 20, "vlan20"),
+    ]
+    queries = [{"name": "vlan10"}, {"name": "vlan20"}]
+
+    mock_netbox_module._get_object_ids("ipam", "vlans", queries, "tagged_vlans")
+    mock_netbox_module.module.fail_json.assert_called_once_with(
+        msg="More than one result returned for tagged_vlans", changed=False
+    )
+
+
+def test_find_ids_resolves_nested_params_once(mocker, mock_netbox_module):
+    # Undo the patch of _find_ids done by the mock_netbox_module fixture
+    mocker.stopall()
+    mock_netbox_module.max_workers = 4
+    get_object_id = mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._get_object_id"))
+    get_object_id.side_effect = lambda app, endpoint, query_params, search_item: 1
+    get_object_ids = mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._get_object_ids"))
+    get_object_ids.return_value = [10, 20]
+    data = {
+        "name": "GigabitEthernet1",
+        "device": "test100",
+        "tagged_vlans": [
+            {"name": "vlan10", "site": "Test Site"},
+            {"name": "vlan20", "site": "Test Site"},
+        ],
+    }
+
+    new_data = mock_netbox_module._find_ids(data)
+    assert new_data == {
+        "name": "GigabitEthernet1",
+        "device": 1,
+        "tagged_vlans": [10, 20],
+    }
+    assert get_object_id.call_count == 2
+    get_object_id.assert_any_call("dcim", "sites", {"slug": "test-site"}, "site")
+    get_object_ids.assert_called_once_with(
+        "ipam",
+        "vlans",
+        [{"name": "vlan10", "site_id": 1}, {"name": "vlan20", "site_id": 1}],
+        "tagged_vlans",
+    )
+
+
+def test_run_concurrently_defers_errors(mock_netbox_module):
+    mock_netbox_module.max_workers = 4
+
+    def failing_task():
+        mock_netbox_module._handle_errors(msg="Could not resolve id of site")
+
+    results = mock_netbox_module._run_concurrently([lambda: 1, failing_task, lambda: 3])
+    assert results == [1, None, 3]
+    mock_netbox_module.module.fail_json.assert_called_once_with(
+        msg="Could not resolve id of site", changed=False
+    )
+
+
+def load_choices_fixture(endpoint):
+    path = os.path.dirname(os.path.abspath(__file__))
+    with open(f"{path}/fixtures/choices/{endpoint}.json", "r") as f:
+        return json.loads(f.read())
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    ["circuits", "devices", "device_types", "interfaces", "prefixes", "racks"]
+    + ["services", "sites", "virtual_machines", "vlans"],
+)
+def test_bundled_choices_match_fixtures(endpoint):
+    expected = dict(
+        (field, [(item["value"], item["display_name"]) for item in choices])
+        for field, choices in load_choices_fixture(endpoint).items()
+    )
+    assert NETBOX_CHOICES["2.7"][endpoint] == expected
+
+
+def test_fetch_choice_value_uses_bundled_choices(mocker, mock_netbox_module):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    mock_netbox_module.version = 2.7
+
+    lag = mock_netbox_module._fetch_choice_value(
+        "Link Aggregation Group (LAG)", "interfaces"
+    )
+    assert lag == "lag"
+    assert mock_netbox_module._fetch_choice_value("ACCESS", "interfaces") == "access"
+    mock_netbox_module.nb.dcim.interfaces.choices.assert_not_called()
+
+
+def test_fetch_choice_value_queries_choices_once(mocker, mock_netbox_module):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    mock_netbox_module.version = 2.6
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock")
+    mock_netbox_module.cache.get.return_value = None
+    choices = mock_netbox_module.nb.dcim.devices.choices
+    choices.return_value = {
+        "status": [{"value": 1, "display_name": "Active"}],
+        "face": [{"value": 0, "display_name": "Front"}],
+    }
+
+    assert mock_netbox_module._fetch_choice_value("active", "devices") == 1
+    assert mock_netbox_module._fetch_choice_value("Front", "devices") == 0
+    choices.assert_called_once_with()
+    mock_netbox_module.cache.set.assert_called_once_with(
+        "choices", [2.6, "devices"], {"active": 1, "front": 0}
+    )
+
+
+def test_fetch_choice_value_refreshes_bundled_choices(mocker, mock_netbox_module):
+    mock_netbox_module.nb = mocker.Mock(name="nb_mock")
+    mock_netbox_module.version = 2.7
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock")
+    choices = mock_netbox_module.nb.dcim.interfaces.choices
+    choices.return_value = {
+        "type": [{"value": "800gbase-x-qsfpdd", "display_name": "QSFP-DD (800GE)"}]
+    }
+
+    assert (
+        mock_netbox_module._fetch_choice_value("QSFP-DD (800GE)", "interfaces")
+        == "800gbase-x-qsfpdd"
+    )
+    assert mock_netbox_module._fetch_choice_value("Unknown", "interfaces") is None
+    choices.assert_called_once_with()
+    mock_netbox_module.cache.set.assert_called_once_with(
+        "choices",
+        [2.7, "interfaces"],
+        {
+            "qsfp-dd (800ge)": "800gbase-x-qsfpdd",
+            "800gbase-x-qsfpdd": "800gbase-x-qsfpdd",
+        },
+    )
+    mock_netbox_module.module.fail_json.assert_called_once_with(
+        msg="Unknown was not found as a valid choice for interfaces", changed=False
+    )
+
+
+def test_netbox_version_param_skips_detection(mocker, mock_ansible_module):
+    mock_ansible_module.params["netbox_version"] = "2.7"
+    mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._find_ids"))
+    get_netbox_version = mocker.patch(
+        "%s%s" % (MOCKER_PATCH_PATH, "._get_netbox_version")
+    )
+    api = mocker.patch("pynetbox.api")
+
+    netbox = NetboxModule(mock_ansible_module, NB_DEVICES)
+    assert netbox.version == 2.7
+    assert netbox.nb == api.return_value
+    get_netbox_version.assert_not_called()
+
+
+def test_get_netbox_version_uses_cache(mocker, mock_netbox_module):
+    nb = mocker.Mock(name="nb_mock")
+    version = mocker.PropertyMock(return_value="2.6")
+    type(nb).version = version
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock", timeout=3600)
+    mock_netbox_module.cache.get.return_value = None
+
+    assert mock_netbox_module._get_netbox_version(nb) == 2.6
+    mock_netbox_module.cache.set.assert_called_once_with(
+        "version", "version", 2.6, timeout=300
+    )
+
+    mock_netbox_module.cache.get.return_value = 2.6
+    assert mock_netbox_module._get_netbox_version(nb) == 2.6
+    assert version.call_count == 1
+
+
+def test_shared_state_reuses_client_and_ids(mocker, mock_ansible_module):
+    mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._find_ids"))
+    mocker.patch(
+        "%s%s" % (MOCKER_PATCH_PATH, "._get_netbox_version")
+    ).return_value = 2.7
+    api = mocker.patch("pynetbox.api")
+    mocker.patch.object(NetboxModule, "_shared_state", None)
+    NetboxModule.enable_shared_state()
+
+    first = NetboxModule(mock_ansible_module, NB_DEVICES)
+    first.nb.dcim.sites.get.return_value = mocker.Mock(id=1)
+    assert first._get_object_id("dcim", "sites", {"slug": "test-site"}, "site") == 1
+
+    second = NetboxModule(mock_ansible_module, NB_DEVICES)
+    assert second.nb == first.nb
+    assert second.version == 2.7
+    assert second._get_object_id("dcim", "sites", {"slug": "test-site"}, "site") == 1
+    api.assert_called_once()
+    first.nb.dcim.sites.get.assert_called_once_with(slug="test-site")
+
+    second.endpoint = "sites"
+    second._invalidate_cache()
+    assert first._object_ids == {}
+
+
+def test_nb_read_coalesces_identical_reads(mocker, mock_netbox_module):
+    nb_endpoint = mocker.Mock(name="endpoint_mock")
+    nb_endpoint.name = "vlans"
+    nb_endpoint.filter.return_value = iter([vlan_mock(mocker, 10, "vlan10")])
+
+    first = mock_netbox_module._nb_read(
+        nb_endpoint, "filter", {"name": ["vlan20", "vlan10"], "site_id": 1}
+    )
+    second = mock_netbox_module._nb_read(
+        nb_endpoint, "filter", {"site_id": 1, "name": ["vlan10", "vlan20"]}
+    )
+    assert first == second
+    assert len(second) == 1
+    nb_endpoint.filter.assert_called_once()
+    assert mock_netbox_module.read_stats == {"requests": 1, "coalesced": 1}
+
+    mock_netbox_module.endpoint = "vlans"
+    mock_netbox_module._invalidate_cache()
+    nb_endpoint.filter.return_value = iter([])
+    mock_netbox_module._nb_read(nb_endpoint, "filter", {"site_id": 1, "name": []})
+    assert nb_endpoint.filter.call_count == 2
+
+
+def test_nb_read_concurrent_reads_sent_once(mocker, mock_netbox_module):
+    mock_netbox_module.max_workers = 4
+    nb_endpoint = mocker.Mock(name="endpoint_mock")
+    nb_endpoint.name = "sites"
+    nb_endpoint.get.side_effect = lambda **kwargs: time.sleep(0.05) or 1
+
+    tasks = [
+        partial(mock_netbox_module._nb_read, nb_endpoint, "get", {"slug": "test"})
+        for _ in range(4)
+    ]
+    assert mock_netbox_module._run_concurrently(tasks) == [1, 1, 1, 1]
+    nb_endpoint.get.assert_called_once_with(slug="test")
+    assert mock_netbox_module.read_stats == {"requests": 1, "coalesced": 3}
+
+
+def test_nb_read_other_endpoints_run_concurrently(mocker, mock_netbox_module):
+    mock_netbox_module.max_workers = 2
+    tenants_read = threading.Event()
+    sites = mocker.Mock(name="sites_mock")
+    sites.name = "sites"
+    # Only returns once the identical read of tenants was sent alongside it
+    sites.get.side_effect = lambda **kwargs: tenants_read.wait(5)
+    tenants = mocker.Mock(name="tenants_mock")
+    tenants.name = "tenants"
+    tenants.get.side_effect = lambda **kwargs: tenants_read.set() or True
+
+    tasks = [
+        partial(mock_netbox_module._nb_read, nb_endpoint, "get", {"name": "X"})
+        for nb_endpoint in (sites, tenants)
+    ]
+    assert mock_netbox_module._run_concurrently(tasks) == [True, True]
+    assert mock_netbox_module.read_stats == {"requests": 2, "coalesced": 0}
+
+
+def test_prepare_data_absent_only_resolves_identity(mocker, mock_netbox_module):
+    mock_netbox_module.state = "absent"
+    mock_netbox_module.endpoint = "racks"
+    change_choices_id = mocker.patch.object(mock_netbox_module, "_change_choices_id")
+    change_choices_id.side_effect = lambda endpoint, data: data
+
+    mock_netbox_module._prepare_data(
+        {
+            "name": "Test Rack",
+            "site": "Test Site",
+            "rack_role": "Compute",
+            "tenant": "Test Tenant",
+            "status": "Active",
+            "u_height": 42,
+            "serial": None,
+        }
+    )
+    mock_netbox_module._find_ids.assert_called_with(
+        {"name": "Test Rack", "site": "test-site", "u_height": 42}
+    )
+
+
+def page_response(mocker, count, results):
+    response = mocker.Mock(ok=True)
+    response.json.return_value = {"count": count, "results": results}
+    return response
+
+
+@pytest.fixture
+def nb_api(mocker):
+    nb = pynetbox.api("http://netbox.local", token="0123456789")
+    nb.http_session = mocker.Mock(name="http_session_mock")
+    return nb
+
+
+def test_nb_brief_get_reads_single_brief_page(mocker, mock_netbox_module, nb_api):
+    mock_netbox_module.nb = nb_api
+    nb_api.http_session.get.return_value = page_response(
+        mocker, 1, [{"id": 1, "name": "Test Site", "slug": "test-site"}]
+    )
+
+    assert (
+        mock_netbox_module._get_object_id(
+            "dcim", "sites", {"slug": "test-site"}, "site"
+        )
+        == 1
+    )
+    params = nb_api.http_session.get.call_args[1]["params"]
+    assert params == {"slug": "test-site", "brief": 1, "limit": 2, "offset": 0}
+
+    nb_api.http_session.get.return_value = page_response(
+        mocker, 2, [{"id": 1, "name": "a"}, {"id": 2, "name": "a"}]
+    )
+    with pytest.raises(ValueError):
+        mock_netbox_module._nb_brief_get(nb_api.dcim.sites, {"name": "a"})
+
+
+def test_nb_endpoint_last_reads_last_page_only(mocker, mock_netbox_module, nb_api):
+    mock_netbox_module.nb = nb_api
+    nb_api.http_session.get.side_effect = [
+        page_response(mocker, 3, [{"id": 1, "address": "10.0.0.1/24"}]),
+        page_response(mocker, 3, [{"id": 3, "address": "10.0.0.3/24"}]),
+    ]
+
+    ip = mock_netbox_module._nb_endpoint_last(
+        nb_api.ipam.ip_addresses, {"interface_id": 1, "parent": "10.0.0.0/24"}
+    )
+    assert ip.id == 3
+    assert nb_api.http_session.get.call_args[1]["params"]["offset"] == 2
+
+
+@pytest.mark.parametrize(
+    "return_mode, return_fields, expected",
+    [
+        ("full", None, ["asset_tag", "config_context", "id", "name", "site", "url"]),
+        ("id", None, ["id"]),
+        ("brief", None, ["id", "name", "url"]),
+        ("id", ["asset_tag", "missing"], ["asset_tag", "id"]),
+    ],
+)
+def test_serialize_object_trims_fields(
+    mocker, mock_netbox_module, return_mode, return_fields, expected
+):
+    mock_netbox_module.module.params["return_mode"] = return_mode
+    mock_netbox_module.module.params["return_fields"] = return_fields
+    nb_object = mocker.Mock(name="nb_obj_mock")
+    nb_object.serialize.return_value = {
+        "id": 1,
+        "url": "http://netbox.local/api/dcim/devices/1/",
+        "name": "Test Device1",
+        "asset_tag": "1001",
+        "site": {"id": 1, "name": "Test Site"},
+        "config_context": {"ntp": ["10.0.0.1"]},
+    }
+
+    serialized_object = mock_netbox_module._serialize_object(nb_object)
+    assert sorted(serialized_object) == expected
+    assert mock_netbox_module._serialize_object(None) is None
+
+
+def unique_error(mocker):
+    response = mocker.Mock(status_code=400, url="http://netbox.local/api/dcim/devices/")
+    response.text = '{"name": ["A device with this name already exists."]}'
+    response.json.return_value = {"name": ["A device with this name already exists."]}
+    return pynetbox.RequestError(response)
+
+
+def test_assume_absent_creates_without_lookup(
+    mocker, mock_netbox_module, endpoint_mock, nb_obj_mock
+):
+    mock_netbox_module.endpoint = "tenants"
+    mock_netbox_module.module.params["assume_absent"] = True
+    mock_netbox_module.result = {"changed": False}
+    nb_endpoint_get = mocker.patch.object(mock_netbox_module, "_nb_endpoint_get")
+
+    mock_netbox_module.nb_object = mock_netbox_module._find_existing_object(
+        endpoint_mock, {"name": "Tenant 1"}, "Tenant 1"
+    )
+    mock_netbox_module._ensure_object_exists(
+        endpoint_mock, "tenant", "Tenant 1", {"name": "Tenant 1"}
+    )
+
+    nb_endpoint_get.assert_not_called()
+    assert mock_netbox_module.nb_object == nb_obj_mock
+    assert mock_netbox_module.result["msg"] == "tenant Tenant 1 created"
+
+
+def test_assume_absent_updates_existing_object(
+    mocker, mock_netbox_module, endpoint_mock, nb_obj_mock
+):
+    mock_netbox_module.endpoint = "tenants"
+    mock_netbox_module.module.params["assume_absent"] = True
+    mock_netbox_module.result = {"changed": False}
+    endpoint_mock.create.side_effect = unique_error(mocker)
+    nb_endpoint_get = mocker.patch.object(mock_netbox_module, "_nb_endpoint_get")
+    nb_endpoint_get.return_value = nb_obj_mock
+    update_netbox_object = mocker.patch.object(
+        mock_netbox_module, "_update_netbox_object"
+    )
+    update_netbox_object.return_value = (nb_obj_mock, None)
+
+    mock_netbox_module.nb_object = mock_netbox_module._find_existing_object(
+        endpoint_mock, {"name": "Tenant 1"}, "Tenant 1"
+    )
+    mock_netbox_module._ensure_object_exists(
+        endpoint_mock, "tenant", "Tenant 1", {"name": "Tenant 1"}
+    )
+
+    nb_endpoint_get.assert_called_once_with(
+        endpoint_mock, {"name": "Tenant 1"}, "Tenant 1"
+    )
+    mock_netbox_module.module.fail_json.assert_not_called()
+    assert mock_netbox_module.result["msg"] == "tenant Tenant 1 already exists"
+
+
+def test_assume_absent_looks_up_devices_first(
+    mocker, mock_netbox_module, endpoint_mock, nb_obj_mock
+):
+    # Netbox accepts a second device named Test Device1 within another site
+    mock_netbox_module.module.params["assume_absent"] = True
+    mock_netbox_module.result = {"changed": False}
+    nb_endpoint_get = mocker.patch.object(mock_netbox_module, "_nb_endpoint_get")
+    nb_endpoint_get.return_value = nb_obj_mock
+    update_netbox_object = mocker.patch.object(
+        mock_netbox_module, "_update_netbox_object"
+    )
+    update_netbox_object.return_value = (nb_obj_mock, None)
+    data = {"name": "Test Device1", "site": 2}
+
+    mock_netbox_module.nb_object = mock_netbox_module._find_existing_object(
+        endpoint_mock, {"name": "Test Device1"}, "Test Device1"
+    )
+    mock_netbox_module._ensure_object_exists(
+        endpoint_mock, "device", "Test Device1", data
+    )
+
+    nb_endpoint_get.assert_called_once_with(
+        endpoint_mock, {"name": "Test Device1"}, "Test Device1"
+    )
+    endpoint_mock.create.assert_not_called()
+    update_netbox_object.assert_called_once_with(data)
+
+
+@pytest.mark.parametrize(
+    "current, data",
+    [
+        ({"tags": ["b", "a"]}, {"tags": ["a", "b", "a"]}),
+        ({"tagged_vlans": [2, 1]}, {"tagged_vlans": [1, 2]}),
+        ({"color": "aa1409"}, {"color": "AA1409"}),
+        ({"address": "2001:db8::1/64"}, {"address": "2001:DB8:0::1/64"}),
+        ({"mac_address": "AA:BB:CC:DD:EE:FF"}, {"mac_address": "aa:bb:cc:dd:ee:ff"}),
+        ({"status": {"value": "active", "label": "Active"}}, {"status": "active"}),
+        ({"status": {"value": 1, "label": "Active"}}, {"status": "Active"}),
+        ({"custom_fields": {"a": 1, "b": 2}}, {"custom_fields": {"b": 2}}),
+    ],
+)
+def test_find_changed_fields_ignores_equivalent_values(
+    mock_netbox_module, current, data
+):
+    updated_obj, data_before, data_after = mock_netbox_module._find_changed_fields(
+        current, data
+    )
+    assert updated_obj == current
+    assert data_before == data_after == {}
+
+
+def test_find_changed_fields_merges_custom_fields(mock_netbox_module):
+    updated_obj, data_before, data_after = mock_netbox_module._find_changed_fields(
+        {"custom_fields": {"a": 1, "b": 2}, "tags": ["a"]},
+        {"custom_fields": {"b": 3}, "tags": ["a", "b"]},
+    )
+    assert data_before == {"custom_fields": {"a": 1, "b": 2}, "tags": ["a"]}
+    assert data_after == {"custom_fields": {"a": 1, "b": 3}, "tags": ["a", "b"]}
+    assert updated_obj == data_after
+
+
+def test_fingerprint_skips_unchanged_object(mocker, mock_ansible_module, tmpdir):
+    mock_ansible_module._verbosity = 0
+    mock_ansible_module.params.update(fingerprint=True, cache_connection=str(tmpdir))
+    find_ids = mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._find_ids"))
+    find_ids.side_effect = lambda data: data
+    nb = mocker.Mock(name="nb_mock")
+    device = mocker.Mock(name="device_mock", last_updated="2020-01-01T00:00:00Z")
+    device.serialize.return_value = {
+        "id": 1,
+        "name": "Test Device1",
+        "last_updated": "2020-01-01T00:00:00Z",
+    }
+    nb.dcim.devices.get.return_value = device
+
+    first = NetboxModule(mock_ansible_module, NB_DEVICES, nb_client=nb)
+    first.nb_object = device
+    first.result = {"changed": True}
+    first._exit_json()
+
+    NetboxModule(mock_ansible_module, NB_DEVICES, nb_client=nb)
+    find_ids.assert_called_once()
+    nb.dcim.devices.get.assert_called_once_with(id=1)
+    assert not mock_ansible_module.exit_json.call_args[1]["changed"]
+
+    # The object was modified within Netbox since the data was applied
+    device.last_updated = "2020-02-01T00:00:00Z"
+    NetboxModule(mock_ansible_module, NB_DEVICES, nb_client=nb)
+    assert find_ids.call_count == 2
+
+
+def test_fingerprint_changes_with_data(mocker, mock_netbox_module):
+    mock_netbox_module.endpoint = "sites"
+    mock_netbox_module.module.params["data"] = {"name": "Test Site", "asn": 65000}
+    key, digest = mock_netbox_module._get_fingerprint()
+
+    mock_netbox_module.module.params["data"] = {"name": "Test Site", "asn": 65001}
+    assert mock_netbox_module._get_fingerprint() == (key, mocker.ANY)
+    assert mock_netbox_module._get_fingerprint()[1] != digest
+
+    mock_netbox_module.endpoint = "ip_addresses"
+    mock_netbox_module.module.params["data"] = {"prefix": "10.0.0.0/24"}
+    assert mock_netbox_module._get_fingerprint() is None
+
+
+def test_module_routes_requests_through_httpapi_connection(mocker, mock_ansible_module):
+    mock_ansible_module._socket_path = "/tmp/netbox-socket"
+    mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._find_ids"))
+    mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._fetch_schema")).return_value = None
+    # ssl_verify is only accepted by pynetbox < 5.0
+    api = pynetbox.api
+    mocker.patch("pynetbox.api").side_effect = lambda url, token, ssl_verify: api(
+        url, token=token
+    )
+    connection = mocker.patch(
+        "%s.Connection" % (MOCKER_PATCH_PATH.rsplit(".", 1)[0])
+    ).return_value
+    connection.cache_get.return_value = None
+    connection.send_request.return_value = {
+        "status_code": 200,
+        "reason": "OK",
+        "headers": {"API-Version": "2.7"},
+        "text": "{}",
+    }
+
+    netbox = NetboxModule(mock_ansible_module, NB_DEVICES)
+
+    assert netbox.version == 2.7
+    assert connection.send_request.call_args[1]["path"] == "/api/"
+    connection.cache_set.assert_any_call("version", '"version"', 2.7, 300)
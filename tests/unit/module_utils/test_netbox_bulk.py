@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+import pynetbox
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk import (
+        NetboxBulkModule,
+    )
+
+    MOCKER_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk.NetboxBulkModule"
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_bulk import NetboxBulkModule
+
+    MOCKER_PATCH_PATH = "netbox_bulk.NetboxBulkModule"
+
+
+@pytest.fixture
+def mock_ansible_module():
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = False
+    module._verbosity = 0
+    module.params = {
+        "netbox_url": "http://netbox.local/",
+        "netbox_token": "0123456789",
+        "endpoint": "sites",
+        "items": [
+            {"name": "Site 1", "slug": "site-1"},
+            {"name": "Site 2", "slug": "site-2", "time_zone": "UTC"},
+            {"name": "Site 3", "slug": "site-3"},
+        ],
+        "chunk_size": 2,
+        "state": "present",
+        "validate_certs": False,
+    }
+    return module
+
+
+def site_mock(mocker, site_id, name, **kwargs):
+    site = mocker.Mock(id=site_id)
+    site.serialize.return_value = dict(
+        {"id": site_id, "name": name, "slug": name.lower().replace(" ", "-")}, **kwargs
+    )
+    return site
+
+
+@pytest.fixture
+def mock_bulk_module(mocker, mock_ansible_module):
+    find_ids = mocker.patch("%s%s" % (MOCKER_PATCH_PATH, "._find_ids"))
+    find_ids.side_effect = lambda data: data
+    netbox = NetboxBulkModule(mock_ansible_module, "sites", nb_client=True)
+    netbox.nb = mocker.Mock(name="nb_mock")
+    netbox.nb.dcim.sites.create.side_effect = lambda data: data
+    mocker.patch.object(netbox, "_bulk_request").return_value = [
+        {"id": 2, "name": "Site 2", "slug": "site-2", "time_zone": "UTC"}
+    ]
+
+    return netbox
+
+
+def test_chunks_split_items(mock_bulk_module):
+    chunks = list(mock_bulk_module._chunks([1, 2, 3, 4, 5]))
+    assert chunks == [[1, 2], [3, 4], [5]]
+
+
+def test_run_creates_and_updates_in_bulk(mocker, mock_bulk_module):
+    mocker.patch.object(mock_bulk_module, "_get_objects").return_value = [
+        site_mock(mocker, 1, "Site 1"),
+        site_mock(mocker, 2, "Site 2", time_zone=None),
+        None,
+    ]
+
+    mock_bulk_module.run()
+
+    mock_bulk_module.nb.dcim.sites.create.assert_called_once_with(
+        [{"name": "Site 3", "slug": "site-3"}]
+    )
+    mock_bulk_module._bulk_request.assert_called_once_with(
+        "patch", mock_bulk_module.nb.dcim.sites, [{"time_zone": "UTC", "id": 2}]
+    )
+    result = mock_bulk_module.module.exit_json.call_args[1]
+    assert result["changed"]
+    assert result["msg"] == "1 created, 1 updated, 0 deleted, 1 unchanged"
+    assert [item["changed"] for item in result["results"]] == [False, True, True]
+    assert result["results"][1]["diff"] == {
+        "before": {"time_zone": None},
+        "after": {"time_zone": "UTC"},
+    }
+
+
+def test_run_serializes_bulk_updates(mocker, mock_bulk_module):
+    mocker.patch.object(mock_bulk_module, "_get_objects").return_value = [
+        site_mock(mocker, 1, "Site 1"),
+        site_mock(mocker, 2, "Site 2", time_zone=None, region=5, last_updated=None),
+        site_mock(mocker, 3, "Site 3"),
+    ]
+    mock_bulk_module._bulk_request.return_value = [
+        {
+            "id": 2,
+            "name": "Site 2",
+            "slug": "site-2",
+            "time_zone": "UTC",
+            "region": {"id": 5, "name": "Europe"},
+            "last_updated": "2020-01-01T00:00:00Z",
+        }
+    ]
+
+    mock_bulk_module.run()
+
+    result = mock_bulk_module.module.exit_json.call_args[1]
+    assert result["results"][1]["site"] == {
+        "id": 2,
+        "name": "Site 2",
+        "slug": "site-2",
+        "time_zone": "UTC",
+        "region": 5,
+        "last_updated": "2020-01-01T00:00:00Z",
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_run_rejects_chunk_size_below_one(mock_bulk_module, chunk_size):
+    mock_bulk_module.module.params["chunk_size"] = chunk_size
+
+    mock_bulk_module.run()
+
+    mock_bulk_module.module.fail_json.assert_called_once_with(
+        msg="chunk_size must be at least 1", changed=False
+    )
+    mock_bulk_module.nb.dcim.sites.create.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "endpoint, item, missing",
+    [
+        ("sites", {"slug": "site-4"}, "name"),
+        ("device_roles", {"color": "aa1409"}, "slug"),
+        ("ip_addresses", {"vrf": "Test VRF"}, "address"),
+        ("interfaces", {"device": "Test Device"}, "name"),
+    ],
+)
+def test_run_rejects_items_missing_identity(
+    mocker, mock_bulk_module, endpoint, item, missing
+):
+    mock_bulk_module.endpoint = endpoint
+    mock_bulk_module.module.params["items"] = [
+        {"name": "Test", "address": "10.0.0.1/24"},
+        item,
+    ]
+    prepare_data = mocker.patch.object(mock_bulk_module, "_prepare_data")
+
+    mock_bulk_module.run()
+
+    mock_bulk_module.module.fail_json.assert_called_once_with(
+        msg="Item 1 of %s is missing %s" % (endpoint, missing), changed=False
+    )
+    prepare_data.assert_not_called()
+
+
+def test_run_rejects_duplicate_items(mocker, mock_bulk_module):
+    mock_bulk_module.module.params["items"].append({"name": "Site 1", "slug": "site-1"})
+    get_objects = mocker.patch.object(mock_bulk_module, "_get_objects")
+
+    mock_bulk_module.run()
+
+    mock_bulk_module.module.fail_json.assert_called_once_with(
+        msg="site Site 1 is listed more than once", changed=False
+    )
+    get_objects.assert_not_called()
+
+
+def test_run_updates_objects_individually_without_bulk_support(
+    mocker, mock_bulk_module
+):
+    site = site_mock(mocker, 2, "Site 2", time_zone=None)
+    mocker.patch.object(mock_bulk_module, "_get_objects").return_value = [
+        site_mock(mocker, 1, "Site 1"),
+        site,
+        site_mock(mocker, 3, "Site 3"),
+    ]
+    mock_bulk_module._bulk_request.return_value = None
+    patch_netbox_object = mocker.patch.object(mock_bulk_module, "_patch_netbox_object")
+
+    mock_bulk_module.run()
+
+    patch_netbox_object.assert_called_once_with(
+        site,
+        {"id": 2, "name": "Site 2", "slug": "site-2", "time_zone": "UTC"},
+        {"time_zone": "UTC"},
+    )
+    mock_bulk_module.nb.dcim.sites.create.assert_not_called()
+
+
+def test_run_check_mode_sends_no_requests(mocker, mock_bulk_module):
+    mock_bulk_module.check_mode = True
+    mock_bulk_module.state = "absent"
+    mocker.patch.object(mock_bulk_module, "_get_objects").return_value = [
+        site_mock(mocker, 1, "Site 1"),
+        None,
+        None,
+    ]
+
+    mock_bulk_module.run()
+
+    mock_bulk_module._bulk_request.assert_not_called()
+    result = mock_bulk_module.module.exit_json.call_args[1]
+    assert result["msg"] == "0 created, 0 updated, 1 deleted, 2 unchanged"
+    assert result["results"][0]["site"] is None
+
+
+def unique_error(mocker):
+    response = mocker.Mock(status_code=400, url="http://netbox.local/api/dcim/sites/")
+    response.text = '{"name": ["site with this name already exists."]}'
+    response.json.return_value = {"name": ["site with this name already exists."]}
+    return pynetbox.RequestError(response)
+
+
+def test_run_assume_absent_only_looks_up_rejected_chunks(mocker, mock_bulk_module):
+    mock_bulk_module.module.params["assume_absent"] = True
+    create = mock_bulk_module.nb.dcim.sites.create
+    create.side_effect = [unique_error(mocker), [site_mock(mocker, 3, "Site 3")], []]
+    get_objects = mocker.patch.object(mock_bulk_module, "_get_objects")
+    get_objects.return_value = [site_mock(mocker, 1, "Site 1"), None]
+
+    mock_bulk_module.run()
+
+    assert get_objects.call_args[0][1] == [
+        {"slug": "site-1"},
+        {"slug": "site-2"},
+    ]
+    create.assert_called_with(
+        [{"name": "Site 2", "slug": "site-2", "time_zone": "UTC"}]
+    )
+    result = mock_bulk_module.module.exit_json.call_args[1]
+    assert result["msg"] == "2 created, 0 updated, 0 deleted, 1 unchanged"
+    assert [item["msg"] for item in result["results"]] == [
+        "site Site 1 already exists",
+        "site Site 2 created",
+        "site Site 3 created",
+    ]
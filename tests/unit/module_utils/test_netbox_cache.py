@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils import (
+        netbox_cache,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_cache import (
+        NetboxCache,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    import netbox_cache
+    from netbox_cache import NetboxCache
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return NetboxCache(str(tmpdir), "http://netbox.local/", timeout=60)
+
+
+def test_cache_get_missing_returns_none(cache):
+    assert cache.get("sites", {"slug": "test-site"}) is None
+
+
+def test_cache_set_and_get(cache):
+    cache.set("sites", ["dcim", {"slug": "test-site"}], 1)
+    assert cache.get("sites", ["dcim", {"slug": "test-site"}]) == 1
+
+
+def test_cache_is_shared_between_instances_per_url(tmpdir, cache):
+    cache.set("sites", {"slug": "test-site"}, 1)
+    same_url = NetboxCache(str(tmpdir), "http://netbox.local", timeout=60)
+    other_url = NetboxCache(str(tmpdir), "http://netbox2.local/", timeout=60)
+
+    assert same_url.get("sites", {"slug": "test-site"}) == 1
+    assert other_url.get("sites", {"slug": "test-site"}) is None
+
+
+def test_cache_expired_entry_returns_none(cache):
+    cache.set("sites", {"slug": "test-site"}, 1, timeout=-1)
+    assert cache.get("sites", {"slug": "test-site"}) is None
+
+
+def test_cache_invalidate_only_drops_namespace(cache):
+    cache.set("sites", {"slug": "test-site"}, 1)
+    cache.set("racks", {"name": "test-rack"}, 2)
+    cache.invalidate("sites")
+
+    assert cache.get("sites", {"slug": "test-site"}) is None
+    assert cache.get("racks", {"name": "test-rack"}) == 2
+
+
+def test_cache_evicts_oldest_entries(mocker, cache):
+    mocker.patch.object(netbox_cache, "CACHE_MAX_ENTRIES", 2)
+    cache.set("sites", {"slug": "site-1"}, 1, timeout=10)
+    cache.set("sites", {"slug": "site-2"}, 2, timeout=20)
+    cache.set("sites", {"slug": "site-3"}, 3, timeout=30)
+
+    assert cache.get("sites", {"slug": "site-1"}) is None
+    assert cache.get("sites", {"slug": "site-2"}) == 2
+    assert cache.get("sites", {"slug": "site-3"}) == 3
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import gzip
+import json
+import subprocess
+import sys
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientApi,
+        NetboxClientError,
+        NetboxClientRecord,
+        NetboxClientSession,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_client import (
+        NetboxClientApi,
+        NetboxClientError,
+        NetboxClientRecord,
+        NetboxClientSession,
+    )
+
+
+def make_response(status_code=200, body=None, url="http://netbox.local/api/"):
+    response = MagicMock(name="response")
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.url = url
+    response.reason = "Bad Request"
+    response.content = b"" if body is None else json.dumps(body).encode()
+    response.text = response.content.decode()
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def nb():
+    api = NetboxClientApi("http://netbox.local/", token="0123456789")
+    api.http_session = MagicMock(name="session")
+    return api
+
+
+def test_record_serializes_like_pynetbox(nb):
+    record = NetboxClientRecord(
+        {
+            "id": 1,
+            "name": "Dev 1",
+            "site": {"id": 2, "name": "Site 1", "slug": "site-1"},
+            "status": {"value": "active", "label": "Active", "id": 1},
+            "face": {"value": 0, "label": "Front"},
+            "tags": ["b", "a", "b"],
+            "custom_fields": {"owner": {"value": 3, "label": "Team"}, "rack": None},
+            "local_context_data": {"ntp": ["10.0.0.1"]},
+        },
+        nb,
+        nb.dcim.devices,
+    )
+
+    assert record.site.name == "Site 1"
+    assert str(record) == "Dev 1"
+    assert dict(record)["site"]["slug"] == "site-1"
+    serialized = record.serialize()
+    assert serialized["site"] == 2
+    assert serialized["status"] == "active"
+    assert serialized["face"] == 0
+    assert sorted(serialized["tags"]) == ["a", "b"]
+    assert serialized["custom_fields"] == {"owner": 3, "rack": None}
+    assert serialized["local_context_data"] == {"ntp": ["10.0.0.1"]}
+
+
+def test_filter_reads_remaining_pages_at_once(nb):
+    url = "http://netbox.local/api/dcim/sites/"
+    # Netbox capped the second page to a single object
+    nb.http_session.request.side_effect = [
+        make_response(body={"count": 3, "next": url, "results": [{"id": 1}]}),
+        make_response(
+            body={"count": 3, "next": "%s?offset=2" % (url), "results": [{"id": 2}]}
+        ),
+        make_response(body={"count": 3, "next": None, "results": [{"id": 3}]}),
+    ]
+
+    sites = nb.dcim.sites.filter(slug="site-1")
+
+    assert [site.id for site in sites] == [1, 2, 3]
+    calls = nb.http_session.request.call_args_list
+    assert calls[0][1]["params"] == {"slug": "site-1"}
+    assert calls[1][1]["params"] == {"slug": "site-1", "limit": 2, "offset": 1}
+    assert calls[2][0][1] == "%s?offset=2" % (url)
+    assert calls[0][1]["headers"]["Authorization"] == "Token 0123456789"
+
+
+def test_errors_match_pynetbox(nb):
+    nb.http_session.request.return_value = make_response(
+        400, {"name": ["This field is required."]}
+    )
+
+    with pytest.raises(NetboxClientError) as e:
+        nb.dcim.sites.create({"slug": "site-1"})
+
+    assert str(e.value).startswith("The request failed with code 400 Bad Request")
+    assert e.value.error == '{"name": ["This field is required."]}'
+
+    nb.http_session.request.return_value = make_response(404)
+    assert nb.dcim.sites.get(5) is None
+
+
+class NetboxHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses = list()
+
+    def do_GET(self):
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = gzip.compress(json.dumps({"port": self.client_address[1]}).encode())
+        self.send_response(status)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = HTTPServer(("127.0.0.1", 0), NetboxHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield "http://127.0.0.1:%s/api/" % (server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_keeps_connection_alive_and_retries(server):
+    session = NetboxClientSession(retries=2, backoff_factor=0)
+    NetboxHandler.statuses = [503]
+
+    first = session.get(server)
+    second = session.get(server, params={"tag": ["a", "b"]})
+
+    assert first.ok and first.json() == second.json()
+    assert first.headers["content-encoding"] == "gzip"
+    assert second.request.url == "%s?tag=a&tag=b" % (server)
+    session.close()
+
+
+def test_session_reuses_connections_across_threads(server):
+    session = NetboxClientSession(retries=0, pool_size=1)
+    responses = list()
+    for i in range(3):
+        # Worker threads of each concurrent layer only live as long as the layer
+        thread = threading.Thread(target=lambda: responses.append(session.get(server)))
+        thread.start()
+        thread.join()
+
+    assert len(set(response.json()["port"] for response in responses)) == 1
+    session.close()
+    assert session._idle == {}
+
+
+def test_client_modules_do_not_import_pynetbox():
+    code = (
+        "import sys; sys.path.append('plugins/module_utils'); import netbox_dcim; "
+        "print(sorted(set(['pynetbox', 'requests']).intersection(sys.modules)))"
+    )
+
+    output = subprocess.check_output([sys.executable, "-c", code])
+
+    assert output.strip() == b"[]"
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientError,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_ipam import (
+        NB_IP_ADDRESSES,
+        NetboxIpamModule,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_client import NetboxClientError
+    from netbox_ipam import NB_IP_ADDRESSES, NetboxIpamModule
+
+
+@pytest.fixture
+def mock_ansible_module():
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = False
+    module._verbosity = 0
+    module.params = {
+        "netbox_url": "http://netbox.local/",
+        "netbox_token": "0123456789",
+        "data": {"prefix": "10.0.0.0/30"},
+        "state": "new",
+        "validate_certs": False,
+    }
+    return module
+
+
+@pytest.fixture
+def netbox(mocker, mock_ansible_module):
+    return NetboxIpamModule(
+        mock_ansible_module, NB_IP_ADDRESSES, nb_client=mocker.Mock()
+    )
+
+
+@pytest.fixture
+def prefix(mocker):
+    prefix = mocker.Mock(name="prefix")
+    prefix.available_ips.create.return_value = {"id": 1, "address": "10.0.0.1/30"}
+    return prefix
+
+
+def error(status_code):
+    response = MagicMock(name="response")
+    response.status_code = status_code
+    response.reason = "Conflict"
+    response.text = '{"detail": "No space"}'
+    return NetboxClientError(response)
+
+
+def test_available_ip_is_allocated_with_a_single_post(netbox, prefix):
+    nb_obj, diff = netbox._create_available_object(prefix.available_ips, {"prefix": 1})
+
+    assert nb_obj == {"id": 1, "address": "10.0.0.1/30"}
+    assert diff["after"] == {"state": "present"}
+    prefix.available_ips.create.assert_called_once_with({"prefix": 1})
+    prefix.available_ips.list.assert_not_called()
+
+
+@pytest.mark.parametrize("response", [None, error(409)])
+def test_full_prefix_has_no_available_ip(netbox, prefix, mock_ansible_module, response):
+    if response is None:
+        prefix.available_ips.create.return_value = None
+    else:
+        prefix.available_ips.create.side_effect = response
+
+    assert netbox._create_available_object(prefix.available_ips, {}) == (None, None)
+    mock_ansible_module.fail_json.assert_not_called()
+
+
+def test_available_ip_errors_fail(netbox, prefix, mock_ansible_module):
+    prefix.available_ips.create.side_effect = error(400)
+
+    netbox._create_available_object(prefix.available_ips, {})
+
+    mock_ansible_module.fail_json.assert_called_once_with(
+        msg='{"detail": "No space"}', changed=False
+    )
+
+
+def test_available_ip_check_mode_reads_first_available(netbox, prefix):
+    netbox.check_mode = True
+    prefix.available_ips.list.return_value = []
+
+    assert netbox._create_available_object(prefix.available_ips, {}) == (None, None)
+    prefix.available_ips.list.assert_called_once_with(limit=1)
+    prefix.available_ips.create.assert_not_called()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+import pynetbox
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_journal import (
+        NetboxJournal,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_flush import (
+        NetboxFlushModule,
+    )
+
+    MOCKER_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils.NetboxModule"
+    BULK_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_bulk.NetboxBulkModule"
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_journal import NetboxJournal
+    from netbox_utils import NetboxModule
+    from netbox_flush import NetboxFlushModule
+
+    MOCKER_PATCH_PATH = "netbox_utils.NetboxModule"
+    BULK_PATCH_PATH = "netbox_bulk.NetboxBulkModule"
+
+
+@pytest.fixture
+def journal_path(tmpdir):
+    return str(tmpdir.join("journal"))
+
+
+@pytest.fixture
+def mock_ansible_module(journal_path):
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = False
+    module._verbosity = 0
+    module.params = {
+        "netbox_url": "http://netbox.local/",
+        "netbox_token": "0123456789",
+        "state": "present",
+        "validate_certs": False,
+        "journal": journal_path,
+        "chunk_size": 100,
+    }
+    return module
+
+
+def test_journal_keeps_entries_per_instance(journal_path):
+    journal = NetboxJournal(journal_path, "http://netbox.local/")
+    other = NetboxJournal(journal_path, "http://other.local")
+
+    first = journal.append([{"endpoint": "sites", "state": "present", "data": {}}])
+    other.append([{"endpoint": "sites", "state": "present", "data": {}}])
+    second = journal.append(
+        [
+            {"endpoint": "devices", "state": "present", "data": {"name": "a"}},
+            {"endpoint": "devices", "state": "absent", "data": {"name": "b"}},
+        ]
+    )
+
+    assert [entry["id"] for entry in journal.read()] == first + second
+    journal.remove(first)
+    assert [entry["id"] for entry in journal.read()] == second
+    assert len(other.read()) == 1
+
+
+def test_module_queues_writes_without_connecting(mocker, mock_ansible_module):
+    api = mocker.patch("pynetbox.api")
+    mock_ansible_module.params["data"] = {"name": "Test Site", "time_zone": None}
+
+    NetboxModule(mock_ansible_module, "sites")
+
+    api.assert_not_called()
+    result = mock_ansible_module.exit_json.call_args[1]
+    assert result["changed"]
+    entries = NetboxJournal(
+        mock_ansible_module.params["journal"], "http://netbox.local"
+    ).read()
+    assert [entry["id"] for entry in entries] == result["journal_entries"]
+    assert entries[0]["data"] == {"name": "Test Site"}
+    assert entries[0]["endpoint"] == "sites"
+
+
+def test_module_sends_addresses_from_prefix_right_away(mock_ansible_module):
+    mock_ansible_module.params["data"] = {"prefix": "10.0.0.0/24"}
+    netbox = NetboxModule(mock_ansible_module, "ip_addresses", nb_client=True)
+
+    assert netbox._get_deferred_items() is None
+    mock_ansible_module.exit_json.assert_not_called()
+
+
+@pytest.fixture
+def queued_journal(mock_ansible_module):
+    journal = NetboxJournal(
+        mock_ansible_module.params["journal"], "http://netbox.local"
+    )
+    journal.append(
+        [
+            {"endpoint": "sites", "state": "present", "data": {"name": "Site 1"}},
+            {"endpoint": "sites", "state": "present", "data": {"name": "Site 2"}},
+            {"endpoint": "devices", "state": "present", "data": {"name": "Dev 1"}},
+            {"endpoint": "sites", "state": "absent", "data": {"name": "Site 3"}},
+        ]
+    )
+    return journal
+
+
+def test_flush_applies_consecutive_entries_together(
+    mocker, mock_ansible_module, queued_journal
+):
+    entries = queued_journal.read()
+    netbox = NetboxFlushModule(mock_ansible_module, nb_client=mocker.Mock())
+    apply_items = mocker.patch("%s._apply_items" % (BULK_PATCH_PATH))
+    apply_items.side_effect = lambda items, repeats: (
+        [{"changed": True, "msg": item["name"]} for item in items],
+        {"created": len(items), "updated": 0, "deleted": 0, "unchanged": 0},
+    )
+
+    netbox.run()
+
+    assert [call[0][0] for call in apply_items.call_args_list] == [
+        [{"name": "Site 1"}, {"name": "Site 2"}],
+        [{"name": "Dev 1"}],
+        [{"name": "Site 3"}],
+    ]
+    result = mock_ansible_module.exit_json.call_args[1]
+    assert result["msg"] == "4 created, 0 updated, 0 deleted, 0 unchanged"
+    assert [r["entry"] for r in result["results"]] == [e["id"] for e in entries]
+    assert result["pending"] == 0
+    assert queued_journal.read() == []
+
+
+def test_flush_keeps_failed_entries(mocker, mock_ansible_module, queued_journal):
+    entries = queued_journal.read()
+    nb = mocker.Mock(name="nb_mock")
+    response = mocker.Mock(status_code=400, url="http://netbox.local/api/dcim/devices/")
+    response.text = '{"site": ["This field is required."]}'
+    response.json.return_value = {"site": ["This field is required."]}
+    nb.dcim.sites.filter.return_value = []
+    nb.dcim.sites.get.return_value = None
+    nb.dcim.sites.create.side_effect = lambda data: data
+    nb.dcim.devices.filter.return_value = []
+    nb.dcim.devices.get.return_value = None
+    nb.dcim.devices.create.side_effect = pynetbox.RequestError(response)
+    mocker.patch("%s._find_ids" % (MOCKER_PATCH_PATH)).side_effect = lambda data: data
+    netbox = NetboxFlushModule(mock_ansible_module, nb_client=nb)
+    netbox.version = 2.7
+
+    netbox.run()
+
+    result = mock_ansible_module.fail_json.call_args[1]
+    assert result["msg"].startswith("Failed to apply 1 devices entries")
+    assert [r["entry"] for r in result["results"]] == [e["id"] for e in entries[:2]]
+    assert result["pending"] == 2
+    assert [e["id"] for e in queued_journal.read()] == [e["id"] for e in entries[2:]]
+
+
+def test_flush_applies_repeated_entries_after_each_other(mocker, mock_ansible_module):
+    journal = NetboxJournal(
+        mock_ansible_module.params["journal"], "http://netbox.local"
+    )
+    journal.append(
+        [
+            {"endpoint": "sites", "state": "present", "data": {"name": "Site 1"}},
+            {"endpoint": "sites", "state": "present", "data": {"name": "Site 1"}},
+        ]
+    )
+    nb = mocker.Mock(name="nb_mock")
+    nb.dcim.sites.name = "sites"
+    created = list()
+    site = mocker.Mock(name="site", id=1)
+    site.serialize.return_value = {"id": 1, "name": "Site 1", "slug": "site-1"}
+    nb.dcim.sites.create.side_effect = lambda data: created.extend(data) or [site]
+    nb.dcim.sites.filter.side_effect = lambda **params: [site] if created else []
+    nb.dcim.sites.get.side_effect = lambda **params: site if created else None
+    mocker.patch("%s._find_ids" % (MOCKER_PATCH_PATH)).side_effect = lambda data: data
+    netbox = NetboxFlushModule(mock_ansible_module, nb_client=nb)
+    netbox.version = 2.7
+
+    netbox.run()
+
+    result = mock_ansible_module.exit_json.call_args[1]
+    assert result["msg"] == "1 created, 0 updated, 0 deleted, 1 unchanged"
+    assert result["pending"] == 0
+    assert created == [{"name": "Site 1", "slug": "site-1"}]
+    assert journal.read() == []
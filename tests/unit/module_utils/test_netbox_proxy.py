@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+import threading
+import time
+import pytest
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_client import (
+        NetboxClientSession,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy import (
+        STATS_PATH,
+        NetboxProxyCache,
+        NetboxProxyServer,
+        _endpoint,
+        start_proxy,
+    )
+
+    PROXY_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_proxy"
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_client import NetboxClientSession
+    from netbox_proxy import (
+        STATS_PATH,
+        NetboxProxyCache,
+        NetboxProxyServer,
+        _endpoint,
+        start_proxy,
+    )
+
+    PROXY_PATCH_PATH = "netbox_proxy"
+
+
+SITES_KEY = ("GET", "/api/dcim/sites", "/api/dcim/sites/?slug=site-1", None)
+
+
+@pytest.mark.parametrize(
+    "path, endpoint",
+    [
+        ("/api/dcim/sites/?slug=site-1", "/api/dcim/sites"),
+        ("/api/ipam/prefixes/3/available-ips/", "/api/ipam/prefixes"),
+        ("/api/status/", "/api/status"),
+    ],
+)
+def test_endpoint(path, endpoint):
+    assert _endpoint(path) == endpoint
+
+
+def test_cache_coalesces_identical_reads():
+    cache = NetboxProxyCache(60)
+    release = threading.Event()
+    calls = list()
+
+    def fetch():
+        calls.append(1)
+        release.wait()
+        return (200, [], b"{}")
+
+    responses = list()
+    threads = [
+        threading.Thread(target=lambda: responses.append(cache.get(SITES_KEY, fetch)))
+        for i in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.report()["coalesced"] < 4:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert responses == [(200, [], b"{}")] * 5
+    assert cache.get(SITES_KEY, fetch) == (200, [], b"{}")
+    report = cache.report()
+    assert (report["misses"], report["coalesced"], report["hits"]) == (1, 4, 1)
+    assert report["hit_rate"] == round(5.0 / 6, 4)
+
+
+def test_cache_expires_and_skips_errors():
+    cache = NetboxProxyCache(0)
+    assert cache.get(SITES_KEY, lambda: (200, [], b"{}")) == (200, [], b"{}")
+    assert cache.get(SITES_KEY, lambda: (200, [], b"[]")) == (200, [], b"[]")
+
+    cache.ttl = 60
+    assert cache.get(SITES_KEY, lambda: (503, [], b"")) == (503, [], b"")
+    assert cache.get(SITES_KEY, lambda: (200, [], b"{}")) == (200, [], b"{}")
+
+
+def test_cache_invalidates_endpoint_and_linked_endpoints():
+    cache = NetboxProxyCache(60)
+    prefix_key = ("GET", "/api/ipam/prefixes", "/api/ipam/prefixes/1/", None)
+    device_key = ("GET", "/api/dcim/devices", "/api/dcim/devices/", None)
+    for key in (prefix_key, device_key):
+        cache.get(key, lambda: (200, [], b"{}"))
+
+    cache.invalidate("/api/ipam/ip-addresses")
+
+    report = cache.report()
+    assert (report["writes"], report["invalidations"], report["entries"]) == (1, 1, 1)
+
+
+def test_cache_does_not_keep_reads_sent_before_a_write():
+    cache = NetboxProxyCache(60)
+
+    def fetch():
+        cache.invalidate("/api/dcim/sites")
+        return (200, [], b"{}")
+
+    cache.get(SITES_KEY, fetch)
+
+    assert cache.report()["entries"] == 0
+
+
+class NetboxHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = list()
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.requests.append((self.command, self.path))
+        body = {"count": len(self.requests)}
+        if "offset" in self.path:
+            body["next"] = "http://%s/api/dcim/sites/?offset=2" % (self.headers["Host"])
+        body = json.dumps(body).encode()
+        self.send_response(201 if self.command == "POST" else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class NetboxServer(ThreadingMixIn, HTTPServer):
+    # The proxy keeps its connections to Netbox alive
+    daemon_threads = True
+
+
+@pytest.fixture
+def proxy():
+    servers = [NetboxServer(("127.0.0.1", 0), NetboxHandler)]
+    servers.append(
+        NetboxProxyServer(
+            "http://127.0.0.1:%s/" % (servers[0].server_port),
+            NetboxClientSession(retries=0),
+            60,
+        )
+    )
+    for server in servers:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+    NetboxHandler.requests = list()
+    connection = HTTPConnection("127.0.0.1", servers[1].server_port)
+    yield connection, servers[1]
+    connection.close()
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def send(connection, method, path, body=None):
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_proxy_caches_reads_until_a_write(proxy):
+    connection, server = proxy
+    sites = "/%s/api/dcim/sites/" % (server.secret)
+    assert send(connection, "GET", sites) == (200, {"count": 1})
+    assert send(connection, "GET", sites) == (200, {"count": 1})
+    assert send(connection, "POST", sites, b'{"name": "Site 1"}') == (
+        201,
+        {"count": 2},
+    )
+    assert send(connection, "GET", sites) == (200, {"count": 3})
+
+    status, stats = send(connection, "GET", "/%s%s" % (server.secret, STATS_PATH))
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 1)
+    assert [request[0] for request in NetboxHandler.requests] == ["GET", "POST", "GET"]
+
+
+def test_proxy_requires_secret(proxy):
+    connection, server = proxy
+
+    for path in ("/api/dcim/sites/", "/%s/api/dcim/sites/" % ("0" * 32), STATS_PATH):
+        connection.close()
+        assert send(connection, "GET", path)[0] == 403
+    assert NetboxHandler.requests == []
+
+
+def test_proxy_points_next_links_at_itself(proxy):
+    connection, server = proxy
+
+    status, body = send(
+        connection, "GET", "/%s/api/dcim/sites/?offset=1" % (server.secret)
+    )
+
+    assert body["next"] == "%s/api/dcim/sites/?offset=2" % (server.url)
+
+
+def test_start_proxy_runs_a_proxy_per_validate_certs(mocker, tmpdir):
+    started = list()
+
+    def popen(args, **kwargs):
+        config = json.loads(args[-1])
+        started.append(config["validate_certs"])
+        url = "http://127.0.0.1:%s/secret" % (len(started))
+        with open(config["state_path"], "w") as f:
+            json.dump({"pid": len(started), "url": url}, f)
+
+    mocker.patch("%s.subprocess.Popen" % (PROXY_PATCH_PATH)).side_effect = popen
+    mocker.patch("%s._collection_root" % (PROXY_PATCH_PATH)).return_value = str(tmpdir)
+    mocker.patch("%s.proxy_stats" % (PROXY_PATCH_PATH)).side_effect = lambda url: {
+        "netbox_url": "https://netbox.local",
+        "validate_certs": started[int(url.split(":")[2].split("/")[0]) - 1],
+    }
+
+    insecure = start_proxy(
+        "https://netbox.local/", validate_certs=False, cache_connection=str(tmpdir)
+    )
+    secure = start_proxy("https://netbox.local/", cache_connection=str(tmpdir))
+
+    assert started == [False, True]
+    assert insecure != secure
+    assert start_proxy("https://netbox.local/", cache_connection=str(tmpdir)) == secure
+    assert len(started) == 2
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_registry import (
+        NetboxRegistry,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_registry import NetboxRegistry
+    from netbox_utils import NetboxModule
+
+
+def query_param(name):
+    return {"name": name, "in": "query", "required": False, "type": "string"}
+
+
+@pytest.fixture
+def swagger_schema():
+    """Trimmed down document of Netbox < 3.0, paths are relative to /api"""
+    return {
+        "swagger": "2.0",
+        "basePath": "/api",
+        "paths": {
+            "/dcim/sites/": {
+                "get": {
+                    "parameters": [
+                        query_param("name"),
+                        query_param("slug"),
+                        query_param("q"),
+                        query_param("limit"),
+                    ]
+                },
+                "post": {"parameters": []},
+                "parameters": [],
+            },
+            "/dcim/sites/{id}/": {
+                "get": {"parameters": []},
+                "parameters": [{"name": "id", "in": "path"}],
+            },
+            "/plugins/rack-slots/": {
+                "get": {"parameters": [{"$ref": "#/parameters/rack"}]}
+            },
+            "/ipam/ip-addresses/": {
+                "get": {"parameters": [query_param("address"), query_param("vrf")]}
+            },
+        },
+    }
+
+
+@pytest.fixture
+def registry(swagger_schema):
+    return NetboxRegistry.from_schema(swagger_schema)
+
+
+@pytest.fixture
+def mock_netbox_module(registry):
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = False
+    module._verbosity = 0
+    module.params = {
+        "netbox_url": "http://netbox.local",
+        "netbox_token": "0123456789",
+        "state": "present",
+        "validate_certs": False,
+    }
+    netbox = NetboxModule(module, "devices", nb_client=True)
+    netbox.registry = registry
+    return netbox
+
+
+def test_from_schema_reads_list_views(registry):
+    assert registry.endpoints == {
+        "dcim": {"sites": ["limit", "name", "q", "slug"]},
+        "ipam": {"ip_addresses": ["address", "vrf"]},
+        "plugins": {"rack_slots": None},
+    }
+    assert registry.find_app("ip_addresses") == "ipam"
+    assert registry.find_app("rack_slots") == "plugins"
+    assert registry.find_app("cables") is None
+
+
+def test_from_schema_strips_api_prefix_of_openapi_3():
+    registry = NetboxRegistry.from_schema(
+        {
+            "openapi": "3.0.3",
+            "paths": {
+                "/api/dcim/sites/": {"get": {"parameters": [query_param("name")]}}
+            },
+        }
+    )
+    assert registry.get_filters("dcim", "sites") == frozenset(["name"])
+
+
+def test_invalid_query_params(registry):
+    assert (
+        registry.invalid_query_params(
+            "dcim", "sites", {"slug": "test", "brief": 1, "offset": 0}
+        )
+        == []
+    )
+    assert registry.invalid_query_params(
+        "dcim", "sites", {"slug": "test", "site": "test", "tenant": "test"}
+    ) == ["site", "tenant"]
+    # Nothing is validated when the filters of the endpoint are unknown
+    assert registry.invalid_query_params("plugins", "rack_slots", {"x": 1}) == []
+    assert registry.invalid_query_params("dcim", "cables", {"x": 1}) == []
+
+
+def test_registry_restored_from_its_endpoints(registry):
+    restored = NetboxRegistry(registry.endpoints)
+    assert restored.get_filters("dcim", "sites") == registry.get_filters(
+        "dcim", "sites"
+    )
+    assert restored.get_filters("plugins", "rack_slots") is None
+
+
+def test_load_registry_reads_schema_once_per_version(
+    mocker, mock_netbox_module, swagger_schema
+):
+    mock_netbox_module.version = 2.7
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock", timeout=3600)
+    mock_netbox_module.cache.get.return_value = None
+    fetch_schema = mocker.patch.object(mock_netbox_module, "_fetch_schema")
+    fetch_schema.return_value = swagger_schema
+
+    registry = mock_netbox_module._load_registry()
+    assert registry.find_app("sites") == "dcim"
+    key, version, endpoints = mock_netbox_module.cache.set.call_args[0]
+    assert (key, version) == ("registry", 2.7)
+
+    mock_netbox_module.cache.get.return_value = endpoints
+    assert mock_netbox_module._load_registry().endpoints == registry.endpoints
+    fetch_schema.assert_called_once()
+
+
+def test_load_registry_without_schema(mocker, mock_netbox_module):
+    mock_netbox_module.cache = mocker.Mock(name="cache_mock", timeout=3600)
+    mock_netbox_module.cache.get.return_value = None
+    mocker.patch.object(mock_netbox_module, "_fetch_schema").return_value = None
+
+    assert mock_netbox_module._load_registry() is None
+    mock_netbox_module.cache.get.return_value = {}
+    assert mock_netbox_module._load_registry() is None
+
+
+def test_nb_read_fails_before_sending_invalid_query_params(mocker, mock_netbox_module):
+    nb_endpoint = mocker.Mock(name="endpoint_mock")
+    nb_endpoint.name = "sites"
+    nb_endpoint.url = "http://netbox.local/api/dcim/sites"
+    nb_endpoint.filter.return_value = []
+
+    mock_netbox_module._nb_read(nb_endpoint, "get", {"slug": "test-site"})
+    nb_endpoint.get.assert_called_once_with(slug="test-site")
+
+    mock_netbox_module._nb_read(nb_endpoint, "filter", {"tenant": "test"})
+    mock_netbox_module.module.fail_json.assert_called_once_with(
+        msg="Netbox does not accept the tenant filters of dcim.sites", changed=False
+    )
+
+
+def test_find_app_falls_back_to_registry(mock_netbox_module):
+    assert mock_netbox_module._find_app("sites") == "dcim"
+    assert mock_netbox_module._find_app("rack_slots") == "plugins"
+
+    mock_netbox_module._find_app("cables")
+    mock_netbox_module.module.fail_json.assert_called_once_with(
+        msg="cables is not a known endpoint", changed=False
+    )
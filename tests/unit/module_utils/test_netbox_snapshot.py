@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+import subprocess
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_snapshot import (
+        NetboxSnapshotApi,
+        SNAPSHOT_FORMAT,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils import (
+        NetboxModule,
+    )
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_export import (
+        NetboxExportModule,
+    )
+
+    MOCKER_PATCH_PATH = "ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_utils"
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_snapshot import NetboxSnapshotApi, SNAPSHOT_FORMAT
+    from netbox_utils import NetboxModule
+    from netbox_export import NetboxExportModule
+
+    MOCKER_PATCH_PATH = "netbox_utils"
+
+
+def nested(object_id, **kwargs):
+    return dict(
+        {"id": object_id, "url": "http://netbox.local/api/x/%s/" % object_id}, **kwargs
+    )
+
+
+@pytest.fixture
+def snapshot():
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "netbox_url": "http://netbox.local/",
+        "version": "2.7",
+        "exported": 0,
+        "objects": {
+            "dcim": {
+                "sites": [
+                    {"id": 1, "name": "Test Site", "slug": "test-site"},
+                    {"id": 2, "name": "Other Site", "slug": "other-site"},
+                ],
+                "devices": [
+                    {
+                        "id": 10,
+                        "name": "Test Device1",
+                        "site": nested(1, name="Test Site", slug="test-site"),
+                        "status": {"value": 1, "label": "Active", "id": 1},
+                        "tags": ["first"],
+                        "custom_fields": {},
+                    }
+                ],
+            },
+            "ipam": {
+                "prefixes": [
+                    {"id": 20, "prefix": "10.0.0.0/30", "vrf": None},
+                    {"id": 21, "prefix": "10.0.1.0/24", "vrf": None},
+                    {"id": 22, "prefix": "10.0.1.0/25", "vrf": None},
+                ],
+                "ip_addresses": [
+                    {"id": 30, "address": "10.0.0.1/30", "vrf": None},
+                    {"id": 31, "address": "10.0.0.2/30", "vrf": nested(5)},
+                ],
+            },
+        },
+        "choices": {
+            "dcim": {"devices": {"status": [{"value": 1, "display_name": "Active"}]}}
+        },
+    }
+
+
+@pytest.fixture
+def snapshot_api(snapshot):
+    return NetboxSnapshotApi(snapshot)
+
+
+def test_filter_matches_nested_objects(snapshot_api):
+    devices = snapshot_api.dcim.devices
+    assert [d.id for d in devices.filter(name="Test Device1", site_id=1)] == [10]
+    assert [d.id for d in devices.filter(site="test-site")] == [10]
+    assert devices.filter(site_id=2) == []
+    assert [d.id for d in devices.filter(name=["Test Device1", "Missing"])] == [10]
+
+
+def test_get_serializes_like_netbox(snapshot_api):
+    device = snapshot_api.dcim.devices.get(name="Test Device1")
+    serialized = device.serialize()
+    assert serialized["site"] == 1
+    assert serialized["status"] == 1
+    assert device.site.id == 1
+    assert snapshot_api.dcim.sites.get(2).slug == "other-site"
+    assert snapshot_api.dcim.sites.get(slug="missing") is None
+
+
+def test_get_more_than_one_result_raises(snapshot_api):
+    with pytest.raises(ValueError):
+        snapshot_api.dcim.sites.get(q="site")
+
+
+def test_filter_ip_addresses(snapshot_api):
+    ip_addresses = snapshot_api.ipam.ip_addresses
+    assert [ip.id for ip in ip_addresses.filter(address="10.0.0.1/24")] == [30]
+    assert [ip.id for ip in ip_addresses.filter(parent="10.0.0.0/30")] == [30, 31]
+    assert [ip.id for ip in ip_addresses.filter(vrf_id=5)] == [31]
+
+
+def test_available_ips_and_prefixes(snapshot_api):
+    prefix = snapshot_api.ipam.prefixes.get(prefix="10.0.0.0/30")
+    assert prefix.available_ips.list() == [{"address": "10.0.0.2/30"}]
+
+    parent = snapshot_api.ipam.prefixes.get(21)
+    assert parent.available_prefixes.list() == [{"prefix": "10.0.1.128/25"}]
+
+
+def test_check_mode_reads_from_snapshot(mocker, tmp_path, snapshot):
+    path = tmp_path / "snapshot.json"
+    path.write_text(json.dumps(snapshot))
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = True
+    module.params = {
+        "netbox_url": "http://netbox.local/",
+        "netbox_token": "0123456789",
+        "data": {"name": "Test Device1", "site": "Test Site", "status": "Active"},
+        "state": "present",
+        "validate_certs": False,
+        "snapshot": str(path),
+    }
+    api = mocker.patch("pynetbox.api")
+
+    netbox = NetboxModule(module, "devices")
+    api.assert_not_called()
+    assert netbox.version == 2.7
+    assert netbox.data == {"name": "Test Device1", "site": 1, "status": "active"}
+
+
+CHECK_MODE_CODE = """
+import sys
+from unittest.mock import MagicMock
+sys.modules["pynetbox"] = None
+sys.path.append("plugins/module_utils")
+from netbox_dcim import NetboxDcimModule
+module = MagicMock(name="AnsibleModule")
+module.check_mode = True
+module.params = {
+    "netbox_url": "http://netbox.local/",
+    "netbox_token": "0123456789",
+    "data": {"name": "Test Device1", "site": "Test Site", "status": "Active"},
+    "state": "present",
+    "validate_certs": False,
+    "snapshot": sys.argv[1],
+}
+netbox = NetboxDcimModule(module, "devices")
+module.fail_json.assert_not_called()
+print(netbox.nb.dcim.devices.get(name="Test Device1").serialize()["site"])
+"""
+
+
+def test_check_mode_reads_from_snapshot_without_pynetbox(tmp_path, snapshot):
+    path = tmp_path / "snapshot.json"
+    path.write_text(json.dumps(snapshot))
+
+    output = subprocess.check_output([sys.executable, "-c", CHECK_MODE_CODE, str(path)])
+
+    assert output.strip() == b"1"
+
+
+def test_export_writes_snapshot(mocker, tmp_path, snapshot_api):
+    dest = tmp_path / "snapshot.json"
+    module = MagicMock(name="AnsibleModule")
+    module.check_mode = False
+    module._verbosity = 0
+    module.params = {
+        "netbox_url": "http://netbox.local/",
+        "netbox_token": "0123456789",
+        "dest": str(dest),
+        "endpoints": ["sites", "devices"],
+        "state": "present",
+        "validate_certs": False,
+    }
+    module.atomic_move.side_effect = lambda src, dest: __import__("os").rename(
+        src, dest
+    )
+    nb = mocker.Mock(name="nb_mock")
+    nb.dcim.sites.all.return_value = snapshot_api.dcim.sites.all()
+    nb.dcim.devices.all.return_value = snapshot_api.dcim.devices.all()
+    nb.dcim.sites.choices.return_value = {}
+    nb.dcim.devices.choices.return_value = {"status": []}
+
+    netbox = NetboxExportModule(module, nb_client=nb)
+    netbox.version = 2.7
+    netbox.run()
+
+    exported = NetboxSnapshotApi.load(str(dest))
+    assert exported.version == "2.7"
+    assert exported.dcim.devices.get(name="Test Device1").site.id == 1
+    assert exported.snapshot["choices"] == {"dcim": {"devices": {"status": []}}}
+    assert module.exit_json.call_args[1]["endpoints"] == {
+        "dcim.devices": 1,
+        "dcim.sites": 2,
+    }
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Netbox Ansible Collection contributors (@netbox-community)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+
+try:
+    from ansible_collections.netbox_community.ansible_modules.plugins.module_utils.netbox_transport import (
+        build_http_session,
+        build_connection_session,
+        NetboxHTTPAdapter,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append("plugins/module_utils")
+    from netbox_transport import (
+        build_http_session,
+        build_connection_session,
+        NetboxHTTPAdapter,
+    )
+
+
+@pytest.fixture
+def adapter():
+    session = build_http_session(timeout=5, retries=2, backoff_factor=1, pool_size=4)
+    return session.get_adapter("https://netbox.local/api/")
+
+
+def test_session_mounts_adapter_for_http_and_https():
+    session = build_http_session()
+    assert isinstance(session.get_adapter("http://netbox.local/"), NetboxHTTPAdapter)
+    assert isinstance(session.get_adapter("https://netbox.local/"), NetboxHTTPAdapter)
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_adapter_settings(adapter):
+    assert adapter.timeout == 5
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 1
+
+
+@pytest.mark.parametrize(
+    "method, status_code, expected",
+    [
+        ("GET", 503, True),
+        ("GET", 429, True),
+        ("GET", 404, False),
+        ("PATCH", 502, True),
+        ("DELETE", 500, True),
+        ("POST", 429, True),
+        ("POST", 502, False),
+    ],
+)
+def test_retry_methods_and_status_codes(adapter, method, status_code, expected):
+    assert adapter.max_retries.is_retry(method, status_code) is expected
+
+
+def test_adapter_applies_default_timeout(mocker, adapter):
+    send = mocker.patch("requests.adapters.HTTPAdapter.send")
+    adapter.send(mocker.Mock(name="request"))
+    assert send.call_args[1]["timeout"] == 5
+
+    adapter.send(mocker.Mock(name="request"), timeout=1)
+    assert send.call_args[1]["timeout"] == 1
+
+
+def test_connection_session_sends_through_connection(mocker):
+    connection = mocker.Mock(name="connection_mock")
+    connection.send_request.return_value = {
+        "status_code": 200,
+        "reason": "OK",
+        "headers": {"Content-Type": "application/json", "API-Version": "2.7"},
+        "text": '{"count": 1, "results": [{"id": 1}]}',
+    }
+    session = build_connection_session(connection)
+
+    response = session.get(
+        "http://netbox.local/api/dcim/sites/?slug=test",
+        headers={"Authorization": "Token 0123456789", "Accept": "application/json"},
+    )
+
+    assert response.json()["results"] == [{"id": 1}]
+    assert response.headers["api-version"] == "2.7"
+    body, kwargs = connection.send_request.call_args
+    assert body == (None,)
+    assert kwargs["path"] == "/api/dcim/sites/?slug=test"
+    assert kwargs["method"] == "GET"
+    assert "Authorization" not in kwargs["headers"]